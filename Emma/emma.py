@@ -160,6 +160,41 @@ def initParser():
         default=False,
         action="store_true",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        help="Number of worker processes used to process the configIds in parallel and of the threads used to write the reports concurrently.",
+        default=1,
+        type=int,
+    )
+    parser.add_argument(
+        "--columnar",
+        help="Use the columnar (NumPy) backend for the address arithmetic (memory region assignment and overlap detection). The results are the same as without it.",
+        default=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "--noCache",
+        "--no-cache",
+        help="Do not use the cache of the parsed mapfiles (stored in the " + MAPFILE_CACHE_DIR + " folder next to the " + OUTPUT_DIR + " folder)",
+        default=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "--incremental",
+        help="Store the state of the processing of every configId in the cache and process only the parts that are affected by the mapfiles that changed since the previous run. "
+             "The results are the same as without it.",
+        default=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "--format",
+        help="File format of the standard reports (" + FILE_IDENTIFIER_SECTION_SUMMARY + ", " + FILE_IDENTIFIER_OBJECT_SUMMARY + ", " + FILE_IDENTIFIER_OBJECTS_IN_SECTIONS + "). "
+             "The " + REPORT_FORMAT_PARQUET + " and " + REPORT_FORMAT_FEATHER + " formats store typed columns and need the pyarrow package.",
+        default=REPORT_FORMAT_CSV,
+        choices=REPORT_FORMATS,
+        dest="reportFormat",
+    )
     parser.add_argument(
         "--dryRun",
         help="Do not store any standard reports",
@@ -207,6 +242,11 @@ def processArguments(arguments):
         arguments.memVis = True
 
     outputPath = Emma.shared_libs.emma_helper.joinPath(directory, subDir, OUTPUT_DIR)
+    cachePath = Emma.shared_libs.emma_helper.joinPath(directory, subDir, MAPFILE_CACHE_DIR) if not arguments.noCache else None
+    if arguments.incremental and arguments.noCache:
+        sc().warning("Incompatible arguments `--noCache` and `--incremental` were found. The configIds will be processed completely.")
+        arguments.incremental = False
+    incremental = arguments.incremental
     analyseDebug = arguments.analyseDebug
     createCategories = arguments.createCategories
     removeUnmatched = arguments.removeUnmatched
@@ -216,10 +256,15 @@ def processArguments(arguments):
     dryRun = arguments.dryRun
     memVis = arguments.memVis
     memVisResolved = arguments.memVisResolved
+    if arguments.jobs < 1:
+        sc().error("The number of jobs (`--jobs`) must be at least 1!")
+    jobs = arguments.jobs
+    columnar = arguments.columnar
+    reportFormat = arguments.reportFormat
 
     # TODO: It would be more convenient if arguments which are not modified are passed without manually modifying the code (MSc)
 
-    return projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, noResolveOverlap, teamscale, dryRun, memVis, memVisResolved
+    return projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, noResolveOverlap, teamscale, dryRun, memVis, memVisResolved, jobs, columnar, cachePath, incremental, reportFormat
 
 
 def runEmma():
@@ -34,14 +34,14 @@ class Delta:
         self.__inFilePaths: typing.List[str] = files
         self.__outFilePath: str = outfile
 
-        self.__lhs: pandas.DataFrame = pandas.read_csv(self.__inFilePaths[0], index_col=3, sep=";")
-        self.__rhs: pandas.DataFrame = pandas.read_csv(self.__inFilePaths[1], index_col=3, sep=";")
+        self.__lhs: pandas.DataFrame = Emma.shared_libs.emma_helper.readReport(self.__inFilePaths[0])
+        self.__rhs: pandas.DataFrame = Emma.shared_libs.emma_helper.readReport(self.__inFilePaths[1])
 
         self.__delta: pandas.DataFrame = self.__buildDelta()
 
     def __buildDelta(self) -> pandas.DataFrame:
-        namelhs = os.path.split(self.__inFilePaths[0])[-1].replace(".csv", "").replace(FILE_IDENTIFIER_SECTION_SUMMARY, "")
-        namerhs = os.path.split(self.__inFilePaths[1])[-1].replace(".csv", "").replace(FILE_IDENTIFIER_SECTION_SUMMARY, "")
+        namelhs = os.path.splitext(os.path.split(self.__inFilePaths[0])[-1])[0].replace(FILE_IDENTIFIER_SECTION_SUMMARY, "")
+        namerhs = os.path.splitext(os.path.split(self.__inFilePaths[1])[-1])[0].replace(FILE_IDENTIFIER_SECTION_SUMMARY, "")
 
         LHS_SUFFIX = "_" + namelhs
         RHS_SUFFIX = "_" + namerhs
@@ -27,12 +27,22 @@ from pypiscout.SCout_Logger import Logger as sc
 import Emma
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
-import Emma.emma_delta_libs.Delta
 import Emma.emma_delta_libs.FilePresenter
 import Emma.emma_delta_libs.FileSelector
 import Emma.emma_delta_libs.RootSelector
 
 
+def importDeltaLibrary():
+    """
+    Imports the Delta module. It imports pandas, which takes long to import,
+    so it is imported only once the files to compare were selected and not when only the arguments are parsed (e.g. `--help`).
+    :return: None
+    """
+    # pylint: disable=import-outside-toplevel, redefined-outer-name
+    # Rationale: The import is deferred on purpose, the imported module is accessed through the Emma package afterwards.
+    import Emma.emma_delta_libs.Delta
+
+
 def initParser():
     """
     Prepare the parser for Emma
@@ -137,6 +147,7 @@ def main(arguments):
     else:
         sc().error("No matching arguments.")
 
+    importDeltaLibrary()
     delta = Emma.emma_delta_libs.Delta.Delta(files=candidates, outfile=arguments.outfile + 'analysed.csv')
     delta.tocsv()
     sc().info("Saved delta to " + arguments.outfile)
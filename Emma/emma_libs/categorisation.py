@@ -28,6 +28,54 @@ import Emma.shared_libs.emma_helper
 import Emma.emma_libs.memoryEntry
 
 
+class KeywordMatcher:
+    # pylint: disable=too-few-public-methods
+    # Rationale: This class´s only purpose is to store the compiled keywords of a categoriesKeywords file.
+
+    """
+    Class that finds the categories of names based on the content of a categoriesKeywords file.
+    The keywords are compiled once: the ones without regex special characters are searched as plain substrings,
+    behind a single alternation pattern that rejects the names that do not contain any of them,
+    the others are searched as precompiled regex patterns. The results are stored per name.
+    """
+    def __init__(self, categoriesKeywords):
+        # The (category, keyword, compiledPattern) tuples in the order of the categoriesKeywords file, compiledPattern is None for the plain keywords
+        self.keywords = []
+        plainKeywords = []
+        for category in categoriesKeywords:
+            for keyword in categoriesKeywords[category]:
+                if re.escape(keyword) == keyword:
+                    self.keywords.append((category, keyword, None))
+                    plainKeywords.append(keyword)
+                else:
+                    # The pattern \w*keyword\w* matches exactly when the keyword itself matches, since the \w* parts can match empty strings
+                    self.keywords.append((category, keyword, re.compile(r"""\w*""" + keyword + r"""\w*""")))
+        self.plainKeywordsPattern = re.compile("|".join(plainKeywords)) if plainKeywords else None
+        self.matchingCategories = {}
+
+    def findCategories(self, nameString):
+        """
+        Function to find the categories of a name.
+        :param nameString: The name string that categories needs to be found for.
+        :return: Tuple of the categories of all the keywords matching the nameString, in the order of the categoriesKeywords file.
+                 A category is listed once for every matching keyword of it.
+        """
+        result = self.matchingCategories.get(nameString)
+        if result is None:
+            # If none of the plain keywords is in the nameString then they do not need to be checked one by one
+            plainKeywordFound = self.plainKeywordsPattern is not None and self.plainKeywordsPattern.search(nameString) is not None
+            categoriesFound = []
+            for category, keyword, compiledPattern in self.keywords:
+                if compiledPattern is None:
+                    if plainKeywordFound and keyword in nameString:
+                        categoriesFound.append(category)
+                elif compiledPattern.search(nameString) is not None:
+                    categoriesFound.append(category)
+            result = tuple(categoriesFound)
+            self.matchingCategories[nameString] = result
+        return result
+
+
 class Categorisation:
     # pylint: disable=too-many-instance-attributes
     # Rationale: The class needs to store the paths for the categorisation files, this leads to the amount of class members.
@@ -54,6 +102,12 @@ class Categorisation:
         self.categoriesObjectsKeywords = Categorisation.__readCategoriesJson(self.categoriesObjectsKeywordsPath)
         self.categoriesSectionsKeywords = Categorisation.__readCategoriesJson(self.categoriesSectionsKeywordsPath)
         self.createCategories = createCategories
+        # Inverted indexes of the categories files, these need to be re-created every time the categories files are changed
+        self.categoriesObjectsIndex = Categorisation.__createCategoriesIndex(self.categoriesObjects)
+        self.categoriesSectionsIndex = Categorisation.__createCategoriesIndex(self.categoriesSections)
+        # Compiled matchers of the categoriesKeywords files
+        self.categoriesObjectsKeywordsMatcher = KeywordMatcher(self.categoriesObjectsKeywords)
+        self.categoriesSectionsKeywordsMatcher = KeywordMatcher(self.categoriesSectionsKeywords)
 
     def fillOutCategories(self, sectionCollection, objectCollection):
         """
@@ -98,6 +152,20 @@ class Categorisation:
 
         return categoriesJson
 
+    @staticmethod
+    def __createCategoriesIndex(categories):
+        """
+        Function to create an inverted index of a categories file, so the categories of an element can be looked up by its name.
+        :param categories: Content of the categories file.
+        :return: Dictionary with the element names as keys and the comma separated string of their sorted categories as values.
+        """
+        categoriesOfTheNames = {}
+        for category in categories:
+            for categoryElementName in categories[category]:
+                categoriesOfTheNames.setdefault(categoryElementName, []).append(category)
+        # The categories strings are created only once here, the elements with the same name will share them
+        return {name: ", ".join(sorted(categoriesFoundForTheName)) for name, categoriesFoundForTheName in categoriesOfTheNames.items()}
+
     def __fillOutSectionCategories(self, sectionCollection):
         """
         Function to fill out the categories in a section collection.
@@ -107,7 +175,7 @@ class Categorisation:
         # Filling out sections
         for consumer in sectionCollection:
             consumerName = consumer.sectionName
-            consumer.category = self.__evalCategoryOfAnElement(consumerName, self.categoriesSections, self.categoriesSectionsKeywords, self.keywordCategorisedSections)
+            consumer.category = self.__evalCategoryOfAnElement(consumerName, self.categoriesSectionsIndex, self.categoriesSectionsKeywordsMatcher, self.keywordCategorisedSections)
 
     def __fillOutObjectCategories(self, objectCollection):
         """
@@ -118,7 +186,7 @@ class Categorisation:
         # Filling out objects
         for consumer in objectCollection:
             consumerName = consumer.objectName
-            consumer.category = self.__evalCategoryOfAnElement(consumerName, self.categoriesObjects, self.categoriesObjectsKeywords, self.keywordCategorisedObjects)
+            consumer.category = self.__evalCategoryOfAnElement(consumerName, self.categoriesObjectsIndex, self.categoriesObjectsKeywordsMatcher, self.keywordCategorisedObjects)
 
     def __manageSectionCategoriesFiles(self, updateCategoriesFromKeywordMatches, removeUnmatchedCategories, sectionCollection):
         """
@@ -143,6 +211,7 @@ class Categorisation:
             # If an update is allowed
             if text == "y":
                 Categorisation.__updateCategoriesJson(self.categoriesSections, self.keywordCategorisedSections, self.categoriesSectionsPath)
+                self.categoriesSectionsIndex = Categorisation.__createCategoriesIndex(self.categoriesSections)
                 # Re-categorize sections if the categorisation file have been changed
                 self.__fillOutSectionCategories(sectionCollection)
                 sc().info("The " + self.categoriesSectionsPath + " was updated.")
@@ -158,6 +227,7 @@ class Categorisation:
             if text == "y":
                 sc().info("Remove unmatched modules from " + CATEGORIES_SECTIONS_JSON + "?\nIt will be overwritten.\n `y` to accept, any other key to discard.")
                 Categorisation.__removeUnmatchedFromCategoriesJson(self.categoriesSections, sectionCollection, Emma.emma_libs.memoryEntry.SectionEntry, self.categoriesSectionsPath)
+                self.categoriesSectionsIndex = Categorisation.__createCategoriesIndex(self.categoriesSections)
             else:
                 sc().info(text + " was entered, aborting the removal. The " + self.categoriesSectionsPath + " was not changed.")
 
@@ -183,6 +253,7 @@ class Categorisation:
             # If an update is allowed
             if text == "y":
                 Categorisation.__updateCategoriesJson(self.categoriesObjects, self.keywordCategorisedObjects, self.categoriesObjectsPath)
+                self.categoriesObjectsIndex = Categorisation.__createCategoriesIndex(self.categoriesObjects)
                 sc().info("The " + self.categoriesObjectsPath + " was updated.")
                 # Re-categorize objects if the categorisation file have been changed
                 self.__fillOutObjectCategories(objectCollection)
@@ -198,23 +269,24 @@ class Categorisation:
             if text == "y":
                 sc().info("Remove unmatched modules from " + CATEGORIES_OBJECTS_JSON + "?\nIt will be overwritten.\n `y` to accept, any other key to discard.")
                 Categorisation.__removeUnmatchedFromCategoriesJson(self.categoriesObjects, objectCollection, Emma.emma_libs.memoryEntry.ObjectEntry, self.categoriesObjectsPath)
+                self.categoriesObjectsIndex = Categorisation.__createCategoriesIndex(self.categoriesObjects)
             else:
                 sc().info(text + " was entered, aborting the removal. The " + self.categoriesObjectsPath + " was not changed.")
 
-    def __evalCategoryOfAnElement(self, nameString, categories, categoriesKeywords=None, keywordCategorisedElements=None):
+    def __evalCategoryOfAnElement(self, nameString, categoriesIndex, keywordMatcher=None, keywordCategorisedElements=None):
         """
         Function to find the category of an element. The categorisation will be tried with the categories file.
         If this fails a default value will be set for the category and a weak warning will be shown.
         :param nameString: The name string of the element that needs to be categorised.
-        :param categories: Content of the categories file.
-        :param categoriesKeywords: Content of the categoriesKeywords file.
+        :param categoriesIndex: Inverted index of the categories file, created by __createCategoriesIndex().
+        :param keywordMatcher: KeywordMatcher object of the categoriesKeywords file.
         :param keywordCategorisedElements: List of elements that were categorised by keywords.
         :return: Category string
         """
-        foundCategory = Categorisation.__searchCategoriesJson(nameString, categories)
+        foundCategory = Categorisation.__searchCategoriesJson(nameString, categoriesIndex)
         if foundCategory is None and self.createCategories:
             # If there is no match check for keyword specified in categoriesKeywordsJson if createCategories is active
-            foundCategory = Categorisation.__categoriseByKeyword(nameString, categoriesKeywords,
+            foundCategory = Categorisation.__categoriseByKeyword(nameString, keywordMatcher,
                                                                  keywordCategorisedElements)
         if foundCategory is None:
             # If there is still no match then we will assign the default constant
@@ -222,55 +294,38 @@ class Categorisation:
         return foundCategory
 
     @staticmethod
-    def __searchCategoriesJson(nameString, categories):
+    def __searchCategoriesJson(nameString, categoriesIndex):
         """
         Function to search categories for a name in a categories file.
         :param nameString: String that categories needs to be searched for.
-        :param categories: File the categories needs to be searched in.
+        :param categoriesIndex: Inverted index of the categories file the categories needs to be searched in, created by __createCategoriesIndex().
         :return: String that contains the categories comma separated that were found for the nameString, else None.
         """
         result = None
 
-        # Did we get a file?
-        if categories is not None:
-            categoriesFoundForTheName = []
-            # Iterating trough the categories
-            for category in categories:
-                # Look through elements that shall be ordered to this category
-                for categoryElementName in categories[category]:
-                    # If the element name matches the nameString then we will add this category as found
-                    if nameString == categoryElementName:
-                        categoriesFoundForTheName.append(category)
-            # If we have found categories then we will sort them and return them comma separated
-            if categoriesFoundForTheName:
-                categoriesFoundForTheName.sort()
-                result = ", ".join(categoriesFoundForTheName)
+        # Did we get an index?
+        if categoriesIndex is not None:
+            result = categoriesIndex.get(nameString)
         return result
 
     @staticmethod
-    def __categoriseByKeyword(nameString, categoriesKeywords, keywordCategorisedElements):
+    def __categoriseByKeyword(nameString, keywordMatcher, keywordCategorisedElements):
         """
         Function to search a category for a name in a categoriesKeywords file.
         :param nameString: String that categories needs to be searched for.
-        :param categoriesKeywords: File the categories needs to be searched in.
+        :param keywordMatcher: KeywordMatcher object of the file the categories needs to be searched in.
         :param keywordCategorisedElements: List of pairs that contains elements that were categorised by keywords as (name, category).
-        :return: String that contains the category that was found for the nameString, else None.
+        :return: String that contains the category that was found for the nameString (the one of the last matching keyword), else None.
         """
         result = None
 
         # If a categoriesKeywords file was received
-        if categoriesKeywords is not None:
-            # For all the categories
-            for category in categoriesKeywords:
-                # For all the keywords belonging to this category
-                for keyword in categoriesKeywords[category]:
-                    # Creating a regex pattern from the keyword
-                    pattern = r"""\w*""" + keyword + r"""\w*"""
-                    # Finding the first occurrence of the pattern in the nameString
-                    if re.search(pattern, nameString) is not None:
-                        # Adding the element to the list of elements that were keyword categorised as a pair of (name, category)
-                        keywordCategorisedElements.append((nameString, category))
-                        result = category
+        if keywordMatcher is not None:
+            # For all the categories of the matching keywords
+            for category in keywordMatcher.findCategories(nameString):
+                # Adding the element to the list of elements that were keyword categorised as a pair of (name, category)
+                keywordCategorisedElements.append((nameString, category))
+                result = category
         return result
 
     @staticmethod
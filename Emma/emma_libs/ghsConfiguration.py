@@ -180,9 +180,8 @@ class GhsConfiguration(Emma.emma_libs.specificConfiguration.SpecificConfiguratio
             Function to Load monolith file.
             :param configuration: Configuration to which the monoliths need to be added.
             :param noprompt: True if no user prompts shall be made, False otherwise, in which case a program exit will be made.
-            :return: Content of the monolith file if it could be read, else None.
+            :return: Generator yielding the lines of the monolith file.
             """
-            result = None
             mapfileIndexChosen = 0  # Take the first monolith file in list (default case)
             numMonolithFiles = len(configuration["patterns"]["monoliths"])
             keyMonolithMapping = {}
@@ -212,26 +211,21 @@ class GhsConfiguration(Emma.emma_libs.specificConfiguration.SpecificConfiguratio
             # Finally load the file
             configuration["monolithLoaded"] = True
             monolithFilepath = keyMonolithMapping[str(mapfileIndexChosen)]
-            try:
-                with open(monolithFilepath, "r") as fp:
-                    result = fp.readlines()
-            except FileNotFoundError:
-                sc().error(f"The monolith file `{os.path.abspath(monolithFilepath)}` was not found!")
-
-            return result
+            # The content is read line by line during the tabularisation, so the file is never loaded completely into memory
+            return Emma.shared_libs.emma_helper.readLines(monolithFilepath, "monolith file")
 
         def tabulariseAndSortMonolithContent(monolithContent):
             """
             Parses the monolith file and returns a "table" (addresses are int's) of the following structure:
             table[n-th_entry][0] = virtual(int), ...[1] = physical(int), ...[2] = offset(int), ...[3] = size(int), ...[4] = section(str)
             Offset = physical - virtual
-            :param monolithContent: Content from monolith as text (all lines)
+            :param monolithContent: Content from monolith as text (iterable of lines)
             :return: list of lists
             """
             table = []  # "headers": virtual, physical, size, section
             monolithPattern = Emma.emma_libs.ghsMapfileRegexes.UpperMonolithPattern()
             for line in monolithContent:
-                match = re.search(Emma.emma_libs.ghsMapfileRegexes.UpperMonolithPattern().pattern, line)
+                match = re.search(monolithPattern.pattern, line)
                 if match:
                     table.append([
                         int(match.group(monolithPattern.Groups.virtualAdress), 16),
@@ -285,13 +279,8 @@ class GhsConfiguration(Emma.emma_libs.specificConfiguration.SpecificConfiguratio
         # In case there was no monolith loaded -> the configuration does not need it, so the check is passed
         if configuration["monolithLoaded"]:
             for entry in configuration["patterns"]["monoliths"]:
-                try:
-                    monolithFilepath = configuration["patterns"]["monoliths"][entry]["associatedFilename"]
-                    with open(monolithFilepath, "r") as monolithFile:
-                        monolithContent = monolithFile.readlines()
-                except FileNotFoundError:
-                    sc().error(f"The file `{os.path.abspath(monolithFilepath)}` was not found!")
-                for line in monolithContent:
+                monolithFilepath = configuration["patterns"]["monoliths"][entry]["associatedFilename"]
+                for line in Emma.shared_libs.emma_helper.readLines(monolithFilepath, "monolith file"):
                     lineComponents = re.search(monolithPattern.pattern, line)
                     if lineComponents:  # if match
                         foundInMonolith.append(lineComponents.group(monolithPattern.Groups.section))
@@ -21,6 +21,7 @@ import os
 import re
 import bisect
 import collections
+import concurrent.futures
 
 from pypiscout.SCout_Logger import Logger as sc
 
@@ -29,6 +30,7 @@ import Emma.shared_libs.emma_helper
 import Emma.emma_libs.mapfileProcessor
 import Emma.emma_libs.ghsMapfileRegexes
 import Emma.emma_libs.memoryEntry
+import Emma.emma_libs.mapfileCache
 
 
 class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
@@ -38,33 +40,43 @@ class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
     def __init__(self):
         self.analyseDebug = None
 
-    def processMapfiles(self, configId, configuration, analyseDebug):
+    def processMapfiles(self, configId, configuration, analyseDebug, jobs=1, columnar=False, cachePath=None, mapfileHashes=None):
+        # pylint: disable=too-many-arguments
+        # Rationale: The settings of the mapfile processing are passed one by one, so the subclasses do not depend on the MemoryManager.
         """
         Function to process mapfiles.
         :param configId: ConfigId the configuration belongs to.
         :param configuration: The configuration that contains the information about the mapfiles that needs to be processed.
         :param analyseDebug: True if the debug sections and objects need to be analysed as well, False otherwise.
+        :param jobs: Number of worker processes that may be used to process the mapfiles in parallel.
+        :param columnar: True if the columnar (NumPy) backend shall be used for the address arithmetic, False otherwise.
+        :param cachePath: Path of the directory where the parsed mapfiles are cached, None if the cache shall not be used.
+        :param mapfileHashes: Dict of the hashes of the mapfiles by their paths (see MapfileCache.hashFile()), None if they shall be calculated for the cache keys.
         :return: A tuple of two lists containing MemEntry objects representing the sections and objects that were extracted from the mapfiles.
         """
         self.analyseDebug = analyseDebug
 
-        sectionCollection = self.__importData(configId, configuration, Emma.emma_libs.ghsMapfileRegexes.ImageSummaryPattern())
-        objectCollection = self.__importData(configId, configuration, Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern())
+        sectionCollection, objectCollection = self.__importData(configId, configuration, jobs, columnar, cachePath, mapfileHashes)
 
         return sectionCollection, objectCollection
 
-    def __importData(self, configId, configuration, defaultRegexPattern):
-        # pylint: disable=too-many-locals
+    def __importData(self, configId, configuration, jobs, columnar, cachePath, mapfileHashes):
+        # pylint: disable=too-many-locals, too-many-arguments, too-many-branches, too-many-statements
         # Rationale: This is legacy code, it will not be changed.
 
         """
         Function to import data from the mapfiles.
+        Every mapfile is scanned once for both the image summary (sections) and the module summary (objects).
         :param configId: A configId to which the configuration belongs to.
         :param configuration: A configuration that contains the information about the mapfiles.
-        :param defaultRegexPattern: The default regex pattern that shall be used for the data extraction.
-        :return: A list of MemEntry objects made from the data created.
+        :param jobs: Number of worker processes that may be used to parse the mapfiles in parallel.
+        :param columnar: True if the memory regions shall be found with the columnar (NumPy) backend, False otherwise.
+        :param cachePath: Path of the directory where the parsed mapfiles are cached, None if the cache shall not be used.
+        :param mapfileHashes: Dict of the hashes of the mapfiles by their paths (see MapfileCache.hashFile()), None if they shall be calculated for the cache keys.
+        :return: A tuple of two lists of MemEntry objects representing the sections and the objects.
         """
-        result = []
+        sectionCollection = []
+        objectCollection = []
         memoryRegionsToExcludeFromMapfiles = {}
 
         # Reading the hexadecimal offset value from the addressSpaces*.json. This value is optional, in case it is not defined, we will assume that it is 0.
@@ -72,18 +84,18 @@ class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
         # Defining a list of sections that will be excluded (including the objects residing in it) from the analysis based on the value that was loaded from the arguments
         listOfExcludedSections = [] if self.analyseDebug else DWARF_SECTIONS.union(GLOBAL_SECTIONS_TO_EXCLUDE)
 
-        # Importing every mapfile that was found
+        # Collecting the arguments of the parsing for every mapfile that was found
+        # The index of the virtual sections is created only once per VAS
+        virtualSectionIndexes = {}
+        mapfileNames = []
+        vasNames = []
+        parseMapfileArguments = []
         for mapfile in configuration["patterns"]["mapfiles"]:
-            # Opening the mapfile and reading in its content
             mapfilePath = configuration["patterns"]["mapfiles"][mapfile]["associatedFilename"]
-            try:
-                with open(mapfilePath, "r") as mapfileFileObject:
-                    mapfileContent = mapfileFileObject.readlines()
-            except FileNotFoundError:
-                sc().error(f"The map file `{os.path.abspath(mapfilePath)}` was not found!")
 
             # Storing the name of the mapfile
-            mapfileName = os.path.split(configuration["patterns"]["mapfiles"][mapfile]["associatedFilename"])[-1]
+            mapfileName = os.path.split(mapfilePath)[-1]
+            mapfileNames.append(mapfileName)
 
             # Storing the list of ignored memory areas to this mapfile
             # This will be a necessary parameter for the MapfileProcessor::fillOutMemoryRegionsAndMemoryTypes()
@@ -91,38 +103,149 @@ class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
                 memoryRegionsToExcludeFromMapfiles[mapfileName] = configuration["patterns"]["mapfiles"][mapfile][MEM_REGION_TO_EXCLUDE]
 
             # If there is a VAS defined for the mapfile, then the addresses found in it are virtual addresses, otherwise they are physical addresses
-            mapfileContainsVirtualAddresses = ("VAS" in configuration["patterns"]["mapfiles"][mapfile])
-            # Loading the regex pattern that will be used for this mapfile
-            regexPatternData = self.__getRegexPattern(defaultRegexPattern, configuration["patterns"]["mapfiles"][mapfile])
+            vasName = None
+            virtualSectionIndex = None
+            if "VAS" in configuration["patterns"]["mapfiles"][mapfile]:
+                # Name of the Virtual address space to which the elements of this mapfile belongs
+                vasName = configuration["patterns"]["mapfiles"][mapfile]["VAS"]
+                if vasName not in virtualSectionIndexes:
+                    # List of the virtual sections that were belong to this mapfile. The address translation is done with the help of these sections.
+                    if not vasName in configuration["virtualSections"]:
+                        sc().error(f"VAS name `{vasName}` stated in patterns configuration but not found in virtualSections.")
+                    # The part of the monolith file that contains the address translation data is indexed for the virtual sections of the VAS
+                    virtualSectionIndexes[vasName] = self.__createVirtualSectionIndex(configuration["virtualSections"][vasName], configuration["sortMonolithTabularised"])
+                virtualSectionIndex = virtualSectionIndexes[vasName]
+            vasNames.append(vasName)
+
+            # Loading the regex patterns that will be used for this mapfile
+            sectionPattern = self.__getRegexPattern(Emma.emma_libs.ghsMapfileRegexes.ImageSummaryPattern(), configuration["patterns"]["mapfiles"][mapfile])
+            objectPattern = self.__getRegexPattern(Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern(), configuration["patterns"]["mapfiles"][mapfile])
+
+            parseMapfileArguments.append((configId, mapfilePath, sectionPattern, objectPattern, listOfExcludedSections, offset, virtualSectionIndex))
+
+        # Loading the mapfiles that were already parsed with the same settings from the cache
+        # The results are (loggedMessages, parsedMapfile) pairs, the messages are shown again when a mapfile was loaded from the cache
+        mapfileCache = None
+        cacheKeys = [None] * len(parseMapfileArguments)
+        results = [None] * len(parseMapfileArguments)
+        if cachePath is not None:
+            mapfileCache = Emma.emma_libs.mapfileCache.MapfileCache(cachePath)
+            for index, arguments in enumerate(parseMapfileArguments):
+                cacheKeys[index] = GhsMapfileProcessor.__createCacheKey(*arguments, mapfileHashes=mapfileHashes)
+                if cacheKeys[index] is not None:
+                    results[index] = mapfileCache.load(cacheKeys[index])
+                if results[index] is not None:
+                    sc().debug(f"The parsed content of {arguments[1]} was loaded from the cache.")
+        indicesToParse = [index for index, result in enumerate(results) if result is None]
+
+        # Parsing the mapfiles, in worker processes if more than one job is allowed
+        # The messages are shown in the order of the mapfiles, so the log output and the order of the elements do not depend on which worker finished first
+        jobs = min(jobs, len(indicesToParse))
+        if jobs > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [executor.submit(Emma.shared_libs.emma_helper.callWithRecordedLogging, GhsMapfileProcessor.parseMapfile, *parseMapfileArguments[index]) for index in indicesToParse]
+                for index, future in zip(indicesToParse, futures):
+                    results[index] = future.result()
+            for loggedMessages, _ in results:
+                Emma.shared_libs.emma_helper.replayLogging(loggedMessages)
+        else:
+            for index, arguments in enumerate(parseMapfileArguments):
+                if results[index] is not None:
+                    Emma.shared_libs.emma_helper.replayLogging(results[index][0])
+                elif mapfileCache is not None:
+                    # The messages are printed immediately but they are recorded as well, so they can be stored in the cache
+                    results[index] = Emma.shared_libs.emma_helper.callWithRecordedLogging(GhsMapfileProcessor.parseMapfile, *arguments, forwardMessages=True)
+                else:
+                    results[index] = ([], GhsMapfileProcessor.parseMapfile(*arguments))
+
+        parsedMapfiles = []
+        for index, (loggedMessages, parsedMapfile) in enumerate(results):
+            # The parsed mapfile is None if the parsing was stopped by an error, these are not stored in the cache
+            if parsedMapfile is None:
+                parsedMapfile = ([], [])
+            elif cacheKeys[index] is not None and index in indicesToParse:
+                mapfileCache.store(cacheKeys[index], (loggedMessages, parsedMapfile))
+            parsedMapfiles.append(parsedMapfile)
+
+        # Creating MemEntry objects from the entries that were found in the mapfiles
+        # The compiler specific data is not changed after the creation of the MemEntry objects, so the entries with the same data share it
+        compilerSpecificDataCache = {}
+        for mapfileName, vasName, (sectionEntries, objectEntries) in zip(mapfileNames, vasNames, parsedMapfiles):
+            for collection, entries in ((sectionCollection, sectionEntries), (objectCollection, objectEntries)):
+                for physicalAddress, addressLength, sectionName, objectName, vasSectionName in entries:
+                    compilerSpecificData = compilerSpecificDataCache.get((vasName, vasSectionName))
+                    if compilerSpecificData is None:
+                        # Creating the compiler specific data that we will store in the memEntry
+                        # This will be a collections.OrderedDict as the MemEntry requires it
+                        compilerSpecificData = collections.OrderedDict()
+                        compilerSpecificData["DMA"] = (vasName is None)
+                        compilerSpecificData["vasName"] = vasName
+                        compilerSpecificData["vasSectionName"] = vasSectionName
+                        compilerSpecificDataCache[(vasName, vasSectionName)] = compilerSpecificData
+
+                    # Creating a MemEntry object from the data that we got from the mapfile
+                    collection.append(Emma.emma_libs.memoryEntry.MemEntry(configID=configId,
+                                                                          mapfileName=mapfileName,
+                                                                          addressStart=physicalAddress,
+                                                                          addressLength=addressLength,
+                                                                          sectionName=sectionName,
+                                                                          objectName=objectName,
+                                                                          compilerSpecificData=compilerSpecificData))
+
+        for collection in (sectionCollection, objectCollection):
+            # Sorting the collection based on the addressStart of the elements
+            # The sort is stable, so elements with the same addressStart keep the order in which they were found in the mapfiles
+            collection.sort(key=lambda memEntry: memEntry.addressStart)
+
+            # Filling out the memory regions and memory types and ignoring the entries that did not have a match
+            super().fillOutMemoryRegionsAndMemoryTypes(collection, configuration, True, memoryRegionsToExcludeFromMapfiles, columnar)
+
+        return sectionCollection, objectCollection
 
-            # Analysing the mapfile with the loaded regex line-by-line
-            lineNumber = 0
-            for line in mapfileContent:
-                lineNumber += 1
+    @staticmethod
+    def parseMapfile(configId, mapfilePath, sectionPattern, objectPattern, listOfExcludedSections, offset, virtualSectionIndex):
+        # pylint: disable=too-many-arguments, too-many-locals
+        # Rationale: This function is executed in worker processes as well, so it receives everything it needs as arguments.
 
-                # Extracting the components from the line with the regex, if there was no match, we will continue with the next line
+        """
+        Function to extract the sections and objects from a mapfile. The mapfile is read line by line and scanned only once.
+        :param configId: The configId the mapfile belongs to.
+        :param mapfilePath: Path of the mapfile.
+        :param sectionPattern: The regex pattern (ImageSummaryPattern) that is used to find the sections.
+        :param objectPattern: The regex pattern (ModuleSummaryPattern) that is used to find the objects.
+        :param listOfExcludedSections: Sections that will be excluded (including the objects residing in them).
+        :param offset: The offset that will be subtracted from the physical addresses.
+        :param virtualSectionIndex: Index of the virtual sections of the VAS the mapfile belongs to (see __createVirtualSectionIndex()), None if the mapfile contains physical addresses.
+        :return: A tuple of two lists with the entries of the sections and the objects in the order they were found in the mapfile.
+                 Every entry is a tuple of (physicalAddress, addressLength, sectionName, objectName, vasSectionName).
+        """
+        sectionEntries = []
+        objectEntries = []
+        mapfileName = os.path.split(mapfilePath)[-1]
+        mapfileContainsVirtualAddresses = virtualSectionIndex is not None
+
+        # Analysing the mapfile with the loaded regexes line-by-line
+        lineNumber = 0
+        for line in Emma.shared_libs.emma_helper.readLines(mapfilePath, "map file"):
+            lineNumber += 1
+
+            for regexPatternData, entries in ((sectionPattern, sectionEntries), (objectPattern, objectEntries)):
+                # Sorting out the lines that can not match the pattern based on their shape, this is much cheaper than the regex search
+                if not regexPatternData.isCandidateLine(line):
+                    continue
+                # Extracting the components from the line with the regex, if there was no match, we will continue with the next pattern
                 lineComponents = re.search(regexPatternData.pattern, line)
                 if lineComponents:
-                    # If the section name of this element is in the list that we want to exclude then we can continue with the next line
+                    # If the section name of this element is in the list that we want to exclude then we can continue with the next pattern
                     if lineComponents.group(regexPatternData.Groups.section).rstrip() in listOfExcludedSections:
                         continue
                     # If this mapfile contains virtual addresses then we need to translate the address of this element
-                    vasName = None
                     vasSectionName = None
                     if mapfileContainsVirtualAddresses:
-                        # Name of the Virtual address space to which the elements of this mapfile belongs
-                        vasName = configuration["patterns"]["mapfiles"][mapfile]["VAS"]
-                        # List of the virtual sections that were belong to this mapfile. The address translation is done with the help of these sections.
-                        if not vasName in configuration["virtualSections"]:
-                            sc().error(f"VAS name `{vasName}` stated in patterns configuration but not found in virtualSections.")
-                        virtualSectionsOfThisMapfile = configuration["virtualSections"][vasName]
-                        # The part of the monolith file that contains the address translation data
-                        monolithFileContent = configuration["sortMonolithTabularised"]
                         # Calculating the physical address and getting the name of the virtual section based on which the translation was done
-                        physicalAddress, vasSectionName = self.__translateAddress(lineComponents.group(regexPatternData.Groups.origin),
-                                                                                  lineComponents.group(regexPatternData.Groups.size),
-                                                                                  virtualSectionsOfThisMapfile,
-                                                                                  monolithFileContent)
+                        physicalAddress, vasSectionName = GhsMapfileProcessor.__translateAddress(lineComponents.group(regexPatternData.Groups.origin),
+                                                                                                 lineComponents.group(regexPatternData.Groups.size),
+                                                                                                 virtualSectionIndex)
                         # Check whether the address translation failed
                         if physicalAddress is None:
                             warningSectionName = lineComponents.group(regexPatternData.Groups.section).rstrip()
@@ -138,39 +261,33 @@ class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
                         physicalAddressNoOffset = int(lineComponents.group(regexPatternData.Groups.origin), 16)
                         physicalAddress = physicalAddressNoOffset - offset
                         if physicalAddress < 0:
-                            sc().debug(f"Offset calculation ({hex(physicalAddressNoOffset)} [orig] - {hex(offset)} [offset] -> {hex(physicalAddress)}) returned an address < 0 (file: {os.path.basename(mapfilePath)}:{lineNumber}).")  # Debug message since we check the size a few lines later
+                            sc().debug(f"Offset calculation ({hex(physicalAddressNoOffset)} [orig] - {hex(offset)} [offset] -> {hex(physicalAddress)}) returned an address < 0 (file: {mapfileName}:{lineNumber}).")  # Debug message since we check the size a few lines later
                     # Determining the addressLength
                     addressLength = int(lineComponents.group(regexPatternData.Groups.size), 16)
                     # Check whether the address is valid
                     if addressLength < 0:
                         sc().warning("Negative address length found.")
 
+                    # Collecting the entry, the MemEntry objects will be created from it once all the mapfiles were parsed
+                    entries.append((physicalAddress, addressLength, lineComponents.group(regexPatternData.Groups.section).rstrip(), regexPatternData.getModuleName(lineComponents), vasSectionName))
 
-                    # Creating the compiler specific data that we will store in the memEntry
-                    # This will be a collections.OrderedDict as the MemEntry requires it
-                    compilerSpecificData = collections.OrderedDict()
-                    compilerSpecificData["DMA"] = (vasName is None)
-                    compilerSpecificData["vasName"] = vasName
-                    compilerSpecificData["vasSectionName"] = vasSectionName
+        return sectionEntries, objectEntries
 
-                    # Creating a MemEntry object from the data that we got from the mapfile
-                    memEntry = Emma.emma_libs.memoryEntry.MemEntry(configID=configId,
-                                                              mapfileName=mapfileName,
-                                                              addressStart=physicalAddress,
-                                                              addressLength=addressLength,
-                                                              sectionName=lineComponents.group(regexPatternData.Groups.section).rstrip(),
-                                                              objectName=regexPatternData.getModuleName(lineComponents),
-                                                              compilerSpecificData=compilerSpecificData)
-
-                    # Finding the index, where we need to insert the memEntry
-                    index = bisect.bisect_right(result, memEntry)
-                    # Inserts at index, elements to right will be pushed "one index up"
-                    result.insert(index, memEntry)
-
-        # Filling out the memory regions and memory types and ignoring the entries that did not have a match
-        super().fillOutMemoryRegionsAndMemoryTypes(result, configuration, True, memoryRegionsToExcludeFromMapfiles)
-
-        return result
+    @staticmethod
+    def __createCacheKey(configId, mapfilePath, sectionPattern, objectPattern, listOfExcludedSections, offset, virtualSectionIndex, mapfileHashes=None):
+        # pylint: disable=too-many-arguments
+        # Rationale: The key depends on every argument of the parseMapfile().
+        """
+        Function to create the key of the cache entry of a mapfile from the arguments its parsing depends on (see parseMapfile()).
+        The name of the mapfile is used instead of its path, so the cache can be used if the mapfiles are moved.
+        The hash of the mapfile is taken from the mapfileHashes if it was already calculated.
+        :return: The key of the cache entry.
+        """
+        settings = (configId, os.path.split(mapfilePath)[-1],
+                    type(sectionPattern).__name__, sectionPattern.pattern, sectionPattern.uniquePattern,
+                    type(objectPattern).__name__, objectPattern.pattern, objectPattern.uniquePattern,
+                    sorted(listOfExcludedSections), offset, virtualSectionIndex)
+        return Emma.emma_libs.mapfileCache.MapfileCache.createKey(settings, [mapfilePath], mapfileHashes)
 
     @staticmethod
     def __getRegexPattern(defaultPattern: Emma.emma_libs.ghsMapfileRegexes.RegexPatternBase, mapfileEntry):
@@ -189,6 +306,7 @@ class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
                 # If a unique regex pattern is needed, e.g. when the mapfile has a different format and cannot be parsed with the default pattern
                 # Overwrite default pattern with unique one
                 sectionPattern.pattern = mapfileEntry[UNIQUE_PATTERN_SECTIONS]
+                sectionPattern.uniquePattern = True
                 regexPattern = sectionPattern
         elif isinstance(defaultPattern, Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern):
             if UNIQUE_PATTERN_OBJECTS in mapfileEntry.keys():
@@ -197,6 +315,7 @@ class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
                 # If a unique regex pattern is needed, e.g. when the mapfile has a different format and cannot be parsed with the default pattern
                 # Overwrite default pattern with unique one
                 objectPattern.pattern = mapfileEntry[UNIQUE_PATTERN_OBJECTS]
+                objectPattern.uniquePattern = True
                 regexPattern = objectPattern
         else:
             sc().error("Unexpected default regex pattern (" + type(defaultPattern).__name__ + ")!")
@@ -204,50 +323,65 @@ class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
         return regexPattern
 
     @staticmethod
-    def __translateAddress(elementVirtualStartAddress, elementSize, virtualSectionsOfThisMapfile, monolithFileContent):
-        # pylint: disable=too-many-locals
-        # Rationale: This is legacy code, it will not be changed.
-
+    def __createVirtualSectionIndex(virtualSectionsOfThisMapfile, monolithFileContent):
         """
-        Calculates the physical address for an element (= section or object).
+        Creates an index of the virtual sections of a VAS, based on which the address translation can be done with a binary search.
         The patterns config file can assign a VAS to a mapfile. Every VAS has VAS sections that are defined in the
         virtualSections file. The monolith file contains all the virtual sections of all the VAS-es with data
-        based on which the address translation can be done.
-
-        In order to do the translation we loop trough the entries in the monolith file and see whether the entry belongs
-        to the VAS of this element. If so, when we need to make sure that the element resides within the virtual section.
-        If that is also true, the address translation can be easily done with the data found in the monolith file.
-        :param elementVirtualStartAddress: The start address of the element in the VAS
-        :param elementSize: The size of the element in bytes
-        :param virtualSectionsOfThisMapfile: List of virtual sections that belong to the VAS of the element
+        based on which the address translation can be done. Only the monolith entries that belong to the VAS are indexed.
+        :param virtualSectionsOfThisMapfile: List of virtual sections that belong to the VAS
         :param monolithFileContent: List of all the virtual sections from the monolith file.
-        :return: Physical start address of the element and the name of the virtual section the translation was done with.
+        :return: A tuple of the sorted list of the distinct virtual section start addresses and a list that contains for every start address
+                 the (virtualSectionEndAddress, (addressTranslationOffset, virtualSectionName)) tuples of the virtual sections
+                 that start at or before it and end at or after it, in the order of the monolith file.
         """
         # This are indexes used for accessing the elements of one monolith file entry
         monolithIndexVirtual = 0
         monolithIndexOffset = 2
         monolithIndexSize = 3
         monolithIndexSectionName = 4
+
+        virtualSectionsOfThisMapfile = set(virtualSectionsOfThisMapfile)
+        virtualSections = []
+        for entry in monolithFileContent:
+            if entry[monolithIndexSectionName] in virtualSectionsOfThisMapfile:
+                # For the end addresses we need to be careful in case we have zero lengths
+                virtualSectionStartAddress = entry[monolithIndexVirtual]
+                virtualSectionEndAddress = virtualSectionStartAddress + (entry[monolithIndexSize] - 1) if entry[monolithIndexSize] > 0 else virtualSectionStartAddress
+                virtualSections.append((virtualSectionStartAddress, virtualSectionEndAddress, (entry[monolithIndexOffset], entry[monolithIndexSectionName])))
+
+        startAddresses, candidatesPerStartAddress, _ = Emma.emma_libs.mapfileProcessor.MapfileProcessor.createAddressRangeIndex(virtualSections)
+        return startAddresses, candidatesPerStartAddress
+
+    @staticmethod
+    def __translateAddress(elementVirtualStartAddress, elementSize, virtualSectionIndex):
+        """
+        Calculates the physical address for an element (= section or object).
+        In order to do the translation we look up the virtual sections of the VAS of this element that start at or before the element.
+        If the element resides within one of them, the address translation can be easily done with the data found in the monolith file.
+        If more than one virtual section contains the element, the one that comes first in the monolith file is used.
+        :param elementVirtualStartAddress: The start address of the element in the VAS as hex string
+        :param elementSize: The size of the element in bytes as hex string
+        :param virtualSectionIndex: Index of the virtual sections that belong to the VAS of the element (see __createVirtualSectionIndex()).
+        :return: Physical start address of the element and the name of the virtual section the translation was done with (None, None if the translation failed).
+        """
+        startAddresses, candidatesPerStartAddress = virtualSectionIndex
         # Converting the received start address and size to decimal
-        _, elementVirtualStartAddress = Emma.shared_libs.emma_helper.unifyAddress(elementVirtualStartAddress)
-        _, elementSize = Emma.shared_libs.emma_helper.unifyAddress(elementSize)
+        elementVirtualStartAddress = int(elementVirtualStartAddress, 16)
+        elementSize = int(elementSize, 16)
         # Setting up the return values with default values
         elementPhysicalStartAddress = None
         virtualSectionName = None
 
-        # We will go trough all the entries in the monolith file to find the virtual section this element belongs to
-        for entry in monolithFileContent:
-            # If the element belongs to this virtual section we will try to do the address translation
-            virtualSectionName = entry[monolithIndexSectionName]
-            if virtualSectionName in virtualSectionsOfThisMapfile:
-                # Setting up data for the translation (for the end addresses we need to be careful in case we have zero lengths)
-                virtualSectionStartAddress = entry[monolithIndexVirtual]
-                virtualSectionEndAddress = virtualSectionStartAddress + (entry[monolithIndexSize] - 1) if entry[monolithIndexSize] > 0 else virtualSectionStartAddress
-                elementVirtualEndAddress = elementVirtualStartAddress + (elementSize - 1) if elementSize > 0 else elementVirtualStartAddress
+        # Index of the last virtual section start address that is lower than or equal to the start address of the element
+        startAddressIndex = bisect.bisect_right(startAddresses, elementVirtualStartAddress) - 1
+        if startAddressIndex >= 0:
+            elementVirtualEndAddress = elementVirtualStartAddress + (elementSize - 1) if elementSize > 0 else elementVirtualStartAddress
+            for virtualSectionEndAddress, (addressTranslationOffset, candidateVirtualSectionName) in candidatesPerStartAddress[startAddressIndex]:
                 # If the element is contained by this virtual section then we will use this one for the translation
-                if virtualSectionStartAddress <= elementVirtualStartAddress <= elementVirtualEndAddress <= virtualSectionEndAddress:
-                    addressTranslationOffset = entry[monolithIndexOffset]
+                if elementVirtualEndAddress <= virtualSectionEndAddress:
                     elementPhysicalStartAddress = elementVirtualStartAddress + addressTranslationOffset
+                    virtualSectionName = candidateVirtualSectionName
                     # FIXME: maybe it should be displayed/captured if we got more than one matches! (It should never happen but still...) (MSc)
                     break
         return elementPhysicalStartAddress, virtualSectionName
@@ -56,6 +56,17 @@ class RegexPatternBase:
     def __init__(self):
         self.pattern = None
         self.Groups = Groups()
+        # True if the default pattern was overwritten by a unique pattern from the configuration
+        self.uniquePattern = False
+
+    def isCandidateLine(self, line):    # pylint: disable=unused-argument, no-self-use
+                                        # Rationale: The subclasses can check the line based on their default patterns.
+        """
+        Cheap check of the shape of a line that is done before the regex search. Lines for which this returns False can not match the pattern.
+        :param line: A mapfile line
+        :return: True if the line can match the pattern, False otherwise (the base class accepts every line)
+        """
+        return True
 
 
 class ModuleSummaryPattern(RegexPatternBase):
@@ -84,6 +95,13 @@ class ModuleSummaryPattern(RegexPatternBase):
     def getModuleName(self, lineComponents):
         return lineComponents.group(self.Groups.name).rstrip()
 
+    def isCandidateLine(self, line):
+        """
+        :param line: A mapfile line
+        :return: False if the line can not match the default pattern since it does not start with a hex digit, True otherwise
+        """
+        return self.uniquePattern or (line[:1] in "0123456789abcdef" and line[:1] != "")
+
 
 class ImageSummaryPattern(RegexPatternBase):
     # pylint: disable=too-few-public-methods
@@ -109,6 +127,13 @@ class ImageSummaryPattern(RegexPatternBase):
         self.Groups.size = "sizeHex"
         self.Groups.sectionOffset = "sectionOffset"
 
+    def isCandidateLine(self, line):
+        """
+        :param line: A mapfile line
+        :return: False if the line can not match the default pattern since it does not start with whitespace, True otherwise
+        """
+        return self.uniquePattern or line[:1].isspace()
+
     def getModuleName(self, lineComponents):    # pylint: disable=unused-argument, no-self-use
                                                 # Rationale: Sections do not have object names. This function has to have the same prototype as the other subclasses of the RegexPatternBase.
         """
@@ -0,0 +1,250 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Emma Memory and Mapfile Analyser - incremental processing of the configIds, based on the state of their previous processing
+
+
+import os
+import bisect
+
+from pypiscout.SCout_Logger import Logger as sc
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.emma_libs.memoryMap
+import Emma.emma_libs.mapfileCache
+
+
+# The processing states are stored in their own folder of the cache with their own size limit, so they never evict the parsed mapfiles
+PROCESSING_STATE_CACHE_FOLDER = "processingStates"
+PROCESSING_STATE_CACHE_SIZE_LIMIT = 256 * 1024 * 1024
+
+
+class CollectionState:
+    # pylint: disable=too-few-public-methods
+    # Rationale: This class´s only purpose is to store the state of a consumerCollection.
+    """
+    The state of a consumerCollection (sections or objects) after the duplicate, containment and overlap resolution.
+    The elements are identified by the name of their mapfile and by their ordinal number among the elements of their mapfile,
+    these are the same in every run as long as the mapfile and the configuration did not change.
+    """
+    def __init__(self, identities, originalRanges, groupIds, resolvedElements):
+        self.identities = identities                    # [list((str, int))] (mapfile, ordinal number) of the elements
+        self.originalRanges = originalRanges            # [list((int, int))] (addressStart, addressLength) of the elements before the resolution
+        self.groupIds = groupIds                        # [list(int)] The group of the elements that can interact with each other, see findGroupIds()
+        self.resolvedElements = resolvedElements        # [list(MemEntry)] The elements after the resolution
+
+
+class ProcessingState:
+    # pylint: disable=too-few-public-methods
+    # Rationale: This class´s only purpose is to store the state of the processing of a configId.
+    """
+    The state of the processing of a configId, it is stored in the cache after the processing.
+    """
+    def __init__(self, mapfileHashes):
+        self.mapfileHashes = mapfileHashes              # [dict(str: str)] The hashes of the content of the mapfiles by the names of the mapfiles
+        self.collectionStates = {}                      # [dict(str: CollectionState)] The states of the sections and objects by their file identifiers
+        self.sectionEntriesAndReserves = {}             # [dict((str, int): list(MemEntry))] The section entries and reserves by the identities of their sections
+
+
+def getIdentities(consumerCollection):
+    """
+    Function to get the identities of the elements of a consumerCollection (see CollectionState).
+    :param consumerCollection: A list of MemEntry objects sorted (ASCENDING) based on the startAddress attribute of the elements.
+    :return: [list((str, int))] The (mapfile, ordinal number) pairs of the elements.
+    """
+    identities = []
+    numberOfElementsPerMapfile = {}
+    for memEntry in consumerCollection:
+        ordinalNumber = numberOfElementsPerMapfile.get(memEntry.mapfile, 0)
+        identities.append((memEntry.mapfile, ordinalNumber))
+        numberOfElementsPerMapfile[memEntry.mapfile] = ordinalNumber + 1
+    return identities
+
+
+def findGroupIds(consumerCollection):
+    """
+    Function to split a consumerCollection into groups of consecutive elements, where only the elements of the same group can interact with each other
+    during the duplicate, containment and overlap resolution. A new group begins with every element that starts at or after the end of all of the previous elements.
+    (This is the same grouping as the one of memoryColumns.findInteractingGroups(), but it is done without NumPy and for every element.)
+    :param consumerCollection: A list of MemEntry objects sorted (ASCENDING) based on the startAddress attribute of the elements.
+    :return: [list(int)] The number of the group of every element.
+    """
+    groupIds = []
+    groupId = -1
+    addressEndSoFar = None
+    for memEntry in consumerCollection:
+        if addressEndSoFar is None or memEntry.addressStart >= addressEndSoFar:
+            groupId += 1
+            addressEndSoFar = memEntry.addressStart + memEntry.addressLength
+        else:
+            addressEndSoFar = max(addressEndSoFar, memEntry.addressStart + memEntry.addressLength)
+        groupIds.append(groupId)
+    return groupIds
+
+
+class IncrementalProcessing:
+    """
+    Processes a configId incrementally, based on the state of its previous processing that was stored in the cache.
+    Only the parts that can be affected by the mapfiles that changed since the previous processing are processed again:
+        - the duplicate, containment and overlap resolution is only done for the groups of interacting elements (see findGroupIds())
+          that contain an element of a changed mapfile now or contained one during the previous processing,
+        - the section entries and reserves are only created for the sections that were resolved again or that overlap
+          an object that was resolved again or an object of a changed mapfile from the previous processing.
+    The other elements are taken from the previous state, so the results are the same as the ones of a complete processing.
+    """
+    def __init__(self, cachePath, configId, configuration, settings, mapfileHashes=None):
+        """
+        Loads the state of the previous processing of the configId from the cache.
+        :param cachePath: Path of the directory of the cache.
+        :param configId: The configId that will be processed.
+        :param configuration: The configuration that belongs to the configId.
+        :param settings: Tuple of the settings the processing depends on apart from the mapfiles (configuration, categorisation...), see MapfileCache.createKey().
+        :param mapfileHashes: Dict of the hashes of the mapfiles by their paths (see MapfileCache.hashFile()), None if they shall be calculated here.
+        """
+        self.stateCache = Emma.emma_libs.mapfileCache.MapfileCache(os.path.join(cachePath, PROCESSING_STATE_CACHE_FOLDER), PROCESSING_STATE_CACHE_SIZE_LIMIT)
+        mapfilePaths = [mapfileEntry["associatedFilename"] for mapfileEntry in configuration["patterns"]["mapfiles"].values()]
+        mapfileNames = [os.path.split(mapfilePath)[-1] for mapfilePath in mapfilePaths]
+        # The other files of the configuration (e.g. monoliths) are part of the key, so a change in them leads to a complete processing
+        otherFilePaths = [fileEntry["associatedFilename"] for fileType, fileEntries in configuration["patterns"].items() if fileType != "mapfiles" and isinstance(fileEntries, dict)
+                          for fileEntry in fileEntries.values() if isinstance(fileEntry, dict) and "associatedFilename" in fileEntry]
+        self.stateKey = Emma.emma_libs.mapfileCache.MapfileCache.createKey((configId, configuration, settings), otherFilePaths)
+        # The elements are identified by the names of their mapfiles, so the state can not be used if these are not unique
+        if len(set(mapfileNames)) != len(mapfileNames):
+            self.stateKey = None
+
+        if mapfileHashes is None:
+            mapfileHashes = {mapfilePath: Emma.emma_libs.mapfileCache.MapfileCache.hashFile(mapfilePath) for mapfilePath in mapfilePaths}
+        self.state = ProcessingState({mapfileName: mapfileHashes.get(mapfilePath) for mapfileName, mapfilePath in zip(mapfileNames, mapfilePaths)})
+        self.previousState = self.stateCache.load(self.stateKey) if self.stateKey is not None else None
+        # The mapfiles that changed, were added or removed since the previous processing (None if everything needs to be processed)
+        self.changedMapfiles = None
+        if self.previousState is not None:
+            self.changedMapfiles = {mapfileName for mapfileName in set(self.state.mapfileHashes).union(self.previousState.mapfileHashes)
+                                    if self.state.mapfileHashes.get(mapfileName) is None or self.state.mapfileHashes.get(mapfileName) != self.previousState.mapfileHashes.get(mapfileName)}
+            sc().debug(f"The previous processing of \"{configId}\" was loaded from the cache, {len(self.changedMapfiles)} mapfile(s) changed since then.")
+        # True for every element that was processed again, by the file identifiers of the collections
+        self.reprocessedElements = {}
+
+    def isChanged(self, mapfileName):
+        """
+        Function to decide whether a mapfile changed since the previous processing.
+        :param mapfileName: The name of the mapfile.
+        :return: True if the mapfile changed or there is no previous processing, False otherwise.
+        """
+        return self.changedMapfiles is None or mapfileName in self.changedMapfiles
+
+    def resolveDuplicateContainmentOverlap(self, fileIdentifier, consumerCollection, memEntryHandler, columnar=False):
+        """
+        Incremental version of memoryMap.resolveDuplicateContainmentOverlap().
+        The elements of the groups that were not affected by the changed mapfiles are replaced with their resolved version from the previous state.
+        :param fileIdentifier: The file identifier of the consumerCollection (FILE_IDENTIFIER_SECTION_SUMMARY or FILE_IDENTIFIER_OBJECT_SUMMARY).
+        :param consumerCollection: See memoryMap.resolveDuplicateContainmentOverlap().
+        :param memEntryHandler: See memoryMap.resolveDuplicateContainmentOverlap().
+        :param columnar: See memoryMap.resolveDuplicateContainmentOverlap().
+        :return: None
+        """
+        identities = getIdentities(consumerCollection)
+        originalRanges = [(memEntry.addressStart, memEntry.addressLength) for memEntry in consumerCollection]
+        groupIds = findGroupIds(consumerCollection)
+
+        # The resolved elements of the previous processing that were in a group without any element of a changed mapfile
+        reusableElements = {}
+        previousCollectionState = self.previousState.collectionStates.get(fileIdentifier) if self.previousState is not None else None
+        if previousCollectionState is not None:
+            affectedGroupIds = {groupId for (mapfileName, _), groupId in zip(previousCollectionState.identities, previousCollectionState.groupIds) if self.isChanged(mapfileName)}
+            reusableElements = {identity: memEntry for identity, groupId, memEntry in zip(previousCollectionState.identities, previousCollectionState.groupIds, previousCollectionState.resolvedElements)
+                                if groupId not in affectedGroupIds}
+
+        # A group can only be taken over if all of its elements can be, then it consists of the same elements as during the previous processing
+        groupIsReusable = {}
+        for identity, groupId in zip(identities, groupIds):
+            groupIsReusable[groupId] = groupIsReusable.get(groupId, True) and identity in reusableElements
+        reprocessedElements = [not groupIsReusable[groupId] for groupId in groupIds]
+
+        # The groups that are resolved again do not interact with each other, so they can be resolved together
+        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap([memEntry for memEntry, reprocessed in zip(consumerCollection, reprocessedElements) if reprocessed], memEntryHandler, columnar)
+        for index, (identity, reprocessed) in enumerate(zip(identities, reprocessedElements)):
+            if not reprocessed:
+                consumerCollection[index] = reusableElements[identity]
+        sc().debug(f"The overlaps of {reprocessedElements.count(True)} of {len(consumerCollection)} elements were resolved again.")
+
+        self.state.collectionStates[fileIdentifier] = CollectionState(identities, originalRanges, groupIds, list(consumerCollection))
+        self.reprocessedElements[fileIdentifier] = reprocessedElements
+
+    def calculateObjectsInSections(self, sectionContainer, objectContainer):
+        """
+        Incremental version of memoryMap.calculateObjectsInSections().
+        The section entries and reserves of the sections that were not affected by the changed mapfiles are taken from the previous state.
+        :param sectionContainer: See memoryMap.calculateObjectsInSections().
+        :param objectContainer: See memoryMap.calculateObjectsInSections().
+        :return: See memoryMap.calculateObjectsInSections().
+        """
+        # If the overlaps were not resolved, then the elements of the changed mapfiles are the ones that were processed again
+        for fileIdentifier, consumerCollection in ((FILE_IDENTIFIER_SECTION_SUMMARY, sectionContainer), (FILE_IDENTIFIER_OBJECT_SUMMARY, objectContainer)):
+            if fileIdentifier not in self.state.collectionStates:
+                originalRanges = [(memEntry.addressStart, memEntry.addressLength) for memEntry in consumerCollection]
+                self.state.collectionStates[fileIdentifier] = CollectionState(getIdentities(consumerCollection), originalRanges, None, list(consumerCollection))
+                self.reprocessedElements[fileIdentifier] = [self.isChanged(memEntry.mapfile) for memEntry in consumerCollection]
+        sectionState = self.state.collectionStates[FILE_IDENTIFIER_SECTION_SUMMARY]
+        objectState = self.state.collectionStates[FILE_IDENTIFIER_OBJECT_SUMMARY]
+
+        # The original address ranges of the objects that can be different from the previous processing: the ones that were processed again now and
+        # the ones that belonged to a changed mapfile during the previous processing. The resolution can only reduce the address ranges of the objects.
+        changedObjectRanges = [originalRange for originalRange, reprocessed in zip(objectState.originalRanges, self.reprocessedElements[FILE_IDENTIFIER_OBJECT_SUMMARY]) if reprocessed]
+        previousSectionEntriesAndReserves = {}
+        if self.previousState is not None:
+            previousObjectState = self.previousState.collectionStates[FILE_IDENTIFIER_OBJECT_SUMMARY]
+            changedObjectRanges.extend(originalRange for (mapfileName, _), originalRange in zip(previousObjectState.identities, previousObjectState.originalRanges) if self.isChanged(mapfileName))
+            previousSectionEntriesAndReserves = self.previousState.sectionEntriesAndReserves
+        # Merging the ranges into sorted, separated ranges, so the ones overlapping a section can be found with a binary search
+        changedRangeStarts = []
+        changedRangeEnds = []
+        for addressStart, addressLength in sorted(changedObjectRanges):
+            if changedRangeEnds and addressStart <= changedRangeEnds[-1]:
+                changedRangeEnds[-1] = max(changedRangeEnds[-1], addressStart + addressLength)
+            elif addressLength > 0:
+                changedRangeStarts.append(addressStart)
+                changedRangeEnds.append(addressStart + addressLength)
+
+        def isOverlappingChangedObjects(addressStart, addressLength):
+            """
+            Function to decide whether an address range overlaps one of the changed object ranges.
+            :param addressStart: The start address of the range.
+            :param addressLength: The length of the range.
+            :return: True if the range overlaps a changed object range, False otherwise.
+            """
+            # The last changed range that starts before the end of the range has the biggest end of these, since the changed ranges are separated
+            changedRangeIndex = bisect.bisect_left(changedRangeStarts, addressStart + addressLength) - 1
+            return changedRangeIndex >= 0 and changedRangeEnds[changedRangeIndex] > addressStart
+
+        sectionIsReusable = [not reprocessed and identity in previousSectionEntriesAndReserves and not isOverlappingChangedObjects(*originalRange)
+                             for identity, originalRange, reprocessed in zip(sectionState.identities, sectionState.originalRanges, self.reprocessedElements[FILE_IDENTIFIER_SECTION_SUMMARY])]
+        recalculatedSectionEntriesAndReserves = iter(Emma.emma_libs.memoryMap.calculateSectionEntriesAndReserves([section for section, reusable in zip(sectionContainer, sectionIsReusable) if not reusable], objectContainer))
+        sectionEntriesAndReservesPerSection = [previousSectionEntriesAndReserves[identity] if reusable else next(recalculatedSectionEntriesAndReserves) for identity, reusable in zip(sectionState.identities, sectionIsReusable)]
+        sc().debug(f"The section entries and reserves of {sectionIsReusable.count(False)} of {len(sectionContainer)} sections were created again.")
+
+        self.state.sectionEntriesAndReserves = dict(zip(sectionState.identities, sectionEntriesAndReservesPerSection))
+        return Emma.emma_libs.memoryMap.mergeObjectsIntoSections(sectionEntriesAndReservesPerSection, objectContainer)
+
+    def storeState(self):
+        """
+        Function to store the state of the processing in the cache, so the next processing of the configId can be based on it.
+        :return: None
+        """
+        if self.stateKey is not None:
+            self.stateCache.store(self.stateKey, self.state)
@@ -0,0 +1,172 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Emma Memory and Mapfile Analyser - on-disk cache of the parsed mapfile contents and of the processing states of the configIds
+
+
+import os
+import pickle
+import hashlib
+import tempfile
+
+from pypiscout.SCout_Logger import Logger as sc
+
+import Emma
+
+
+# The cache entries are removed (least recently used first) if the size of the cache exceeds this limit
+DEFAULT_CACHE_SIZE_LIMIT = 512 * 1024 * 1024
+# File extension of the cache entries
+CACHE_ENTRY_EXTENSION = ".pickle"
+# Size of the chunks the mapfiles are read in during the hashing
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class MapfileCache:
+    """
+    On-disk cache of the parsed content of the mapfiles and of the processing states of the configIds (in separate folders with separate size limits).
+    Every entry is stored in its own file, named after the hash of the content of the input files and of the settings the entry was created with,
+    so a changed input file or changed settings lead to a new entry. The entries are stored in the binary pickle format.
+    The least recently used entries are removed if the size of the cache exceeds its size limit.
+    """
+    def __init__(self, cachePath, sizeLimit=DEFAULT_CACHE_SIZE_LIMIT):
+        self.cachePath = cachePath
+        self.sizeLimit = sizeLimit
+
+    @staticmethod
+    def hashFile(filePath):
+        """
+        Function to hash the content of a file.
+        :param filePath: The path of the file.
+        :return: The SHA-256 hash of the content as a hexadecimal string, None if the file could not be read.
+        """
+        result = None
+        hashObject = hashlib.sha256()
+        try:
+            with open(filePath, "rb") as fileObject:
+                for chunk in iter(lambda: fileObject.read(HASH_CHUNK_SIZE), b""):
+                    hashObject.update(chunk)
+            result = hashObject.hexdigest()
+        except OSError:
+            # The entries that depend on the file will not be cached, the error will be reported by the processing of the file
+            result = None
+        return result
+
+    @staticmethod
+    def createKey(settings, filePaths, fileHashes=None):
+        """
+        Function to create the key of a cache entry.
+        :param settings: Tuple of the settings the entry depends on, its repr() must be the same for the same settings in every run.
+        :param filePaths: List of the paths of the input files (e.g. mapfiles) the entry depends on, their content will be hashed.
+        :param fileHashes: Dict of the hashes of the input files by their paths (see hashFile()) that were already calculated, these files are not read again.
+        :return: The key as a hexadecimal string, None if one of the files could not be read.
+        """
+        result = None
+        hashObject = hashlib.sha256()
+        # The version is part of the key, so the entries created by another Emma version are not used
+        hashObject.update(repr((Emma.EMMA_VERSION, settings)).encode())
+        for filePath in filePaths:
+            fileHash = fileHashes[filePath] if fileHashes is not None and filePath in fileHashes else MapfileCache.hashFile(filePath)
+            if fileHash is None:
+                break
+            hashObject.update(fileHash.encode())
+        else:
+            result = hashObject.hexdigest()
+        return result
+
+    def load(self, key):
+        """
+        Function to load an entry from the cache. The entry is marked as recently used.
+        :param key: The key of the entry, created with createKey().
+        :return: The cached value if the entry was found, None otherwise.
+        """
+        result = None
+        entryPath = self.__getEntryPath(key)
+        if os.path.exists(entryPath):
+            try:
+                with open(entryPath, "rb") as fileObject:
+                    result = pickle.load(fileObject)
+                os.utime(entryPath)
+            except Exception:       # pylint: disable=broad-except
+                                    # Rationale: A damaged or concurrently removed cache entry must not stop the analysis, the mapfile will be parsed again instead.
+                sc().debug(f"The cache entry {entryPath} could not be loaded, it will be ignored.")
+                result = None
+        return result
+
+    def store(self, key, value):
+        """
+        Function to store an entry in the cache, then the least recently used entries are removed if the cache became too big.
+        The entry is written to a temporary file first, so other processes never see partially written entries.
+        The temporary file is removed if the entry could not be stored, even if the storing was interrupted.
+        :param key: The key of the entry, created with createKey().
+        :param value: The value that will be stored, it must be picklable.
+        :return: None
+        """
+        temporaryPath = None
+        try:
+            # The directory may be created by several processes at the same time
+            os.makedirs(self.cachePath, exist_ok=True)
+            fileDescriptor, temporaryPath = tempfile.mkstemp(dir=self.cachePath, suffix=".tmp")
+            with os.fdopen(fileDescriptor, "wb") as fileObject:
+                pickle.dump(value, fileObject, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporaryPath, self.__getEntryPath(key))
+            temporaryPath = None
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as exception:
+            # Besides the PicklingError, pickle raises TypeError and AttributeError for objects that can not be pickled
+            sc().wwarning(f"The cache entry could not be stored ({exception}).")
+        finally:
+            # The temporary file is only left over if the entry was not stored (errors, KeyboardInterrupt...)
+            if temporaryPath is not None:
+                try:
+                    os.remove(temporaryPath)
+                except OSError:
+                    pass
+        self.__evict()
+
+    def __getEntryPath(self, key):
+        """
+        Function to get the path of an entry.
+        :param key: The key of the entry.
+        :return: The path of the entry.
+        """
+        return os.path.join(self.cachePath, key + CACHE_ENTRY_EXTENSION)
+
+    def __evict(self):
+        """
+        Function to remove the least recently used entries until the size of the cache is within the size limit.
+        :return: None
+        """
+        entries = []
+        try:
+            for entryName in os.listdir(self.cachePath):
+                if entryName.endswith(CACHE_ENTRY_EXTENSION):
+                    entryPath = os.path.join(self.cachePath, entryName)
+                    entryStat = os.stat(entryPath)
+                    entries.append((entryStat.st_mtime, entryStat.st_size, entryPath))
+        except OSError:
+            # The cache was changed by another process in the meantime, the eviction will be done with the next entry that is stored
+            entries = []
+        cacheSize = sum(entrySize for _, entrySize, _ in entries)
+        for _, entrySize, entryPath in sorted(entries):
+            if cacheSize <= self.sizeLimit:
+                break
+            try:
+                os.remove(entryPath)
+            except OSError:
+                pass
+            cacheSize -= entrySize
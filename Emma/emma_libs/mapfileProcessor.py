@@ -18,10 +18,13 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 
 
 import abc
+import bisect
+import heapq
 
 from pypiscout.SCout_Logger import Logger as sc
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.emma_libs.memoryColumns
 
 
 class MapfileProcessor(abc.ABC):
@@ -30,18 +33,62 @@ class MapfileProcessor(abc.ABC):
     Defining interfaces and common functionality for subclasses that will be used for mapfile processing.
     """
     @abc.abstractmethod
-    def processMapfiles(self, configId, configuration, analyseDebug):
+    def processMapfiles(self, configId, configuration, analyseDebug, jobs=1, columnar=False, cachePath=None, mapfileHashes=None):
+        # pylint: disable=too-many-arguments
+        # Rationale: The settings of the mapfile processing are passed one by one, so the subclasses do not depend on the MemoryManager.
         """
         Abstract function to process mapfiles.
         :param configId: The configId to which the configuration belongs to.
         :param configuration: The configuration based on which the mapfiles can be processed.
         :param analyseDebug: True if the debug sections and objects need to be analysed as well, False otherwise.
+        :param jobs: Number of worker processes that may be used to process the mapfiles in parallel.
+        :param columnar: True if the columnar (NumPy) backend shall be used for the address arithmetic, False otherwise.
+        :param cachePath: Path of the directory where the parsed mapfiles are cached, None if the cache shall not be used.
+        :param mapfileHashes: Dict of the hashes of the mapfiles by their paths (see MapfileCache.hashFile()), None if they shall be calculated for the cache keys.
         :return: A tuple of two lists of MemEntry objects representing the sections and objects.
                  Illustration: (sectionCollection, objectCollection), where sectionCollection is list(MemEntry) and objectCollection is list(MemEntry).
         """
 
     @staticmethod
-    def fillOutMemoryRegionsAndMemoryTypes(listOfMemEntryObjects, configuration, removeElementsWithoutMemoryRegionOrType, memoryRegionsToExcludeFromMapfiles=None):
+    def createAddressRangeIndex(addressRanges):
+        """
+        Creates an index of address ranges (memory regions, virtual sections...), based on which the ranges that contain an element can be found with a binary search.
+        The index is built in one sweep over the ranges sorted by their start addresses, the ranges that ended are dropped with a heap.
+        :param addressRanges: List of (startAddress, endAddress, payload) tuples in the order of their priority.
+        :return: A tuple of:
+                    - the sorted list of the distinct start addresses
+                    - a list that contains for every start address the (endAddress, payload) tuples of the ranges,
+                      that start at or before it and end at or after it, in the order of their priority
+                    - a list that contains for every start address the payload of the range with the highest priority that starts at or before it
+        """
+        rangeIndexesByStartAddress = sorted(range(len(addressRanges)), key=lambda rangeIndex: addressRanges[rangeIndex][0])
+        startAddresses = []
+        candidatesPerStartAddress = []
+        firstPayloadPerStartAddress = []
+        # Indexes of the ranges that started at or before the current start address and did not end before it, in the order of their priority
+        openRangeIndexes = []
+        openRangeEnds = []
+        firstRangeIndex = None
+        position = 0
+        while position < len(rangeIndexesByStartAddress):
+            startAddress = addressRanges[rangeIndexesByStartAddress[position]][0]
+            while position < len(rangeIndexesByStartAddress) and addressRanges[rangeIndexesByStartAddress[position]][0] == startAddress:
+                rangeIndex = rangeIndexesByStartAddress[position]
+                bisect.insort(openRangeIndexes, rangeIndex)
+                heapq.heappush(openRangeEnds, (addressRanges[rangeIndex][1], rangeIndex))
+                firstRangeIndex = rangeIndex if firstRangeIndex is None else min(firstRangeIndex, rangeIndex)
+                position += 1
+            # Ranges that end before the start address can not contain an element that starts at or after it
+            while openRangeEnds and openRangeEnds[0][0] < startAddress:
+                _, rangeIndex = heapq.heappop(openRangeEnds)
+                del openRangeIndexes[bisect.bisect_left(openRangeIndexes, rangeIndex)]
+            startAddresses.append(startAddress)
+            candidatesPerStartAddress.append([(addressRanges[rangeIndex][1], addressRanges[rangeIndex][2]) for rangeIndex in openRangeIndexes])
+            firstPayloadPerStartAddress.append(addressRanges[firstRangeIndex][2])
+        return startAddresses, candidatesPerStartAddress, firstPayloadPerStartAddress
+
+    @staticmethod
+    def fillOutMemoryRegionsAndMemoryTypes(listOfMemEntryObjects, configuration, removeElementsWithoutMemoryRegionOrType, memoryRegionsToExcludeFromMapfiles=None, columnar=False):
         """
         Fills out the memory type and the memory regions in a list of MemEntry objects.
         This function needs to be called by the subclasses of this class during the mapfile processing,
@@ -59,6 +106,7 @@ class MapfileProcessor(abc.ABC):
         :param memoryRegionsToExcludeFromMapfiles: Dictionary, based on which MemEntry objects can be excluded if they belong to a memory region that is ignored for the mapfile, the object was created from.
                                                    The dictionary contains mapfile names as keys and lists of strings with memory region names as values.
                                                    If the functionality is not needed, then it shall be set to None.
+        :param columnar: True if the memory regions of the elements shall be found at once with the columnar (NumPy) backend, False otherwise.
         :return: None
         """
         def printElementRemovalMessage(memEntry, loggerLevel, reason):
@@ -89,27 +137,55 @@ class MapfileProcessor(abc.ABC):
                         result = True
             return result
 
+        def findMemoryRegion(element):
+            """
+            Function to find the first memory region of the configuration that contains the element.
+            :param element: MemEntry object for which the memory region needs to be found.
+            :return: The name of the memory region if one was found, None otherwise.
+            """
+            result = None
+            # Index of the last memory region start address that is lower than or equal to the addressStart of the element
+            startAddressIndex = bisect.bisect_right(startAddresses, element.addressStart) - 1
+            if startAddressIndex >= 0:
+                elementAddressEnd = element.addressEnd()
+                # For elements that do not have addressEnd the addressStart comparison is enough
+                if elementAddressEnd is None:
+                    result = firstRegionPerStartAddress[startAddressIndex]
+                else:
+                    for regionEnd, memoryRegion in candidatesPerStartAddress[startAddressIndex]:
+                        if elementAddressEnd <= regionEnd:
+                            result = memoryRegion
+                            break
+            return result
+
         listOfElementsToKeep = []
         memoryCandidates = configuration["addressSpaces"]["memory"]
+        # The addresses of the memory regions are converted to int only once here
+        memoryRegionRanges = [(int(memoryCandidates[memoryRegion][START], 16), int(memoryCandidates[memoryRegion][END], 16), memoryRegion) for memoryRegion in memoryCandidates]
+        startAddresses, candidatesPerStartAddress, firstRegionPerStartAddress = MapfileProcessor.createAddressRangeIndex(memoryRegionRanges)
+
+        # Finding the memory regions of all the elements at once if the columnar backend was selected
+        memoryRegions = None
+        if columnar:
+            try:
+                memoryRegions = Emma.emma_libs.memoryColumns.findMemoryRegions(listOfMemEntryObjects, memoryCandidates)
+            except OverflowError:
+                sc().debug("The addresses do not fit into the columnar backend, the memory regions will be found without it.")
 
         # For every memEntryObject
-        for element in listOfMemEntryObjects:
-            # For every defined memory region
-            for memoryRegion in memoryCandidates:
-                # If the element is in this memoryRegion
-                # For elements that do not have addressEnd the addressStart comparison is enough
-                if int(memoryCandidates[memoryRegion][START], 16) <= element.addressStart:
-                    if element.addressEnd() is None or (element.addressEnd() <= int(memoryCandidates[memoryRegion][END], 16)):
-                        # Then we store the memoryRegion data in the element
-                        element.memTypeTag = memoryRegion
-                        element.memType = memoryCandidates[memoryRegion][TYPE]
-                        # If this region (-> tag) is not excluded for the mapfile the element belongs to then we will keep it
-                        if not isElementMarkedAsExcluded(memoryRegionsToExcludeFromMapfiles, element):
-                            listOfElementsToKeep.append(element)
-                        else:
-                            printElementRemovalMessage(element, sc().debug, "Its memory region was excluded for this mapfile!")
-                        break
-            # If we have reached this point, then we did not find a memory region
+        for elementIndex, element in enumerate(listOfMemEntryObjects):
+            # Finding the memory region the element is in
+            memoryRegion = findMemoryRegion(element) if memoryRegions is None else memoryRegions[elementIndex]
+            if memoryRegion is not None:
+                # Then we store the memoryRegion data in the element
+                element.memTypeTag = memoryRegion
+                element.memType = memoryCandidates[memoryRegion][TYPE]
+                # If this region (-> tag) is not excluded for the mapfile the element belongs to then we will keep it
+                if not isElementMarkedAsExcluded(memoryRegionsToExcludeFromMapfiles, element):
+                    listOfElementsToKeep.append(element)
+                else:
+                    printElementRemovalMessage(element, sc().debug, "Its memory region was excluded for this mapfile!")
+            # If we did not find a memory region
             else:
                 # If we do not have to remove elements without a memory region then we will fill it out with the default values and keep it
                 if not removeElementsWithoutMemoryRegionOrType:
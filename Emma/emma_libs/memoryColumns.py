@@ -0,0 +1,96 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Emma Memory and Mapfile Analyser - columnar (NumPy) implementation of the address arithmetic of the consumerCollections
+# NumPy is imported by the functions, so it is only imported if the columnar backend was selected (--columnar).
+
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+
+
+class AddressColumns:
+    # pylint: disable=too-few-public-methods
+    # Rationale: This class´s only purpose is to store the columns of a consumerCollection.
+    """
+    Columnar representation of the addresses of a list of MemEntry objects.
+    The addressStart and addressLength values are stored as NumPy int64 arrays in the order of the list,
+    so the address arithmetic can be done for all the elements at once instead of element by element.
+    """
+    def __init__(self, consumerCollection):
+        """
+        Creates the columns from the current addresses of the elements.
+        :param consumerCollection: A list of MemEntry objects.
+        :raises OverflowError: If an address does not fit into an int64 value.
+        """
+        import numpy        # pylint: disable=import-outside-toplevel
+                            # Rationale: See the description of this file.
+        self.addressStart = numpy.fromiter((memEntry.addressStart for memEntry in consumerCollection), dtype=numpy.int64, count=len(consumerCollection))
+        self.addressLength = numpy.fromiter((memEntry.addressLength for memEntry in consumerCollection), dtype=numpy.int64, count=len(consumerCollection))
+
+    def addressEndExclusive(self):
+        """
+        Function to get the first addresses after the elements (addressStart + addressLength).
+        Unlike MemEntry.addressEnd() this is also defined for elements with zero addressLength.
+        :return: [numpy.ndarray] The exclusive end addresses of the elements.
+        """
+        return self.addressStart + self.addressLength
+
+
+def findMemoryRegions(consumerCollection, memoryCandidates):
+    """
+    Finds the memory region of every element of a consumerCollection at once.
+    The result is the same as that of the element by element search: the first memory region of the configuration,
+    that starts at or before the addressStart of the element and ends at or after its addressEnd.
+    Elements with zero addressLength do not have an addressEnd, for them the addressStart comparison is enough.
+    :param consumerCollection: A list of MemEntry objects.
+    :param memoryCandidates: The memory regions of the addressSpaces configuration.
+    :return: [list(str)] The name of the memory region of every element, None for the elements without a memory region.
+    """
+    import numpy        # pylint: disable=import-outside-toplevel
+                        # Rationale: See the description of this file.
+    columns = AddressColumns(consumerCollection)
+    memoryRegions = list(memoryCandidates)
+    addressEnd = columns.addressEndExclusive() - 1
+    regionIndices = numpy.full(len(consumerCollection), -1, dtype=numpy.int64)
+    # Visiting the regions backwards, so the first matching region of the configuration overwrites the later ones
+    for regionIndex in reversed(range(len(memoryRegions))):
+        regionStart = int(memoryCandidates[memoryRegions[regionIndex]][START], 16)
+        regionEnd = int(memoryCandidates[memoryRegions[regionIndex]][END], 16)
+        regionIndices[(columns.addressStart >= regionStart) & ((addressEnd <= regionEnd) | (columns.addressLength == 0))] = regionIndex
+    return [memoryRegions[regionIndex] if regionIndex >= 0 else None for regionIndex in regionIndices.tolist()]
+
+
+def findInteractingGroups(consumerCollection):
+    """
+    Splits a consumerCollection into groups of consecutive elements, where only the elements of the same group can be duplicates of,
+    contain or overlap each other. A new group begins with every element that starts at or after the end of all of the previous elements.
+    The duplicate, containment and overlap resolution only reduces the address ranges of the elements, so the groups stay separated during it.
+    :param consumerCollection: A list of MemEntry objects sorted (ASCENDING) based on the startAddress attribute of the elements.
+    :return: [list((int, int))] The (beginIndex, endIndex) slice boundaries of the groups that have more than one element.
+    """
+    import numpy        # pylint: disable=import-outside-toplevel
+                        # Rationale: See the description of this file.
+    result = []
+    if consumerCollection:
+        columns = AddressColumns(consumerCollection)
+        addressEndSoFar = numpy.maximum.accumulate(columns.addressEndExclusive())
+        # The first element of every group, the element with index 0 always begins a group
+        groupBegins = numpy.flatnonzero(columns.addressStart[1:] >= addressEndSoFar[:-1]) + 1
+        groupBoundaries = numpy.concatenate(([0], groupBegins, [len(consumerCollection)])).tolist()
+        result = [(beginIndex, endIndex) for beginIndex, endIndex in zip(groupBoundaries[:-1], groupBoundaries[1:]) if endIndex - beginIndex > 1]
+    return result
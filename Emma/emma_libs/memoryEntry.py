@@ -16,6 +16,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
+import sys
 import abc
 import collections
 
@@ -31,7 +32,11 @@ class MemEntry:
     """
     A class to represent an entry in the memory. This is a generic class, it can represent both sections and objects.
     To handle objects of this class according to their type, please use one of the subclasses of the @ref:MemEntryHandler.
+    There can be millions of objects of this class, so the attributes are stored in slots instead of a per-instance dict.
     """
+    __slots__ = ("configID", "mapfile", "addressStart", "addressLength", "sectionName", "objectName", "memType", "memTypeTag", "category", "compilerSpecificData",
+                 "overlapFlag", "containmentFlag", "duplicateFlag", "containingOthersFlag", "overlappingOthersFlag", "addressStartOriginal", "addressLengthOriginal")
+
     def __init__(self, configID, mapfileName, addressStart, addressLength=None, addressEnd=None, sectionName="", objectName="", memType="", memTypeTag="", category="", compilerSpecificData=None):
         # pylint: disable=too-many-arguments
         # Rationale: The constructor needs to be able to fully setup during construction.
@@ -49,10 +54,12 @@ class MemEntry:
         :param memTypeTag: [string] The name of the memory area the entry is located in. This is a logical subtype of the memType value. For example: Code, DataTable...
         :param category: [string] The name of the category, the entry belongs to. This is only a logical grouping. For example: GraphicFramework, EthernetDriver, HMI
         :param compilerSpecificData: [collections.OrderedDict] Data that comes from the object of the MapfileProcessor subclasseses during the mapfile processing.
+                                     The same object can be shared between MemEntry objects, so it must not be changed after the construction.
         """
 
-        self.configID = configID
-        self.mapfile = mapfileName
+        # The names are interned since the same names occur in lots of objects
+        self.configID = MemEntry.__intern(configID)
+        self.mapfile = MemEntry.__intern(mapfileName)
 
         # Converting the address related parameters to int
         if addressStart is not None:
@@ -76,12 +83,12 @@ class MemEntry:
             sc().wwarning("MemEntry: addressLength AND addressEnd were both given. The addressLength will be used.")
             self.setAddressesGivenLength(addressLength)
 
-        self.sectionName = sectionName
-        self.objectName = objectName
+        self.sectionName = MemEntry.__intern(sectionName)
+        self.objectName = MemEntry.__intern(objectName)
 
-        self.memType = memType
-        self.memTypeTag = memTypeTag
-        self.category = category
+        self.memType = MemEntry.__intern(memType)
+        self.memTypeTag = MemEntry.__intern(memTypeTag)
+        self.category = MemEntry.__intern(category)
 
         self.compilerSpecificData = None
         if isinstance(compilerSpecificData, collections.OrderedDict):
@@ -100,6 +107,17 @@ class MemEntry:
         self.addressStartOriginal = self.addressStart
         self.addressLengthOriginal = self.addressLength
 
+    def __copy__(self):
+        """
+        Creates a shallow copy of the object.
+        The attributes are either immutable or must not be changed after the construction (compilerSpecificData), so the copy can share them with the original object.
+        :return: The new MemEntry object.
+        """
+        memEntryCopy = type(self).__new__(type(self))
+        for attribute in MemEntry.__slots__:
+            setattr(memEntryCopy, attribute, getattr(self, attribute))
+        return memEntryCopy
+
     def __eq__(self, other):
         """
         This is not implemented because we shall compare MemEntry objects trough the subclasses of the MemEntryHandler class.
@@ -203,6 +221,15 @@ class MemEntry:
         else:
             sc().error("MemEntry: The addressLength (" + str(addressLength) + ") is negative!")
 
+    @staticmethod
+    def __intern(name):
+        """
+        Function to intern a name, so that the MemEntry objects with the same names share a single string object.
+        :param name: The name to intern.
+        :return: The interned name if it is a string, the name unchanged otherwise.
+        """
+        return sys.intern(name) if isinstance(name, str) else name
+
     @staticmethod
     def __calculateAddressEnd(addressStart, addressLength):
         """
@@ -17,10 +17,12 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
 import os
+import itertools
+import collections
+import concurrent.futures
 from enum import IntEnum
 
 from pypiscout.SCout_Logger import Logger as sc
-import svgwrite
 # import graphviz
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
@@ -30,6 +32,8 @@ import Emma.emma_libs.configuration
 import Emma.emma_libs.mapfileProcessorFactory
 import Emma.emma_libs.memoryMap
 import Emma.emma_libs.categorisation
+import Emma.emma_libs.incrementalProcessing
+import Emma.emma_libs.mapfileCache
 
 
 class MemoryManager:
@@ -43,7 +47,7 @@ class MemoryManager:
         """
         Settings that influence the operation of the MemoryManager object.
         """
-        def __init__(self, projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, noResolveOverlap, teamScale, dryRun, memVis, memVisResolved):
+        def __init__(self, projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, noResolveOverlap, teamScale, dryRun, memVis, memVisResolved, jobs, columnar, cachePath, incremental, reportFormat):
             self.projectName = projectName
             self.configurationPath = configurationPath
             self.mapfilesPath = mapfilesPath
@@ -57,13 +61,18 @@ class MemoryManager:
             self.memVisResolved = memVisResolved
             self.teamScale = teamScale
             self.dryRun = dryRun
+            self.jobs = jobs
+            self.columnar = columnar
+            self.cachePath = cachePath
+            self.incremental = incremental
+            self.reportFormat = reportFormat
 
-    def __init__(self, projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, noResolveOverlap, teamScale, dryRun, memVis, memVisResolved):
+    def __init__(self, projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, noResolveOverlap, teamScale, dryRun, memVis, memVisResolved, jobs, columnar, cachePath, incremental, reportFormat):
         # pylint: disable=too-many-arguments
         # Rationale: We need to initialize the Settings, so the number of arguments are needed.
 
         # Processing the command line arguments and storing it into the settings member
-        self.settings = MemoryManager.Settings(projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, noResolveOverlap, teamScale, dryRun, memVis, memVisResolved)
+        self.settings = MemoryManager.Settings(projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, noResolveOverlap, teamScale, dryRun, memVis, memVisResolved, jobs, columnar, cachePath, incremental, reportFormat)
         # Check whether the configuration and the mapfiles folders exist
         Emma.shared_libs.emma_helper.checkIfFolderExists(self.settings.mapfilesPath)
         self.configuration = None           # The configuration is empty at this moment, it can be read in with another method
@@ -92,6 +101,7 @@ class MemoryManager:
     def processMapfiles(self):
         """
         A method to process the mapfiles.
+        The configIds are processed in parallel if more than one job was allowed by the settings.
         :return: None
         """
         # Check if the configuration loaded
@@ -99,49 +109,121 @@ class MemoryManager:
             # We will create an empty memory content that will be filled now
             self.memoryContent = {}
 
-            # Processing the mapfiles for every configId
-            for configId in self.configuration.globalConfig:
-                # Creating the configId in the memory content
-                self.memoryContent[configId] = {}
-
-                sc().info("Importing Data for \"" + configId + "\", this may take some time...")
-
-                # Creating a mapfile processor based on the compiler that was defined for the configId
-                usedCompiler = self.configuration.globalConfig[configId]["compiler"]
-                mapfileProcessor = Emma.emma_libs.mapfileProcessorFactory.createSpecificMapfileProcesor(usedCompiler)
-
-                # Importing the mapfile contents for the configId with the created mapfile processor
-                sectionCollection, objectCollection = mapfileProcessor.processMapfiles(configId, self.configuration.globalConfig[configId], self.settings.analyseDebug)
-
-                # Filling out the categories in the consumerCollections
-                self.categorisation.fillOutCategories(sectionCollection, objectCollection)
-
-                # Updating the categorisation files from the categorisation keywords and remove the unmatched one based on the settings
-                self.categorisation.manageCategoriesFiles(self.settings.createCategories, self.settings.removeUnmatched, sectionCollection, objectCollection)
-
-                # Do not resolve duplicate, containment and overlap when createCategories is active
-                if not self.settings.createCategories:
-                    # Resolving the duplicate, containment and overlap in the consumerCollections
-                    if not self.settings.noResolveOverlap:
-                        sc().info("Resolving section overlaps. This may take some time...")
-                        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(sectionCollection, Emma.emma_libs.memoryEntry.SectionEntry)
-                        sc().info("Resolving object overlaps. This may take some time...")
-                        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(objectCollection, Emma.emma_libs.memoryEntry.ObjectEntry)
-
-                    # Storing the consumer collections
-                    self.memoryContent[configId][FILE_IDENTIFIER_SECTION_SUMMARY] = sectionCollection
-                    self.memoryContent[configId][FILE_IDENTIFIER_OBJECT_SUMMARY] = objectCollection
-
-                    # Creating a common consumerCollection
-                    sc().info("Calculating objects in sections. This may take some time...")
-                    self.memoryContent[configId][FILE_IDENTIFIER_OBJECTS_IN_SECTIONS] = Emma.emma_libs.memoryMap.calculateObjectsInSections(
-                        self.memoryContent[configId][FILE_IDENTIFIER_SECTION_SUMMARY],
-                        self.memoryContent[configId][FILE_IDENTIFIER_OBJECT_SUMMARY])
-                else:
-                    pass
+            # The categorisation files are updated during the processing of every configId if one of these settings is active,
+            # so the configIds have to be processed one after another in this case
+            jobs = min(self.settings.jobs, len(self.configuration.globalConfig))
+            if jobs > 1 and (self.settings.createCategories or self.settings.removeUnmatched):
+                sc().wwarning("The categorisation files will be updated, the configIds will be processed sequentially.")
+                jobs = 1
+
+            if jobs > 1:
+                # Processing the mapfiles for every configId in worker processes
+                with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+                    futures = collections.OrderedDict()
+                    for configId in self.configuration.globalConfig:
+                        futures[configId] = executor.submit(Emma.shared_libs.emma_helper.callWithRecordedLogging, MemoryManager.processConfigId, configId, self.configuration.globalConfig[configId], self.categorisation,
+                                                            self.settings.analyseDebug, self.settings.createCategories, self.settings.removeUnmatched, self.settings.noResolveOverlap, 1, self.settings.columnar,
+                                                            self.settings.cachePath, self.settings.incremental)
+                    # Collecting the results in the order of the configIds, so the log output and the memory content do not depend on which worker finished first
+                    for configId, future in futures.items():
+                        loggedMessages, consumerCollections = future.result()
+                        Emma.shared_libs.emma_helper.replayLogging(loggedMessages)
+                        # The consumer collections are None if the processing of the configId was stopped by an error
+                        if consumerCollections is not None:
+                            self.memoryContent[configId] = consumerCollections
+            else:
+                # Processing the mapfiles for every configId, the jobs can be used to process the mapfiles of a configId in parallel
+                for configId in self.configuration.globalConfig:
+                    self.memoryContent[configId] = MemoryManager.processConfigId(configId, self.configuration.globalConfig[configId], self.categorisation,
+                                                                                 self.settings.analyseDebug, self.settings.createCategories, self.settings.removeUnmatched, self.settings.noResolveOverlap,
+                                                                                 self.settings.jobs, self.settings.columnar, self.settings.cachePath, self.settings.incremental)
         else:
             sc().error("The configuration needs to be loaded before processing the mapfiles!")
 
+    @staticmethod
+    def processConfigId(configId, configuration, categorisation, analyseDebug, createCategories, removeUnmatched, noResolveOverlap, jobs, columnar, cachePath, incremental):
+        # pylint: disable=too-many-arguments
+        # Rationale: This function is executed in worker processes as well, so it receives the settings it needs instead of the MemoryManager object.
+        """
+        Processes the mapfiles of a configId: imports, categorises and resolves the sections and objects, then calculates the objects in sections.
+        The configIds are independent from each other, so this function can be called for them in any order or in parallel.
+        :param configId: The configId that will be processed.
+        :param configuration: The configuration that belongs to the configId.
+        :param categorisation: The Categorisation object used to fill out the categories.
+        :param analyseDebug: True if the debug sections and objects need to be analysed as well, False otherwise.
+        :param createCategories: True if the categorisation files shall be updated from the keyword matches, False otherwise.
+        :param removeUnmatched: True if the unmatched categories shall be removed from the categorisation files, False otherwise.
+        :param noResolveOverlap: True if the duplicates, containments and overlaps shall not be resolved, False otherwise.
+        :param jobs: Number of worker processes the mapfile processor may use to process the mapfiles in parallel.
+        :param columnar: True if the columnar (NumPy) backend shall be used for the address arithmetic, False otherwise.
+        :param cachePath: Path of the directory where the parsed mapfiles are cached, None if the cache shall not be used.
+        :param incremental: True if the state of the previous processing stored in the cache shall be used to process only the parts affected by the changed mapfiles, False otherwise.
+        :return: [dict(list(memEntry))] The consumer collections of the configId (empty if createCategories is active).
+        """
+        consumerCollections = {}
+
+        # Every mapfile is hashed only once, the hashes are used for the keys of the parsed mapfiles and for the processing state as well
+        mapfileHashes = None
+        if cachePath is not None:
+            mapfileHashes = {mapfileEntry["associatedFilename"]: Emma.emma_libs.mapfileCache.MapfileCache.hashFile(mapfileEntry["associatedFilename"])
+                             for mapfileEntry in configuration["patterns"]["mapfiles"].values()}
+
+        # The state of the previous processing of the configId is used to process only the parts that were affected by the changed mapfiles
+        # The categorisation files are updated during the processing if createCategories or removeUnmatched is active, so the state can not be used in this case
+        incrementalProcessing = None
+        if cachePath is not None and incremental and not createCategories and not removeUnmatched:
+            settings = (categorisation.categoriesObjects, categorisation.categoriesSections, categorisation.categoriesObjectsKeywords, categorisation.categoriesSectionsKeywords,
+                        analyseDebug, noResolveOverlap)
+            incrementalProcessing = Emma.emma_libs.incrementalProcessing.IncrementalProcessing(cachePath, configId, configuration, settings, mapfileHashes)
+
+        sc().info("Importing Data for \"" + configId + "\", this may take some time...")
+
+        # Creating a mapfile processor based on the compiler that was defined for the configId
+        usedCompiler = configuration["compiler"]
+        mapfileProcessor = Emma.emma_libs.mapfileProcessorFactory.createSpecificMapfileProcesor(usedCompiler)
+
+        # Importing the mapfile contents for the configId with the created mapfile processor
+        sectionCollection, objectCollection = mapfileProcessor.processMapfiles(configId, configuration, analyseDebug, jobs, columnar, cachePath, mapfileHashes)
+
+        # Filling out the categories in the consumerCollections
+        categorisation.fillOutCategories(sectionCollection, objectCollection)
+
+        # Updating the categorisation files from the categorisation keywords and remove the unmatched one based on the settings
+        categorisation.manageCategoriesFiles(createCategories, removeUnmatched, sectionCollection, objectCollection)
+
+        # Do not resolve duplicate, containment and overlap when createCategories is active
+        if not createCategories:
+            # Resolving the duplicate, containment and overlap in the consumerCollections
+            if not noResolveOverlap:
+                sc().info("Resolving section overlaps. This may take some time...")
+                if incrementalProcessing is not None:
+                    incrementalProcessing.resolveDuplicateContainmentOverlap(FILE_IDENTIFIER_SECTION_SUMMARY, sectionCollection, Emma.emma_libs.memoryEntry.SectionEntry, columnar)
+                else:
+                    Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(sectionCollection, Emma.emma_libs.memoryEntry.SectionEntry, columnar)
+                sc().info("Resolving object overlaps. This may take some time...")
+                if incrementalProcessing is not None:
+                    incrementalProcessing.resolveDuplicateContainmentOverlap(FILE_IDENTIFIER_OBJECT_SUMMARY, objectCollection, Emma.emma_libs.memoryEntry.ObjectEntry, columnar)
+                else:
+                    Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(objectCollection, Emma.emma_libs.memoryEntry.ObjectEntry, columnar)
+
+            # Storing the consumer collections
+            consumerCollections[FILE_IDENTIFIER_SECTION_SUMMARY] = sectionCollection
+            consumerCollections[FILE_IDENTIFIER_OBJECT_SUMMARY] = objectCollection
+
+            # Creating a common consumerCollection
+            sc().info("Calculating objects in sections. This may take some time...")
+            if incrementalProcessing is not None:
+                consumerCollections[FILE_IDENTIFIER_OBJECTS_IN_SECTIONS] = incrementalProcessing.calculateObjectsInSections(
+                    consumerCollections[FILE_IDENTIFIER_SECTION_SUMMARY],
+                    consumerCollections[FILE_IDENTIFIER_OBJECT_SUMMARY])
+                incrementalProcessing.storeState()
+            else:
+                consumerCollections[FILE_IDENTIFIER_OBJECTS_IN_SECTIONS] = Emma.emma_libs.memoryMap.calculateObjectsInSections(
+                    consumerCollections[FILE_IDENTIFIER_SECTION_SUMMARY],
+                    consumerCollections[FILE_IDENTIFIER_OBJECT_SUMMARY])
+
+        return consumerCollections
+
     def createReports(self, teamscale=False, memVis=False, memVisResolved=False, noprompt=False):
         """
         Creates the reports
@@ -151,34 +233,62 @@ class MemoryManager:
         :param memVisResolved: Create svg report visualising resolved overlaps if True
         :return: None
         """
+        # The concatenated consumerCollections, created by the first report that needs them
+        globalConsumerCollections = None
+
         def consumerCollections2GlobalList():
             """
             Concatenate each type of consumerCollection (memoryContent: dict(list(memEntry)) -> consumerCollection: list(list(memEntry)))
             Concatenates all values (per list (Section_Summary, Object_Summary, Objects_in_Sections)) within the memoryContent dict (-> keys are configIDs)
+            The concatenation is done only once, all the reports share its result, so they must not modify it.
             :return: [list(list(memEntry))] Concatenated list of consumerCollections
             """
-            # Putting the same consumer collection types together
-            # (At this points the collections are grouped by configID then by their types)
-            consumerCollections = {}
-            for configId in self.memoryContent:
-                for collectionType in self.memoryContent[configId]:
-                    if collectionType not in consumerCollections:
-                        consumerCollections[collectionType] = []
-                    consumerCollections[collectionType].extend(self.memoryContent[configId][collectionType])
-            return consumerCollections
-
-        def createStandardReports():
+            nonlocal globalConsumerCollections
+            if globalConsumerCollections is None:
+                # Putting the same consumer collection types together
+                # (At this points the collections are grouped by configID then by their types)
+                collectionsPerType = collections.OrderedDict()
+                for configId in self.memoryContent:
+                    for collectionType in self.memoryContent[configId]:
+                        collectionsPerType.setdefault(collectionType, []).append(self.memoryContent[configId][collectionType])
+                # A collection type that belongs to only one configID does not need to be copied
+                globalConsumerCollections = {collectionType: consumerCollections[0] if len(consumerCollections) == 1 else list(itertools.chain.from_iterable(consumerCollections))
+                                             for collectionType, consumerCollections in collectionsPerType.items()}
+            return globalConsumerCollections
+
+        def createStandardReport(collectionType):
             """
-            Create Section, Object and ObjectsInSections reports
-            :return: None
+            Create a Section, Object or ObjectsInSections report
+            :param collectionType: The type of the consumerCollection the report is created from (e.g. FILE_IDENTIFIER_SECTION_SUMMARY)
+            :return: [str] Path of the stored report
             """
             consumerCollections = consumerCollections2GlobalList()
 
-            # Creating reports from the consumer collections
-            for collectionType in consumerCollections:
-                reportPath = Emma.emma_libs.memoryMap.createReportPath(self.settings.outputPath, self.settings.projectName, collectionType, "csv")
+            # Creating the report from the consumer collection
+            reportPath = Emma.emma_libs.memoryMap.createReportPath(self.settings.outputPath, self.settings.projectName, collectionType, self.settings.reportFormat)
+            if self.settings.reportFormat == REPORT_FORMAT_CSV:
                 Emma.emma_libs.memoryMap.writeReportToDisk(reportPath, consumerCollections[collectionType])
-                sc().info("A report was stored:", os.path.abspath(reportPath))
+            else:
+                Emma.emma_libs.memoryMap.writeTypedReportToDisk(reportPath, consumerCollections[collectionType], self.settings.reportFormat)
+            return reportPath
+
+        def writeReports(reportJobs):
+            """
+            Write the reports. They only read the consumerCollections, so with more than one job they are written concurrently in threads (the writing is mostly I/O bound).
+            The messages about the stored reports are printed in the order of the reportJobs, independent of which report was finished first.
+            :param reportJobs: [list((str, function, tuple))] The message, the function that writes the report and returns its path and the arguments of the function, per report
+            :return: None
+            """
+            # The output folder is created before the threads are started, so they do not try to create it at the same time
+            Emma.shared_libs.emma_helper.mkDirIfNeeded(self.settings.outputPath)
+            if self.settings.jobs > 1 and len(reportJobs) > 1:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.settings.jobs, len(reportJobs))) as executor:
+                    futures = [executor.submit(function, *arguments) for _, function, arguments in reportJobs]
+                    for (message, _, _), future in zip(reportJobs, futures):
+                        sc().info(message, os.path.abspath(future.result()))
+            else:
+                for message, function, arguments in reportJobs:
+                    sc().info(message, os.path.abspath(function(*arguments)))
 
         # def createDotReports():
         #     GLOBAL_ATTRIBUTES = {
@@ -203,6 +313,7 @@ class MemoryManager:
             :param endPoint: End of address area
             :param xScalingValue: Scaling value of x axe, default 1
             :param yScalingValue: Scaling value of y axe, default 1
+            :return: [str] Path of the stored SVG file
             """
             class Element(IntEnum):
                 addressStart = 0
@@ -333,6 +444,8 @@ class MemoryManager:
 
                 return elementsToPlot
 
+            import svgwrite     # pylint: disable=import-outside-toplevel
+                                # Rationale: svgwrite is only needed if the SVG figure (--memVis) was requested.
             imageHeight = 3000      # Define some height of the image
             imageWidth = endPoint - startPoint + 100
             scaling = "scale(" + xScalingValue + ", " + yScalingValue + ")"
@@ -347,12 +460,12 @@ class MemoryManager:
             imageHeight = drawElements(image, getElementsToPlot("Object_Summary"), startPoint, y2, svgwrite.rgb(198, 233, 175), scaling) + 15
             image.update({"height": str(imageHeight * float(yScalingValue)), "width": imageWidth * float(xScalingValue)})
             image.save()
-            sc().info("An SVG file was stored:", os.path.abspath(reportPath))
+            return reportPath
 
         def createTeamScaleReports():
             """
             Write JSON output that can be imported in TeamScale
-            :return: None
+            :return: [str] Path of the stored report
             """
             consumerCollections = consumerCollections2GlobalList()
             resultsLst = []
@@ -374,10 +487,12 @@ class MemoryManager:
                 resultsLst.append({"path": _createTeamScalePath(memEntryRow), "count": memEntryRow.addressLength})
             reportPath = Emma.emma_libs.memoryMap.createReportPath(self.settings.outputPath, self.settings.projectName, TEAMSCALE_PREFIX, "json")
             Emma.shared_libs.emma_helper.writeJson(reportPath, resultsLst)
+            return reportPath
 
         if self.memoryContent is not None:
             # TODO: Implement handling and choosing of which reports to create (via cmd line argument (like a comma separated string) (MSc)
-            createStandardReports()
+            # The reports are collected here and written at the end, so the prompts of the SVG report are not mixed up with the writing
+            reportJobs = [("A report was stored:", createStandardReport, (collectionType,)) for collectionType in consumerCollections2GlobalList()]
             svgReport = False
             if memVis or memVisResolved:
                 svgReport = True
@@ -422,10 +537,12 @@ class MemoryManager:
                     float(yValue)
                 except Exception:
                     yValue = "1"
-                createSvgReport(startRegion, endRegion, xValue, yValue)
+                reportJobs.append(("An SVG file was stored:", createSvgReport, (startRegion, endRegion, xValue, yValue)))
 
             # createDotReports()
             if teamscale:
-                createTeamScaleReports()
+                reportJobs.append(("A report was stored:", createTeamScaleReports, ()))
+            writeReports(reportJobs)
         else:
             sc().error("The mapfiles need to be processed before creating the reports!")
+
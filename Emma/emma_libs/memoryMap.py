@@ -17,90 +17,147 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
 import csv
-import bisect
+import heapq
 import copy
 import datetime
+import collections
 
 from pypiscout.SCout_Logger import Logger as sc
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
+import Emma.emma_libs.memoryColumns
 
 
 # Timestamp for the report file names
 TIMESTAMP = datetime.datetime.now().strftime("%Y-%m-%d-%Hh%Ms%S")
+# Size of the output buffer of the reports in bytes
+REPORT_WRITE_BUFFER_SIZE = 1024 * 1024
+# Number of rows that are created and written at once to the reports
+REPORT_WRITE_BATCH_SIZE = 10000
 
 
-def resolveDuplicateContainmentOverlap(consumerCollection, memEntryHandler):
-    # pylint: disable=too-many-nested-blocks, too-many-branches
-    # Rationale: Because of the complexity of the task this function implements, reducing the number of nested blocks and branches is not possible.
+def resolveDuplicateContainmentOverlap(consumerCollection, memEntryHandler, columnar=False):
+    # pylint: disable=too-many-branches
+    # Rationale: Because of the complexity of the task this function implements, reducing the number of branches is not possible.
     """
     Goes trough the consumerCollection and checks  and resolves all the elements for the following situations:
         - Duplicate
         - Containment
         - Overlap
 
+    The elements are processed with a sweep-line: every element is only compared with the already processed elements that
+    can still interact with it (-> active elements) and with the following elements that start before it ends.
+    The active elements are visited in the order of the consumerCollection and every comparison is done exactly as it would
+    be done by comparing every element with every other element, so the resulting flags and addresses are the same.
+    The runtime is O(n log n + k), where k is the number of element pairs that are interacting with each other.
+    With the columnar backend the groups of elements that can interact with each other are found with NumPy first,
+    and the sweep-line only visits these groups, the elements that do not interact with any other element are skipped.
+
     :param consumerCollection: A list of MemEntry objects. It must be:
                                 * sorted (ASCENDING) based on the startAddress attribute of the elements,
                                 * only contain elements of ONE configID.
                                 The elements of the list will be changed during the processing.
     :param memEntryHandler: A subclass of the MemEntryHandler class.
+    :param columnar: True if the columnar (NumPy) backend shall be used to find the interacting elements, False otherwise.
     :return: None
     """
-    for actualElementIndex, actualElement in enumerate(consumerCollection):
-        for otherElementIndex, otherElement in enumerate(consumerCollection):
-            # Don't compare element with itself and only compare the same configID
-            if actualElementIndex != otherElementIndex:
-
-                # Case 0: actualElement and otherElement are completely separated
-                # Case 0.0: The actualElement begins after the otherElement
-                if (actualElement.addressStart + actualElement.addressLength) <= otherElement.addressStart:
-                    break
-                # Case 0.1: The actualElement begins after the otherElement The otherElement begins only AFTER the actualElement
-                if actualElement.addressStart >= (otherElement.addressStart + otherElement.addressLength):
-                    pass
+    def resolveElementPair(actualElement, otherElement):
+        # pylint: disable=too-many-nested-blocks
+        # Rationale: Because of the complexity of the task this function implements, reducing the number of nested blocks is not possible.
+        """
+        Compares the actualElement with the otherElement and resolves the duplicate, containment and overlap situations of the actualElement.
+        :param actualElement: MemEntry object that is being processed. Its flags and addresses will be changed if needed.
+        :param otherElement: MemEntry object the actualElement will be compared with.
+        :return: True if the otherElement begins after the actualElement, so no further elements need to be compared with it, False otherwise.
+        """
+        # Case 0: actualElement and otherElement are completely separated
+        # Case 0.0: The actualElement begins after the otherElement
+        if (actualElement.addressStart + actualElement.addressLength) <= otherElement.addressStart:
+            return True
+        # Case 0.1: The actualElement begins after the otherElement The otherElement begins only AFTER the actualElement
+        if actualElement.addressStart >= (otherElement.addressStart + otherElement.addressLength):
+            pass
+        else:
+            # Case 1: actualElement and otherElement are duplicates
+            if actualElement.addressStart == otherElement.addressStart and actualElement.addressLength == otherElement.addressLength:
+                # Setting the actualElement´s duplicateFlag if it was not already set
+                if actualElement.duplicateFlag is None:
+                    # Inlining .getFQN() brings additional speed-up
+                    actualElement.duplicateFlag = f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}::{otherElement.objectName}" if otherElement.objectName != "" and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_RESERVE else f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}"
+                # Setting the actualElement to zero addressLength if this was not the first element of the duplicates
+                # This is needed to include only one of the duplicate elements with the real size in the report and not to distort the results
+                if otherElement.duplicateFlag is not None:
+                    actualElement.addressLength = 0
+            else:
+                # Case 2: actualElement contains otherElement
+                if actualElement.addressStart <= otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) >= (otherElement.addressStart + otherElement.addressLength):
+                    actualElement.containingOthersFlag = True
                 else:
-                    # Case 1: actualElement and otherElement are duplicates
-                    if actualElement.addressStart == otherElement.addressStart and actualElement.addressLength == otherElement.addressLength:
-                        # Setting the actualElement´s duplicateFlag if it was not already set
-                        if actualElement.duplicateFlag is None:
+                    # Case 3: actualElement is contained by otherElement
+                    if actualElement.addressStart >= otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) <= (otherElement.addressStart + otherElement.addressLength):
+                        # Setting the actualElement´s containmentFlag if it was not already set
+                        if actualElement.containmentFlag is None:
                             # Inlining .getFQN() brings additional speed-up
-                            actualElement.duplicateFlag = f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}::{otherElement.objectName}" if otherElement.objectName != "" and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_RESERVE else f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}"
-                        # Setting the actualElement to zero addressLength if this was not the first element of the duplicates
-                        # This is needed to include only one of the duplicate elements with the real size in the report and not to distort the results
-                        if otherElement.duplicateFlag is not None:
+                            actualElement.containmentFlag = f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}::{otherElement.objectName}" if otherElement.objectName != "" and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_RESERVE else f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}"
+                            # Setting the actualElement to zero addressLength because this was contained by the otherElement
+                            # This is needed to include only one of these elements with the real size in the report and not to distort the results
                             actualElement.addressLength = 0
                     else:
-                        # Case 2: actualElement contains otherElement
-                        if actualElement.addressStart <= otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) >= (otherElement.addressStart + otherElement.addressLength):
-                            actualElement.containingOthersFlag = True
+                        # Case 4: actualElement overlaps otherElement: otherElement starts inside and ends outside actualElement
+                        if actualElement.addressStart < otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) < (otherElement.addressStart + otherElement.addressLength):
+                            actualElement.overlappingOthersFlag = True
                         else:
-                            # Case 3: actualElement is contained by otherElement
-                            if actualElement.addressStart >= otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) <= (otherElement.addressStart + otherElement.addressLength):
-                                # Setting the actualElement´s containmentFlag if it was not already set
-                                if actualElement.containmentFlag is None:
-                                    # Inlining .getFQN() brings additional speed-up
-                                    actualElement.containmentFlag = f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}::{otherElement.objectName}" if otherElement.objectName != "" and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_RESERVE else f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}"
-                                    # Setting the actualElement to zero addressLength because this was contained by the otherElement
-                                    # This is needed to include only one of these elements with the real size in the report and not to distort the results
-                                    actualElement.addressLength = 0
+                            # Case 5: actualElement is overlapped by otherElement: otherElement starts before and ends inside actualElement
+                            if actualElement.addressStart > otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) > (otherElement.addressStart + otherElement.addressLength):
+                                # Inlining .getFQN() brings additional speed-up
+                                actualElement.overlapFlag =  f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}::{otherElement.objectName}" if otherElement.objectName != "" and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_RESERVE else f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}"
+                                # Adjusting the addresses and length of the actualElement: reducing its size by the overlapping part
+                                newAddressStart = otherElement.addressStart + otherElement.addressLength
+                                sizeOfOverlappingPart = newAddressStart - actualElement.addressStart
+                                actualElement.addressStart = newAddressStart
+                                actualElement.addressLength -= sizeOfOverlappingPart
+                            # Case X: SW error, unhandled case...
                             else:
-                                # Case 4: actualElement overlaps otherElement: otherElement starts inside and ends outside actualElement
-                                if actualElement.addressStart < otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) < (otherElement.addressStart + otherElement.addressLength):
-                                    actualElement.overlappingOthersFlag = True
-                                else:
-                                    # Case 5: actualElement is overlapped by otherElement: otherElement starts before and ends inside actualElement
-                                    if actualElement.addressStart > otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) > (otherElement.addressStart + otherElement.addressLength):
-                                        # Inlining .getFQN() brings additional speed-up
-                                        actualElement.overlapFlag =  f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}::{otherElement.objectName}" if otherElement.objectName != "" and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY and otherElement.objectName != OBJECTS_IN_SECTIONS_SECTION_RESERVE else f"{otherElement.configID}::{otherElement.mapfile}::{otherElement.sectionName}"
-                                        # Adjusting the addresses and length of the actualElement: reducing its size by the overlapping part
-                                        newAddressStart = otherElement.addressStart + otherElement.addressLength
-                                        sizeOfOverlappingPart = newAddressStart - actualElement.addressStart
-                                        actualElement.addressStart = newAddressStart
-                                        actualElement.addressLength -= sizeOfOverlappingPart
-                                    # Case X: SW error, unhandled case...
-                                    else:
-                                        sc().error("MemoryManager::resolveOverlap(): Case X: SW error, unhandled case...")
+                                sc().error("MemoryManager::resolveOverlap(): Case X: SW error, unhandled case...")
+        return False
+
+    if columnar:
+        try:
+            interactingGroups = Emma.emma_libs.memoryColumns.findInteractingGroups(consumerCollection)
+        except OverflowError:
+            sc().debug("The addresses do not fit into the columnar backend, the overlaps will be resolved without it.")
+        else:
+            for beginIndex, endIndex in interactingGroups:
+                resolveDuplicateContainmentOverlap(consumerCollection[beginIndex:endIndex], memEntryHandler)
+            return
+
+    # The already processed elements that can still interact with the following elements, in the order of the consumerCollection
+    # The processed elements are not changed anymore, so they can be dropped as soon as the sweep-line has passed them
+    activeElements = collections.OrderedDict()
+    # Heap of (addressEnd, isZeroLength, index) tuples of the active elements, used to find the ones the sweep-line has passed
+    activeElementsByEnd = []
+
+    for actualElementIndex, actualElement in enumerate(consumerCollection):
+        # Dropping the processed elements that end before the actualElement (or exactly at its start, if they are not zero length)
+        # These cannot interact with the actualElement or with any of the following ones because the consumerCollection is sorted
+        # Zero length elements ending at the start of the actualElement are kept, because they stop the comparisons of zero length elements
+        while activeElementsByEnd and activeElementsByEnd[0][:2] < (actualElement.addressStart, 1):
+            _, _, passedElementIndex = heapq.heappop(activeElementsByEnd)
+            del activeElements[passedElementIndex]
+
+        # Comparing the actualElement with the already processed elements first and then with the following ones, until one of them begins after it
+        for otherElement in activeElements.values():
+            if resolveElementPair(actualElement, otherElement):
+                break
+        else:
+            for otherElementIndex in range(actualElementIndex + 1, len(consumerCollection)):
+                if resolveElementPair(actualElement, consumerCollection[otherElementIndex]):
+                    break
+
+        # The actualElement will not be changed anymore, it becomes an active element for the following ones
+        activeElements[actualElementIndex] = actualElement
+        heapq.heappush(activeElementsByEnd, (actualElement.addressStart + actualElement.addressLength, actualElement.addressLength == 0, actualElementIndex))
 
 
 def calculateObjectsInSections(sectionContainer, objectContainer):
@@ -110,6 +167,8 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
     From sections, new elements will be created:
         - Section entry: A MemEntry object that describes the section but does not use memory space.
         - Section reserve: A MemEntry object that describes the unused part of a section that was not filled up with objects.
+    Every section only visits the objects that were not yet passed by the previous sections and the objects are merged into
+    the section entries and reserves in one pass, so the objectContainer is not scanned again for every section.
 
     :param sectionContainer: A list of MemEntry objects. It must be ordered increasingly based on the startAddress attribute of the elements.
                              The overlapping, containing, duplicate sections must be are already edited and the addresses and lengths corrected.
@@ -117,7 +176,20 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
                             The overlapping, containing, duplicate sections must be are already edited and the addresses and lengths corrected.
     :return: A list of MemEntry objects that contains all the elements of the sectionContainer and the objectContainer.
     """
-    objectsInSections = []
+    return mergeObjectsIntoSections(calculateSectionEntriesAndReserves(sectionContainer, objectContainer), objectContainer)
+
+
+def calculateSectionEntriesAndReserves(sectionContainer, objectContainer):
+    """
+    Creates the section entries and the section reserves of the sections (see calculateObjectsInSections()).
+    The elements created from a section only depend on the section and on the objects that are overlapping it,
+    so this function can be called for any subset of the sections as well.
+    :param sectionContainer: A list of MemEntry objects, see calculateObjectsInSections().
+    :param objectContainer: A list of MemEntry objects, see calculateObjectsInSections().
+    :return: [list(list(MemEntry))] The section entry and the section reserves of every section of the sectionContainer, in the order of the sectionContainer.
+    """
+    # The section entries and reserves are collected per section in the order of the sections, the objects will be merged into them at the end
+    sectionEntriesAndReservesPerSection = []
 
     def createASectionEntry(sourceSection):
         """
@@ -125,10 +197,10 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
         :param sourceSection: MemEntry object to create a section entry from.
         :return: None
         """
-        sectionEntry = copy.deepcopy(sourceSection)
+        sectionEntry = copy.copy(sourceSection)
         sectionEntry.objectName = OBJECTS_IN_SECTIONS_SECTION_ENTRY
         sectionEntry.addressLength = 0
-        objectsInSections.append(sectionEntry)
+        sectionEntriesAndReservesPerSection[-1].append(sectionEntry)
 
     def createASectionReserve(sourceSection, addressEnd=None):
         """
@@ -139,17 +211,17 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
         :return: None
         """
         # If we have received a specific addressEnd then we will use that one and recalculate the size of the section
-        # In this case we need to make a deepcopy of the sourceSection because the SW will continue to work with it
+        # In this case we need to make a copy of the sourceSection because the SW will continue to work with it
         if addressEnd is not None:
-            sourceSectionCopy = copy.deepcopy(sourceSection)
+            sourceSectionCopy = copy.copy(sourceSection)
             sourceSectionCopy.objectName = OBJECTS_IN_SECTIONS_SECTION_RESERVE
             sourceSectionCopy.setAddressesGivenEnd(addressEnd)
-            objectsInSections.append(sourceSectionCopy)
+            sectionEntriesAndReservesPerSection[-1].append(sourceSectionCopy)
         # If not, then the whole sourceSection will be stored as a reserve
         # In this case no copy needed because the SW does not need it anymore
         else:
             sourceSection.objectName = OBJECTS_IN_SECTIONS_SECTION_RESERVE
-            objectsInSections.append(sourceSection)
+            sectionEntriesAndReservesPerSection[-1].append(sourceSection)
 
     def cutOffTheBeginningOfTheSection(sectionToCut, newAddressStart):
         """
@@ -168,8 +240,32 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
                        sectionToCut.configID + "::" + sectionToCut.sectionName + ": The new newAddressStart(" +
                        str(newAddressStart) + ") would cause a cut that is bigger than the addressLength! (" + str(lengthThatWillBeCutOff) + "vs " + str(sectionToCut.addressLengthing) + ")")
 
-    for sectionContainerElement in sectionContainer:
+    # The objects that can fill up the sections, grouped by configID and kept in the order of the objectContainer
+    # Objects with zero length are never filling up a section, so they are left out
+    objectsToFillSections = {}
+    # Heaps of (addressEnd, index) tuples per configID, used to find the objects that end before all the remaining sections
+    objectsToFillSectionsByEnd = {}
+    for objectContainerElementIndex, objectContainerElement in enumerate(objectContainer):
+        if objectContainerElement.addressLength != 0:
+            objectsToFillSections.setdefault(objectContainerElement.configID, collections.OrderedDict())[objectContainerElementIndex] = objectContainerElement
+            objectsToFillSectionsByEnd.setdefault(objectContainerElement.configID, []).append((objectContainerElement.addressStart + objectContainerElement.addressLength, objectContainerElementIndex))
+    for objectsByEnd in objectsToFillSectionsByEnd.values():
+        heapq.heapify(objectsByEnd)
+
+    # The smallest addressStart of the sections (of the same configID) that will be taken apart from this section on
+    # The objects ending before this address are outside of all these sections, so they do not need to be visited anymore
+    remainingSectionsAddressStart = [None] * len(sectionContainer)
+    smallestAddressStartPerConfigID = {}
+    for sectionContainerElementIndex in reversed(range(len(sectionContainer))):
+        sectionContainerElement = sectionContainer[sectionContainerElementIndex]
+        if sectionContainerElement.containmentFlag is None and sectionContainerElement.addressLength != 0:
+            if sectionContainerElement.configID not in smallestAddressStartPerConfigID or sectionContainerElement.addressStart < smallestAddressStartPerConfigID[sectionContainerElement.configID]:
+                smallestAddressStartPerConfigID[sectionContainerElement.configID] = sectionContainerElement.addressStart
+        remainingSectionsAddressStart[sectionContainerElementIndex] = smallestAddressStartPerConfigID.get(sectionContainerElement.configID)
+
+    for sectionContainerElementIndex, sectionContainerElement in enumerate(sectionContainer):
         # Creating a section entry
+        sectionEntriesAndReservesPerSection.append([])
         createASectionEntry(sectionContainerElement)
 
         # We will skip the sections that are contained by other sections or have a zero length
@@ -180,14 +276,20 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
 
         # This is the section we are working with in this loop. We will take it apart and create other objects from it.
         # In order not to have any influence on the original sectionContainer elements, we will create a copy of it
-        sectionCopy = copy.deepcopy(sectionContainerElement)
-
-        for objectContainerElement in objectContainer:
-            # We will skip the objects if:
-            #   - is not belonging to the same configID as the section
-            #   - or have a zero length or
-            #   - if it ends before this section, because it means that this object is outside the section.
-            if sectionCopy.configID != objectContainerElement.configID or objectContainerElement.addressLength == 0 or sectionCopy.addressStart >= (objectContainerElement.addressStart + objectContainerElement.addressLength):
+        # A shallow copy is enough, since only the addresses and the names of the copies are changed and these are replaced, not modified
+        sectionCopy = copy.copy(sectionContainerElement)
+
+        # Dropping the objects that end before this and all the remaining sections of the configID
+        objectsOfThisConfigID = objectsToFillSections.get(sectionCopy.configID, {})
+        objectsOfThisConfigIDByEnd = objectsToFillSectionsByEnd.get(sectionCopy.configID, [])
+        while objectsOfThisConfigIDByEnd and objectsOfThisConfigIDByEnd[0][0] <= remainingSectionsAddressStart[sectionContainerElementIndex]:
+            _, passedObjectIndex = heapq.heappop(objectsOfThisConfigIDByEnd)
+            del objectsOfThisConfigID[passedObjectIndex]
+
+        for objectContainerElement in objectsOfThisConfigID.values():
+            # We will skip the objects if it ends before this section, because it means that this object is outside the section.
+            # (The objects belonging to other configIDs or having a zero length were already left out.)
+            if sectionCopy.addressStart >= (objectContainerElement.addressStart + objectContainerElement.addressLength):
                 continue
 
             # Case 0: The object is completely overlapping the section
@@ -251,11 +353,30 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
         if sectionCopy is not None:
             createASectionReserve(sectionCopy, None)
 
-    # We will need to add all the objects to the objectsInSections
+    return sectionEntriesAndReservesPerSection
+
+
+def mergeObjectsIntoSections(sectionEntriesAndReservesPerSection, objectContainer):
+    """
+    Merges the objects into the section entries and reserves (see calculateObjectsInSections()).
+    :param sectionEntriesAndReservesPerSection: The section entries and reserves per section, see calculateSectionEntriesAndReserves().
+    :param objectContainer: A list of MemEntry objects, see calculateObjectsInSections().
+    :return: A list of MemEntry objects that contains the section entries and reserves and the copies of the objects.
+    """
+    sectionEntriesAndReserves = [sectionEntryOrReserve for entriesAndReservesOfSection in sectionEntriesAndReservesPerSection for sectionEntryOrReserve in entriesAndReservesOfSection]
+
+    # We will need to merge all the objects into the section entries and reserves
+    # Every object is placed after the section entries and reserves that start before or at the same address as the object
+    # The addresses of the objects may have been changed by the overlap resolution, so they are (stable) sorted first; this is linear for the already sorted parts
     # In order not to have any influence on the original objectContainer elements, we will create a copy of the elements
-    for objectContainerElement in objectContainer:
-        index = bisect.bisect_right(objectsInSections, objectContainerElement)
-        objectsInSections.insert(index, copy.deepcopy(objectContainerElement))
+    objectsInSections = []
+    sectionEntriesAndReservesIndex = 0
+    for objectContainerElement in sorted(objectContainer, key=lambda memEntry: memEntry.addressStart):
+        while sectionEntriesAndReservesIndex < len(sectionEntriesAndReserves) and sectionEntriesAndReserves[sectionEntriesAndReservesIndex].addressStart <= objectContainerElement.addressStart:
+            objectsInSections.append(sectionEntriesAndReserves[sectionEntriesAndReservesIndex])
+            sectionEntriesAndReservesIndex += 1
+        objectsInSections.append(copy.copy(objectContainerElement))
+    objectsInSections.extend(sectionEntriesAndReserves[sectionEntriesAndReservesIndex:])
 
     return objectsInSections
 
@@ -278,26 +399,82 @@ def collectCompilerSpecificHeaders(consumerCollection):
     """
     Function to create a list of the headers that the compiler specific data of a consumer collection has.
     :param consumerCollection: The consumer collection that has elements with compiler specific data.
-    :return: List of strings.
+    :return: List of strings, in the order in which the headers first occur in the collection.
     """
-    collectedHeaders = []
+    # The keys of an OrderedDict keep the order of their first occurrence and can be looked up in constant time
+    collectedHeaders = collections.OrderedDict()
 
     for element in consumerCollection:
-        for key in element.compilerSpecificData.keys():
-            if key not in collectedHeaders:
-                collectedHeaders.append(key)
+        collectedHeaders.update(dict.fromkeys(element.compilerSpecificData))
 
-    return collectedHeaders
+    return list(collectedHeaders)
 
 
 def writeReportToDisk(reportPath, consumerCollection):
     """
     Writes the consumerCollection containing MemEntry objects to a CSV file.
+    The values are formatted column by column in batches and written by the csv module through a large output buffer.
     :param reportPath: A path of the CSV that needs to be created.
     :param consumerCollection: A list of MemEntry objects.
     """
-    # Opening the file
-    with open(reportPath, "w") as fp:
+    def toHumanReadable(addressLength):
+        """
+        Function to convert an addressLength to the human readable format. Every distinct value is converted only once.
+        :param addressLength: The addressLength that will be converted.
+        :return: The formatted string.
+        """
+        result = humanReadableLengths.get(addressLength)
+        if result is None:
+            result = Emma.shared_libs.emma_helper.toHumanReadable(addressLength)
+            humanReadableLengths[addressLength] = result
+        return result
+
+    def createBatchColumns(rows):
+        """
+        Function to create the columns of the CSV file for a batch of rows. The values are formatted column by column, the csv module writes None as an empty value.
+        :param rows: The list of the MemEntry objects of the batch.
+        :return: The list of the columns, every column is a list of the values of the rows, in the order of the headers.
+        """
+        isSectionEntry = [row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY for row in rows]
+        # The original values are shown for the section entries and if duplicate, containment or overlap occured
+        showOriginal = [sectionEntry or bool(row.overlapFlag or row.containmentFlag or row.duplicateFlag) for sectionEntry, row in zip(isSectionEntry, rows)]
+        hideAddresses = [sectionEntry or (changed and row.addressLength == 0) for sectionEntry, changed, row in zip(isSectionEntry, showOriginal, rows)]
+        columns = [
+            ["" if hide else hex(row.addressStart) for hide, row in zip(hideAddresses, rows)],
+            ["" if hide or row.addressLength <= 0 else hex(row.addressStart + row.addressLength - 1) for hide, row in zip(hideAddresses, rows)],
+            ["" if sectionEntry else hex(row.addressLength) for sectionEntry, row in zip(isSectionEntry, rows)],
+            ["" if hide else row.addressStart for hide, row in zip(hideAddresses, rows)],
+            ["" if hide or row.addressLength <= 0 else row.addressStart + row.addressLength - 1 for hide, row in zip(hideAddresses, rows)],
+            ["" if sectionEntry else row.addressLength for sectionEntry, row in zip(isSectionEntry, rows)],
+            ["" if sectionEntry else toHumanReadable(row.addressLength) for sectionEntry, row in zip(isSectionEntry, rows)],
+            [row.sectionName for row in rows],
+            [row.objectName for row in rows],
+            [row.configID for row in rows]
+        ]
+        for compilerSpecificHeader in compilerSpecificHeaders:
+            columns.append([row.compilerSpecificData.get(compilerSpecificHeader, "") for row in rows])
+        columns.extend([
+            [row.memType for row in rows],
+            [row.memTypeTag for row in rows],
+            [row.category for row in rows],
+            [row.mapfile for row in rows],
+            [row.overlapFlag for row in rows],
+            [row.containmentFlag for row in rows],
+            [row.duplicateFlag for row in rows],
+            [row.containingOthersFlag for row in rows],
+            # Addresses and lengths are modified in case of overlapping, containment and duplication so we will post the original values so that the changes can be seen
+            [row.addressStartHexOriginal() if show else "" for show, row in zip(showOriginal, rows)],
+            [row.addressEndHexOriginal() if show else "" for show, row in zip(showOriginal, rows)],
+            [row.addressLengthHexOriginal() if show else "" for show, row in zip(showOriginal, rows)],
+            [row.addressLengthOriginal if show else "" for show, row in zip(showOriginal, rows)],
+            [row.getFQN() for row in rows]
+        ])
+        return columns
+
+    humanReadableLengths = {}
+
+    # Opening the file with a large buffer, so the rows are written to the disk in big chunks
+    with open(reportPath, "w", buffering=REPORT_WRITE_BUFFER_SIZE) as fp:
         # The writer object that will be used for creating the CSV data
         writer = csv.writer(fp, delimiter=";", lineterminator="\n")
 
@@ -314,47 +491,80 @@ def writeReportToDisk(reportPath, consumerCollection):
         # Writing the headers to the CSV file
         writer.writerow(headers)
 
-        # Writing the data lines to the file
-        for row in consumerCollection:
-            # Flag for report creation if duplicate, containment or overlap occured
-            duplicateContainmentOverlapHappened = True if any([row.overlapFlag, row.containmentFlag, row.duplicateFlag]) else False
-            # Collecting the first part of the static data for the current row
-            rowData = [
-                "" if (row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY or duplicateContainmentOverlapHappened and row.addressLength == 0) else row.addressStartHex(),
-                "" if (row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY or duplicateContainmentOverlapHappened and row.addressLength == 0) else row.addressEndHex(),
-                "" if (row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY) else row.addressLengthHex(),
-                "" if (row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY or duplicateContainmentOverlapHappened and row.addressLength == 0) else row.addressStart,
-                "" if (row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY or duplicateContainmentOverlapHappened and row.addressLength == 0) else row.addressEnd(),
-                row.addressLength if (row.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY) else "",
-                Emma.shared_libs.emma_helper.toHumanReadable(row.addressLength) if (row.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY) else "",
-                row.sectionName,
-                row.objectName,
-                row.configID
-            ]
-
-            # Extending it with the data part of the compiler specific data pairs of this MemEntry object
-            for compilerSpecificHeader in compilerSpecificHeaders:
-                rowData.append(row.compilerSpecificData[compilerSpecificHeader] if compilerSpecificHeader in row.compilerSpecificData else "")
-
-            # Collecting the rest of the static data for the current row
-            rowData.extend([
-                row.memType,
-                row.memTypeTag,
-                row.category,
-                row.mapfile,
-                row.overlapFlag,
-                row.containmentFlag,
-                row.duplicateFlag,
-                row.containingOthersFlag,
-                # Addresses are modified in case of overlapping so we will post the original values so that the changes can be seen
-                row.addressStartHexOriginal() if ((row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY) or duplicateContainmentOverlapHappened) else "",
-                row.addressEndHexOriginal() if ((row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY) or duplicateContainmentOverlapHappened) else "",
-                # Lengths are modified in case of overlapping, containment and duplication so we will post the original values so that the changes can be seen
-                row.addressLengthHexOriginal() if ((row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY) or duplicateContainmentOverlapHappened) else "",
-                row.addressLengthOriginal if ((row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY) or duplicateContainmentOverlapHappened) else "",
-                # FQN
-                row.getFQN()
-            ])
-            # Writing the data to the file
-
-            writer.writerow(rowData)
+        # Writing the data lines to the file in batches
+        for batchStart in range(0, len(consumerCollection), REPORT_WRITE_BATCH_SIZE):
+            writer.writerows(zip(*createBatchColumns(consumerCollection[batchStart:batchStart + REPORT_WRITE_BATCH_SIZE])))
+
+
+def createReportDataFrame(consumerCollection):
+    """
+    Creates a pandas DataFrame from the consumerCollection with the same columns as the CSV reports (see writeReportToDisk()).
+    Unlike in the CSV reports, the columns are typed: the decimal addresses and lengths are nullable integers
+    and the values that are empty in the CSV reports are missing values (None / NA).
+    :param consumerCollection: A list of MemEntry objects.
+    :return: [pandas.DataFrame] The report data.
+    """
+    def createColumn(values):
+        """
+        Function to create a column that can be stored in a typed file format, where every value of a column must have the same type.
+        :param values: The values of the column, None for the missing values.
+        :return: The values, converted to string if the values have more than one type.
+        """
+        valueTypes = {type(value) for value in values if value is not None}
+        return values if len(valueTypes) <= 1 else [str(value) if value is not None else None for value in values]
+
+    import pandas       # pylint: disable=import-outside-toplevel
+                        # Rationale: pandas is only needed for the typed report formats, the CSV reports are written without it.
+    isSectionEntry = [row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY for row in consumerCollection]
+    # The original values are shown for the section entries and if duplicate, containment or overlap occured
+    showOriginal = [sectionEntry or bool(row.overlapFlag or row.containmentFlag or row.duplicateFlag) for sectionEntry, row in zip(isSectionEntry, consumerCollection)]
+    hideAddresses = [sectionEntry or (changed and row.addressLength == 0) for sectionEntry, changed, row in zip(isSectionEntry, showOriginal, consumerCollection)]
+    addressEnds = [None if hide else row.addressEnd() for hide, row in zip(hideAddresses, consumerCollection)]
+
+    columns = collections.OrderedDict()
+    columns[ADDR_START_HEX] = [None if hide else hex(row.addressStart) for hide, row in zip(hideAddresses, consumerCollection)]
+    columns[ADDR_END_HEX] = [None if addressEnd is None else hex(addressEnd) for addressEnd in addressEnds]
+    columns[SIZE_HEX] = [None if sectionEntry else hex(row.addressLength) for sectionEntry, row in zip(isSectionEntry, consumerCollection)]
+    columns[ADDR_START_DEC] = pandas.array([None if hide else row.addressStart for hide, row in zip(hideAddresses, consumerCollection)], dtype="Int64")
+    columns[ADDR_END_DEC] = pandas.array(addressEnds, dtype="Int64")
+    columns[SIZE_DEC] = pandas.array([None if sectionEntry else row.addressLength for sectionEntry, row in zip(isSectionEntry, consumerCollection)], dtype="Int64")
+    columns[SIZE_HUMAN_READABLE] = [None if sectionEntry else Emma.shared_libs.emma_helper.toHumanReadable(row.addressLength) for sectionEntry, row in zip(isSectionEntry, consumerCollection)]
+    columns[SECTION_NAME] = [row.sectionName for row in consumerCollection]
+    columns[OBJECT_NAME] = [row.objectName for row in consumerCollection]
+    columns[CONFIG_ID] = [row.configID for row in consumerCollection]
+    for compilerSpecificHeader in collectCompilerSpecificHeaders(consumerCollection):
+        columns[compilerSpecificHeader] = createColumn([row.compilerSpecificData.get(compilerSpecificHeader) for row in consumerCollection])
+    columns[MEM_TYPE] = [row.memType for row in consumerCollection]
+    columns[MEM_TYPE_TAG] = [row.memTypeTag for row in consumerCollection]
+    columns[CATEGORY] = [row.category for row in consumerCollection]
+    columns[MAPFILE] = [row.mapfile for row in consumerCollection]
+    columns[OVERLAP_FLAG] = createColumn([row.overlapFlag for row in consumerCollection])
+    columns[CONTAINMENT_FLAG] = createColumn([row.containmentFlag for row in consumerCollection])
+    columns[DUPLICATE_FLAG] = createColumn([row.duplicateFlag for row in consumerCollection])
+    columns[CONTAINING_OTHERS_FLAG] = createColumn([row.containingOthersFlag for row in consumerCollection])
+    columns[ADDR_START_HEX_ORIGINAL] = [row.addressStartHexOriginal() if show else None for show, row in zip(showOriginal, consumerCollection)]
+    columns[ADDR_END_HEX_ORIGINAL] = [(row.addressEndHexOriginal() or None) if show else None for show, row in zip(showOriginal, consumerCollection)]
+    columns[SIZE_HEX_ORIGINAL] = [row.addressLengthHexOriginal() if show else None for show, row in zip(showOriginal, consumerCollection)]
+    columns[SIZE_DEC_ORIGINAL] = pandas.array([row.addressLengthOriginal if show else None for show, row in zip(showOriginal, consumerCollection)], dtype="Int64")
+    columns[FQN] = [row.getFQN() for row in consumerCollection]
+    return pandas.DataFrame(columns)
+
+
+def writeTypedReportToDisk(reportPath, consumerCollection, reportFormat):
+    """
+    Writes the consumerCollection containing MemEntry objects to a typed, columnar file (see createReportDataFrame()).
+    :param reportPath: A path of the file that needs to be created.
+    :param consumerCollection: A list of MemEntry objects.
+    :param reportFormat: REPORT_FORMAT_PARQUET or REPORT_FORMAT_FEATHER.
+    :return: None
+    """
+    reportData = createReportDataFrame(consumerCollection)
+    try:
+        if reportFormat == REPORT_FORMAT_PARQUET:
+            reportData.to_parquet(reportPath, index=False)
+        elif reportFormat == REPORT_FORMAT_FEATHER:
+            reportData.to_feather(reportPath)
+        else:
+            sc().error(f"The report format `{reportFormat}` is not supported for typed reports!")
+    except ImportError as exception:
+        sc().error(f"The {reportFormat} report format needs the pyarrow package (`pip3 install pyarrow`): {exception}")
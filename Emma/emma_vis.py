@@ -18,31 +18,41 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 
 # Emma Memory and Mapfile Analyser - visualiser
 
-import gc
 import sys
 import os
 import timeit
 import datetime
 import argparse
-import pandas
 
 from pypiscout.SCout_Logger import Logger as sc
 
 import Emma
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
-import Emma.emma_vis_libs.dataVisualiserSections
-import Emma.emma_vis_libs.dataVisualiserObjects
-import Emma.emma_vis_libs.dataVisualiserCategorisedSections
-import Emma.emma_vis_libs.dataVisualiserMemoryMap
-import Emma.emma_vis_libs.dataReports
 import Emma.emma_vis_libs.helper
 
 
-# Set display settings for unwrapped console output (pandas)
-pandas.set_option('display.max_rows', 500)
-pandas.set_option('display.max_columns', 500)
-pandas.set_option('display.expand_frame_repr', False)
+def importVisualiserLibraries():
+    """
+    Imports the visualiser libraries. These import pandas and matplotlib, which take long to import,
+    so they are imported only when the visualiser runs and not when only the arguments are parsed (e.g. `--help` or the top level Emma.py).
+    :return: None
+    """
+    # pylint: disable=import-outside-toplevel, redefined-outer-name
+    # Rationale: The imports are deferred on purpose, the imported modules are accessed through the Emma package afterwards.
+    import pandas
+    import Emma.emma_vis_libs.dataVisualiser
+    import Emma.emma_vis_libs.dataVisualiserSections
+    import Emma.emma_vis_libs.dataVisualiserObjects
+    import Emma.emma_vis_libs.dataVisualiserCategorisedSections
+    import Emma.emma_vis_libs.dataVisualiserMemoryMap
+    import Emma.emma_vis_libs.dataReports
+    import Emma.emma_vis_libs.figureRenderer
+
+    # Set display settings for unwrapped console output (pandas)
+    pandas.set_option('display.max_rows', 500)
+    pandas.set_option('display.max_columns', 500)
+    pandas.set_option('display.expand_frame_repr', False)
 
 
 def initParser():
@@ -123,6 +133,13 @@ def initParser():
         action="store_true",
         default=False
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        help="Number of worker processes used to render the figures in parallel.",
+        default=1,
+        type=int,
+    )
     return parser
 
 
@@ -170,11 +187,14 @@ def processArguments(arguments):
             Emma.shared_libs.emma_helper.checkIfFolderExists(joinedInputPath)
             arguments.inOutPath = joinedInputPath
 
+    if arguments.jobs < 1:
+        sc().error("The number of jobs (`--jobs`) must be at least 1!")
+
     # Clean-up paths
     del arguments.subDir
     del arguments.inOutDir
 
-    return arguments.verbosity, arguments.inOutPath, arguments.quiet, arguments.append, arguments.noprompt, arguments.projectDir, arguments.categorisedImageCsv, arguments.overview, arguments.Werror
+    return arguments.verbosity, arguments.inOutPath, arguments.quiet, arguments.append, arguments.noprompt, arguments.projectDir, arguments.categorisedImageCsv, arguments.overview, arguments.Werror, arguments.jobs
 
 
 def main(arguments):
@@ -183,7 +203,7 @@ def main(arguments):
     :param arguments: parsed arguments
     :return: None
     """
-    verbosity, inOutPath, quiet, append, noprompt, projectDir, categorised_image_csv, overview, Werror = processArguments(arguments)
+    verbosity, inOutPath, quiet, append, noprompt, projectDir, categorised_image_csv, overview, Werror, jobs = processArguments(arguments)
 
     # Setup SCout
     sc(invVerbosity=verbosity, actionWarning=(lambda: sys.exit(-10) if Werror is not None else None), actionError=lambda: sys.exit(-10))
@@ -194,6 +214,8 @@ def main(arguments):
     TIME_START = timeit.default_timer()
     sc().info("Started processing at", datetime.datetime.now().strftime("%H:%M:%S"))
 
+    importVisualiserLibraries()
+
     imageFile = Emma.emma_vis_libs.helper.getLastModFileOrPrompt(FILE_IDENTIFIER_SECTION_SUMMARY, inOutPath, quiet, append, noprompt)
     moduleFile = Emma.emma_vis_libs.helper.getLastModFileOrPrompt(FILE_IDENTIFIER_OBJECT_SUMMARY, inOutPath, quiet, append, noprompt)
     objectsInSectionsFile = Emma.emma_vis_libs.helper.getLastModFileOrPrompt(FILE_IDENTIFIER_OBJECTS_IN_SECTIONS, inOutPath, quiet, append, noprompt)
@@ -202,33 +224,36 @@ def main(arguments):
 
     Emma.shared_libs.emma_helper.mkDirIfNeeded(resultsPath)
 
+    # The reports and the budgets are read only once and shared by the visualisers
+    memStatsData = Emma.emma_vis_libs.dataVisualiser.MemStatsData(projectPath=projectDir)
+
+    # The figures are only saved to disk, so they are rendered with the headless backend
+    Emma.emma_vis_libs.figureRenderer.initRendering()
+
     # Init classes for summaries
     sc().info("Analysing", objectsInSectionsFile)
-    consumptionObjectsInSections = Emma.emma_vis_libs.dataVisualiserMemoryMap.MemoryMap(projectPath=projectDir, fileToUse=objectsInSectionsFile, resultsPath=resultsPath)
-    consumptionObjectsInSections.plotPieChart(plotShow=False)
+    consumptionObjectsInSections = Emma.emma_vis_libs.dataVisualiserMemoryMap.MemoryMap(projectPath=projectDir, fileToUse=objectsInSectionsFile, resultsPath=resultsPath, memStatsData=memStatsData)
 
     # Image Summary object
     sc().info("Analysing", imageFile)
-    consumptionImage = Emma.emma_vis_libs.dataVisualiserSections.ImageConsumptionList(projectPath=projectDir, fileToUse=imageFile, resultsPath=resultsPath)
+    consumptionImage = Emma.emma_vis_libs.dataVisualiserSections.ImageConsumptionList(projectPath=projectDir, fileToUse=imageFile, resultsPath=resultsPath, memStatsData=memStatsData)
 
     # Module Summary object
     sc().info("Analysing", moduleFile)
     try:
-        consumptionModule = Emma.emma_vis_libs.dataVisualiserObjects.ModuleConsumptionList(projectPath=projectDir, fileToUse=moduleFile, resultsPath=resultsPath)
+        consumptionModule = Emma.emma_vis_libs.dataVisualiserObjects.ModuleConsumptionList(projectPath=projectDir, fileToUse=moduleFile, resultsPath=resultsPath, memStatsData=memStatsData)
     except ValueError:
         sc().error("Data does not contain any module/object entry - exiting...")
 
     # Object for visualisation fo image and module summary
     categorisedImage = Emma.emma_vis_libs.dataVisualiserCategorisedSections.CategorisedImageConsumptionList(resultsPath=resultsPath, projectPath=projectDir, statsTimestamp=consumptionImage.statsTimestamp, imageSumObj=consumptionImage, moduleSumObj=consumptionModule)
 
-    # Do prints and plots
-    consumptionImage.plotByMemType(plotShow=False)
-
-    # Prevent out of memory errors (-> `AssertionError: Unexpected exception: In RendererAgg: Out of memory`)
-    gc.collect()
+    # Collect the figures, they are rendered together after the aggregations were done
+    renderJobs = consumptionObjectsInSections.getPieChartRenderJobs()
+    renderJobs.append(consumptionImage.getRenderJobByMemType())
 
-    sc().info("\n", consumptionImage.calcConsumptionByMemType())
-    sc().info("\n", consumptionImage.calcConsumptionByMemTypeDetailed())
+    sc().info("\n", Emma.emma_vis_libs.dataVisualiser.consumptionToString(consumptionImage.calcConsumptionByMemType()))
+    sc().info("\n", Emma.emma_vis_libs.dataVisualiser.consumptionToString(consumptionImage.calcConsumptionByMemTypeDetailed()))
 
     # FIXME: Deactivated; colours of legend in figure not correct - possibly this figure is not even needed/useful (MSc)
     # categorisedImage.plotNdisplay(plotShow=False)
@@ -242,13 +267,20 @@ def main(arguments):
         sc().info("Appending report...")
         consumptionImage.writeReportToFile()
         report = Emma.emma_vis_libs.dataReports.Reports(projectPath=projectDir)
-        report.plotNdisplay(plotShow=False)
+        renderJobs.extend(report.getRenderJobs())
+
+    if overview:
+        renderJobs.append(consumptionModule.getRenderJobByCategorisedModules())
+
+    # Render the figures; every figure is closed once it was saved, so the memory use does not grow with the number of figures
+    sc().info("Rendering figures...")
+    Emma.emma_vis_libs.figureRenderer.renderFigures(renderJobs, jobs)
 
     # Create a Markdown overview document and add all parts to it
     if overview:
         sc().info("Generating markdown report...")
-        markdownFilePath = consumptionImage.createMarkdownOverview()
-        consumptionModule.appendModuleConsumptionToMarkdownOverview(markdownFilePath)
+        markdownFilePath = consumptionImage.createMarkdownOverview(plotFigure=False)
+        consumptionModule.appendModuleConsumptionToMarkdownOverview(markdownFilePath, plotFigure=False)
         consumptionImage.appendSupplementToMarkdownOverview(markdownFilePath)
         sc().info("Generating html report...")
         Emma.shared_libs.emma_helper.convertMarkdownFileToHtmlFile(markdownFilePath, (os.path.splitext(markdownFilePath)[0] + ".html"))
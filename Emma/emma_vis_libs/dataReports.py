@@ -31,6 +31,7 @@ from Emma import shared_libs
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
+import Emma.emma_vis_libs.figureRenderer
 
 
 class Reports:
@@ -40,38 +41,57 @@ class Reports:
         self.reportFilePath = Emma.shared_libs.emma_helper.joinPath(projectPath, "results", self.project + "-Memory_Report_by_configID-memType.csv")
         self.data = pandas.read_csv(self.reportFilePath, sep=";").drop_duplicates(subset=[TIMESTAMP, CONFIG_ID, MEM_TYPE])  # TODO: This is a temporary fix, we actually want to not append duplicates to the csv in the first place (FM)
 
-    def plotNdisplay(self, plotShow=True):
-        grouped = self.data.groupby([CONFIG_ID])
-        for configID in grouped.indices:
-            groupedByConfigID = grouped.get_group(configID).groupby([MEM_TYPE, TIMESTAMP]).sum()
+    def getRenderJobs(self):
+        """
+        Function to get the render jobs of the memory report figures per configID, drawn by drawMemoryReport() (see figureRenderer)
+        :return: list of the render jobs
+        """
+        renderJobs = []
+        for configID, dataOfConfigID in self.data.groupby(CONFIG_ID):
+            groupedByConfigID = dataOfConfigID.groupby([MEM_TYPE, TIMESTAMP]).sum()
             groupedByConfigID = groupedByConfigID.reset_index()
 
-            labels = []
-            fig, ax = matplotlib.pyplot.subplots()
-            for key, grp in groupedByConfigID.groupby([MEM_TYPE]):
-                labels.append(grp.memType.unique()[0])
-                grp = grp.drop([MEM_TYPE], axis=1)
-                title = "Memory Report - " + self.project + ": " + configID
-                ax = grp.plot(kind="line",
-                              title=title,
-                              ax=ax,
-                              x=TIMESTAMP,
-                              y="used [%]",
-                              figsize=(16, 6),
-                              rot=90,
-                              stacked=True)
-
-            matplotlib.pyplot.legend(labels=labels,  # Set labels
-                                     bbox_to_anchor=(0., -0.2, 1., .102),  # Location of legend
-                                     loc="lower right",  # Location of legend
-                                     ncol=4,  # Number of columns
-                                     mode="expand",  # Span the legend across the whole figure
-                                     fontsize="medium")  # Set font size
-
-            matplotlib.pyplot.ylabel("used [%]")
-
+            title = "Memory Report - " + self.project + ": " + configID
             filename = self.project + "_Memory_Report_" + configID + ".png"
-            matplotlib.pyplot.savefig(shared_libs.emma_helper.joinPath(self.projectPath, "results", filename), dpi=MEMORY_ESTIMATION_PICTURE_DPI, transparent=False, bbox_inches="tight")
+            renderJobs.append((drawMemoryReport,
+                               {"groupedByConfigID": groupedByConfigID, "title": title},
+                               shared_libs.emma_helper.joinPath(self.projectPath, "results", filename),
+                               {"dpi": MEMORY_ESTIMATION_PICTURE_DPI, "transparent": False, "bbox_inches": "tight"}))
+        return renderJobs
 
-            if plotShow:
-                matplotlib.pyplot.show()  # Show plots after results in console output are shown
+    def plotNdisplay(self, plotShow=True):
+        for renderJob in self.getRenderJobs():
+            Emma.emma_vis_libs.figureRenderer.renderFigure(*renderJob, show=plotShow)  # Show plots after results in console output are shown
+
+
+def drawMemoryReport(groupedByConfigID, title):
+    """
+    Draws the line graph of the used memory of a configID over the timestamps of the memory report
+    :param groupedByConfigID: pandas DataFrame of the memory report of the configID, grouped by memType and timestamp
+    :param title: Title of the figure
+    :return: the figure (=figure object)
+    """
+    labels = []
+    fig, ax = matplotlib.pyplot.subplots()
+    for key, grp in groupedByConfigID.groupby([MEM_TYPE]):
+        labels.append(grp.memType.unique()[0])
+        grp = grp.drop([MEM_TYPE], axis=1)
+        ax = grp.plot(kind="line",
+                      title=title,
+                      ax=ax,
+                      x=TIMESTAMP,
+                      y="used [%]",
+                      figsize=(16, 6),
+                      rot=90,
+                      stacked=True)
+
+    ax.legend(labels=labels,  # Set labels
+              bbox_to_anchor=(0., -0.2, 1., .102),  # Location of legend
+              loc="lower right",  # Location of legend
+              ncol=4,  # Number of columns
+              mode="expand",  # Span the legend across the whole figure
+              fontsize="medium")  # Set font size
+
+    ax.set_ylabel("used [%]")
+
+    return fig
@@ -75,17 +75,91 @@ def getConfigIDsFromDf(dataframe):
     return [configID[0] for configID in configIDs]
 
 
+def consumptionToString(consumption):
+    """
+    Function to convert a consumption table to a string for the console output and the overview
+    The float format is only set for this conversion, so the result does not depend on the global pandas display options
+    :param consumption: pandas DataFrame
+    :return: The table as string; the floats are written with thousands separators and without decimals
+    """
+    with pandas.option_context("display.float_format", "{:14,.0f}".format):
+        return consumption.to_string()
+
+
+class MemStatsData:
+    """
+    Class holding the data of the memStats reports and of the budgets of a project.
+    Every report is read only once, on its first use, and the same DataFrame is shared by all the visualisers that use the report.
+    The shared DataFrames must not be modified in place by the visualisers.
+    """
+    def __init__(self, projectPath):
+        self.projectPath = projectPath
+        self.budgets = None
+        self.projectThreshold = None
+        self.__reports = {}
+        self.__resolvedReports = {}
+        self.__readBudgets()
+
+    def __readBudgets(self):
+        """
+        Reads the budgets.json file
+        :return: nothing
+        """
+        filepath = Emma.shared_libs.emma_helper.joinPath(self.projectPath, "budgets.json")
+        try:
+            with open(filepath, "r") as fp:
+                budgets = json.load(fp)
+        except FileNotFoundError:
+            sc().error(f"The file `{os.path.abspath(filepath)}` was not found!")
+        except json.JSONDecodeError:
+            sc().error(f"JSON syntax error in `{os.path.abspath(filepath)}`!")
+
+        self.budgets = budgets["Budgets"]
+        self.projectThreshold = budgets["Project Threshold in %"]
+
+    def getReport(self, reportPath):
+        """
+        Function to get the content of a report, it is read from the disk with the first call.
+        :param reportPath: Path of the report (.csv, .parquet or .feather).
+        :return: [pandas.DataFrame] The content of the report, indexed by its addrStartDec column.
+        """
+        if reportPath not in self.__reports:
+            # Only the columns the visualisers use are read
+            self.__reports[reportPath] = Emma.shared_libs.emma_helper.readReport(reportPath, VISUALISER_COLUMNS)
+        return self.__reports[reportPath]
+
+    def getResolvedReport(self, reportPath):
+        """
+        Function to get the content of a report without the contained, duplicate and overlapped entries (see removeDataWithFlags()).
+        The entries are removed only once per report.
+        :param reportPath: Path of the report.
+        :return: [pandas.DataFrame] The resolved content of the report.
+        """
+        if reportPath not in self.__resolvedReports:
+            self.__resolvedReports[reportPath] = removeDataWithFlags(self.getReport(reportPath))
+        return self.__resolvedReports[reportPath]
+
+
 class Visualiser:
     """
     Abstract class for reading and holding the data from memStats .csv and budget files
     """
-    def __init__(self, fileToUse, resultsPath, projectPath):
+    def __init__(self, fileToUse, resultsPath, projectPath, memStatsData=None):
+        """
+        :param fileToUse: Path of the memStats report the visualiser uses.
+        :param resultsPath: Path of the folder where the results are stored.
+        :param projectPath: Path of the project folder.
+        :param memStatsData: [MemStatsData] The shared data of the project, if None then the visualiser reads the data on its own.
+        """
         self.projectPath = projectPath
         self.project = os.path.split(projectPath)[-1]
         self.memStatsFile = fileToUse
         self.statsTimestamp = Emma.shared_libs.emma_helper.getTimestampFromFilename(fileToUse)  # This is the timestamp parsed from the module/image summary filename
         self.resultsPath = resultsPath
-        self.projectThreshold = None
+        self.memStatsData = memStatsData if memStatsData is not None else MemStatsData(projectPath)
+        # Results of getAggregation() and the (data, budgets) they were calculated from
+        self.__aggregations = {}
+        self.__aggregatedInputs = (None, None)
         # default header
         self.header = [
             # Later indexes are used (therefore the numbers commented inline)
@@ -106,40 +180,43 @@ class Visualiser:
         ]
         self.data = pandas.DataFrame(columns=self.header)
         matplotlib.style.use("ggplot")      # Pycharm might claim there is no reference 'style' in `__init__.py` (you can ignore this)(https://stackoverflow.com/a/23839976/4773274)
-        self.budgets = ""
         self.budgetsFilename = Emma.shared_libs.emma_helper.joinPath(self.projectPath, "budgets.json")
 
         if not self.__readMemStatsFile():
             raise ValueError("No data")
-        self.__readBudgets()
-
-    def __readBudgets(self):
-        """
-        Reads the budgets.json file
-        :return: nothing
-        """
-        self.budgets = None
-        self.projectThreshold = None
-
-        filepath = Emma.shared_libs.emma_helper.joinPath(self.projectPath, "budgets.json")
-        try:
-            with open(filepath, "r") as fp:
-                budgets = json.load(fp)
-        except FileNotFoundError:
-            sc().error(f"The file `{os.path.abspath(filepath)}` was not found!")
-        except json.JSONDecodeError:
-            sc().error(f"JSON syntax error in `{os.path.abspath(filepath)}`!")
-
-        self.budgets = budgets["Budgets"]
-        self.projectThreshold = budgets["Project Threshold in %"]
+        self.budgets = self.memStatsData.budgets
+        self.projectThreshold = self.memStatsData.projectThreshold
 
     def __readMemStatsFile(self):
         """
-        Reads a csv file into self.dataframe
-        :return: Pandas dataframe
+        Gets the content of the report file (.csv, .parquet or .feather) from the shared data into self.dataframe
+        :return: True if the report contains data, False otherwise
         """
-        self.data = pandas.read_csv(self.memStatsFile, index_col=3, sep=";")     # 3 is column addrStartDec (see pos in header)
+        self.data = self.memStatsData.getReport(self.memStatsFile)
         if self.data.empty:
             return False
         else:
             return True
+
+    def getResolvedData(self):
+        """
+        Function to get self.data without the contained, duplicate and overlapped entries. These are removed only once and shared.
+        :return: [pandas.DataFrame] The resolved data.
+        """
+        return self.memStatsData.getResolvedReport(self.memStatsFile)
+
+    def getAggregation(self, key, aggregate):
+        """
+        Function to get an aggregation (e.g. a grouped sum) of self.data, it is calculated only with the first call for the key.
+        The aggregations are calculated again if self.data or self.budgets was replaced since they were calculated.
+        The returned DataFrames are shared between the calls, so they must not be modified in place.
+        :param key: Hashable key of the aggregation, it needs to contain everything the result depends on beside self.data and self.budgets (e.g. the grouping columns).
+        :param aggregate: Function without arguments that calculates the aggregation.
+        :return: The result of aggregate().
+        """
+        if self.__aggregatedInputs[0] is not self.data or self.__aggregatedInputs[1] is not self.budgets:
+            self.__aggregations = {}
+            self.__aggregatedInputs = (self.data, self.budgets)
+        if key not in self.__aggregations:
+            self.__aggregations[key] = aggregate()
+        return self.__aggregations[key]
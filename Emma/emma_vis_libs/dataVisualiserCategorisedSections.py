@@ -44,9 +44,9 @@ class CategorisedImageConsumptionList:
 
         # Data attributes
         self.imageSumObj = imageSumObj
-        self.imageData = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(imageSumObj.data)
+        self.imageData = imageSumObj.getResolvedData()
         self.moduleSumObj = moduleSumObj
-        self.moduleData = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(moduleSumObj.data)
+        self.moduleData = moduleSumObj.getResolvedData()
 
         # Attributes created from data
         self.__categorisedImage = self.__categoriseImage()
@@ -61,14 +61,14 @@ class CategorisedImageConsumptionList:
         # Prepare image summary data
         self.imageData.reset_index()
         self.imageData = self.imageData.drop([CATEGORY, ADDR_START_HEX, ADDR_END_HEX, SIZE_HEX, ADDR_END_DEC, VAS_NAME, DMA, MAPFILE, OBJECT_NAME], 1)
-        self.imageData = self.imageData.groupby([CONFIG_ID, MEM_TYPE, SECTION_NAME]).sum()
+        self.imageData = self.imageData.groupby([CONFIG_ID, MEM_TYPE, SECTION_NAME], observed=True).sum(numeric_only=True)
         self.imageData = self.imageData.rename(index=str, columns={SIZE_DEC: SECTION_SIZE_BYTE})
         self.imageData = self.imageData.reset_index()
 
         # Prepare module summary data
         self.moduleData = self.moduleData.reset_index()
         self.moduleData = self.moduleData.drop([MEM_TYPE_TAG, ADDR_START_DEC, ADDR_START_HEX, ADDR_END_HEX, SIZE_HEX, ADDR_END_DEC, VAS_NAME, DMA, MAPFILE], 1)
-        self.moduleData = self.moduleData.groupby([CONFIG_ID, MEM_TYPE, SECTION_NAME, OBJECT_NAME, CATEGORY]).sum()
+        self.moduleData = self.moduleData.groupby([CONFIG_ID, MEM_TYPE, SECTION_NAME, OBJECT_NAME, CATEGORY], observed=True).sum(numeric_only=True)
         self.moduleData = self.moduleData.rename(index=str, columns={SIZE_DEC: MODULE_SIZE_BYTE})
         self.moduleData = self.moduleData.reset_index()
 
@@ -78,7 +78,7 @@ class CategorisedImageConsumptionList:
                                         on=[CONFIG_ID, MEM_TYPE, SECTION_NAME])
 
         # Aggregate categorisedImage to desired form
-        categorisedImage = categorisedImage.groupby([CONFIG_ID, MEM_TYPE, SECTION_NAME, SECTION_SIZE_BYTE, CATEGORY, OBJECT_NAME]).sum()
+        categorisedImage = categorisedImage.groupby([CONFIG_ID, MEM_TYPE, SECTION_NAME, SECTION_SIZE_BYTE, CATEGORY, OBJECT_NAME], observed=True).sum(numeric_only=True)
 
         return categorisedImage
 
@@ -87,10 +87,10 @@ class CategorisedImageConsumptionList:
         Initialiser function to calculate how much space the modules take up in the image summary
         :return: dataframe
         """
-        usedByModules = self.moduleData.groupby([CONFIG_ID, MEM_TYPE, CATEGORY]).sum()
+        usedByModules = self.moduleData.groupby([CONFIG_ID, MEM_TYPE, CATEGORY], observed=True).sum(numeric_only=True)
         usedByModules = usedByModules.reset_index()
 
-        usedByImage = self.imageData.groupby([CONFIG_ID, MEM_TYPE]).sum()
+        usedByImage = self.imageData.groupby([CONFIG_ID, MEM_TYPE], observed=True).sum(numeric_only=True)
         usedByImage = usedByImage.rename(index=str, columns={SECTION_SIZE_BYTE: "Used [Byte]"})
         usedByImage = usedByImage.reset_index()
 
@@ -98,7 +98,7 @@ class CategorisedImageConsumptionList:
                                             right=usedByModules,
                                             how='right',
                                             on=[CONFIG_ID, MEM_TYPE])
-        usedByModulesInImage = usedByModulesInImage.groupby([CONFIG_ID, MEM_TYPE, USED_BYTE, CATEGORY]).sum()
+        usedByModulesInImage = usedByModulesInImage.groupby([CONFIG_ID, MEM_TYPE, USED_BYTE, CATEGORY], observed=True).sum(numeric_only=True)
 
         return usedByModulesInImage
 
@@ -109,7 +109,7 @@ class CategorisedImageConsumptionList:
         :return: The grouped dataframe
         """
         groupedImage = self.__categorisedImage.reset_index()
-        groupedImage = groupedImage.groupby([CONFIG_ID, MEM_TYPE, CATEGORY, SECTION_NAME, SECTION_SIZE_BYTE, OBJECT_NAME]).sum()
+        groupedImage = groupedImage.groupby([CONFIG_ID, MEM_TYPE, CATEGORY, SECTION_NAME, SECTION_SIZE_BYTE, OBJECT_NAME], observed=True).sum(numeric_only=True)
         return groupedImage
 
     # FIXME: Colours of the legend are not working (MSc), function not used (DP)
@@ -122,7 +122,7 @@ class CategorisedImageConsumptionList:
         usedByModulesInImage = usedByModulesInImage.reset_index().merge(right=self.imageSumObj.consumptionByMemType.reset_index().drop(['sizeDec', ], 1))
         usedByModulesInImage[MODULE_SIZE_PERCENT] = 100 * usedByModulesInImage[MODULE_SIZE_BYTE] / usedByModulesInImage[BUDGET].astype(float)
         usedByModulesInImage = usedByModulesInImage.drop([BUDGET, MODULE_SIZE_BYTE, USED_BYTE, USED_PERCENT, AVAILABLE_PERCENT], 1)
-        usedByModulesInImage = usedByModulesInImage.groupby([CONFIG_ID, MEM_TYPE, CATEGORY]).sum()
+        usedByModulesInImage = usedByModulesInImage.groupby([CONFIG_ID, MEM_TYPE, CATEGORY], observed=True).sum(numeric_only=True)
 
         # Constants for plot
         figsize = (18, 10)
@@ -176,7 +176,7 @@ class CategorisedImageConsumptionList:
 
         with open(markdownFilePath, 'a') as markdown:
             markdown.write("\n# Modules included in allocated Memory\n")
-            markdown.write("    \n    " + self.__groupCategorisedImage().to_string().replace("\n", "\n    ") + "\n")
+            markdown.write("    \n    " + Emma.emma_vis_libs.dataVisualiser.consumptionToString(self.__groupCategorisedImage()).replace("\n", "\n    ") + "\n")
             markdown.write("\n\n")
 
     # FIXME: Deactivated; colours of legend in figure not correct - possibly this figure is not even needed/useful (MSc)
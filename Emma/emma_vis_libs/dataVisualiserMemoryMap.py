@@ -27,61 +27,78 @@ import matplotlib.pyplot
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.emma_vis_libs.dataVisualiser
+import Emma.emma_vis_libs.figureRenderer
 import Emma.shared_libs.emma_helper
 
 
 class MemoryMap(Emma.emma_vis_libs.dataVisualiser.Visualiser):
-    def __init__(self, projectPath, fileToUse, resultsPath):
-        super().__init__(fileToUse, resultsPath, projectPath)
+    def __init__(self, projectPath, fileToUse, resultsPath, memStatsData=None):
+        super().__init__(fileToUse, resultsPath, projectPath, memStatsData)
         self.projectPath = projectPath
         self.project = os.path.split(projectPath)[-1]
 
-    def plotPieChart(self, plotShow=True):
+    def getPieChartRenderJobs(self):
         """
-        Generate pie plots per configID and per memType, then save them to disk
-        :param plotShow: [bool] if True: open window showing the plots
-        :return: None
-
-        
+        Function to get the render jobs of the pie charts per configID and per memType, drawn by drawCategoryPieChart() (see figureRenderer)
+        :return: list of the render jobs
         """
-        data = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(sourceData=self.data, rmContained=True, rmDuplicate=True)
+        data = self.getResolvedData()
 
         # Calculate memory used by category
         byCategory = data[[SIZE_DEC, CONFIG_ID, MEM_TYPE, CATEGORY]]
         byCategory = byCategory.rename(columns={SIZE_DEC: SIZE_DEC_BY_CATEGORY})
-        byCategory = byCategory.groupby([CONFIG_ID, MEM_TYPE, CATEGORY]).sum()
+        byCategory = byCategory.groupby([CONFIG_ID, MEM_TYPE, CATEGORY], observed=True).sum(numeric_only=True)
         byCategory = byCategory.reset_index()
 
         totalUsed = data[[SIZE_DEC, CONFIG_ID, MEM_TYPE]]
-        totalUsed = totalUsed.groupby([CONFIG_ID, MEM_TYPE]).sum()
+        totalUsed = totalUsed.groupby([CONFIG_ID, MEM_TYPE], observed=True).sum(numeric_only=True)
         totalUsed = totalUsed.reset_index()
 
         categoryByPercentage = pandas.merge(left=byCategory, right=totalUsed, on=[CONFIG_ID, MEM_TYPE], how='left')
         categoryByPercentage[PERCENTAGE] = 100 * categoryByPercentage[SIZE_DEC_BY_CATEGORY].astype(float).fillna(0.0) / categoryByPercentage[SIZE_DEC].astype(float).fillna(0.0)
-        categoryByPercentage = categoryByPercentage.drop([SIZE_DEC, SIZE_DEC_BY_CATEGORY], 1)
+        categoryByPercentage = categoryByPercentage.drop([SIZE_DEC, SIZE_DEC_BY_CATEGORY], axis=1)
 
+        renderJobs = []
         configIDs = Emma.emma_vis_libs.dataVisualiser.getConfigIDsFromDf(categoryByPercentage)
-        grouped = categoryByPercentage.groupby([CONFIG_ID])
         for configID in configIDs:
-            groupedByConfigID = grouped.get_group(configID).groupby([MEM_TYPE, CATEGORY]).sum()
+            groupedByConfigID = categoryByPercentage.loc[categoryByPercentage[CONFIG_ID] == configID].groupby([MEM_TYPE, CATEGORY], observed=True).sum(numeric_only=True)
             groupedByConfigID = groupedByConfigID.reset_index()
 
             memTypes = groupedByConfigID[MEM_TYPE].drop_duplicates().values
             for memType in memTypes:
                 title = "Categories [%] | " + self.project + " - " + configID + " - " + memType + "   (created: " + self.statsTimestamp + ")"
-
-                byMemType = groupedByConfigID.loc[groupedByConfigID[MEM_TYPE] == memType].drop([MEM_TYPE], 1).set_index(CATEGORY)
-                pieChart = byMemType.plot.pie(y=PERCENTAGE, x=CATEGORY, labels=None, colormap="tab20")
-                pieChart.axes.get_yaxis().set_visible(False)
-                pieChart.set_title(fontsize=10, label=title)
-                labels = []
-                for i, row in byMemType.iterrows():
-                    label = i + " - " + str(round(row[PERCENTAGE], 2)) + "%"
-                    labels.append(label)
-                matplotlib.pyplot.legend(labels, loc="lower left", bbox_to_anchor=(-0.4, -0.2), ncol=2, fontsize=8)
-
+                byMemType = groupedByConfigID.loc[groupedByConfigID[MEM_TYPE] == memType].drop([MEM_TYPE], axis=1).set_index(CATEGORY)
                 filename = self.project + "_" + configID + "_" + memType + "_" + self.statsTimestamp + ".png"
-                matplotlib.pyplot.savefig(Emma.shared_libs.emma_helper.joinPath(self.resultsPath, filename), dpi=MEMORY_ESTIMATION_PICTURE_DPI, transparent=False, bbox_inches="tight")
-            if plotShow:
-                matplotlib.pyplot.show()
-        return
+                renderJobs.append((drawCategoryPieChart,
+                                   {"byMemType": byMemType, "title": title},
+                                   Emma.shared_libs.emma_helper.joinPath(self.resultsPath, filename),
+                                   {"dpi": MEMORY_ESTIMATION_PICTURE_DPI, "transparent": False, "bbox_inches": "tight"}))
+        return renderJobs
+
+    def plotPieChart(self, plotShow=True):
+        """
+        Generate pie plots per configID and per memType, then save them to disk
+        :param plotShow: [bool] if True: open window showing the plots
+        :return: None
+        """
+        for renderJob in self.getPieChartRenderJobs():
+            Emma.emma_vis_libs.figureRenderer.renderFigure(*renderJob, show=plotShow)
+
+
+def drawCategoryPieChart(byMemType, title):
+    """
+    Draws the pie chart of the categories of a memType
+    :param byMemType: pandas DataFrame of the percentages of the categories, indexed by the category
+    :param title: Title of the figure
+    :return: the figure (=figure object)
+    """
+    figure, axes = matplotlib.pyplot.subplots()
+    pieChart = byMemType.plot.pie(y=PERCENTAGE, x=CATEGORY, labels=None, colormap="tab20", ax=axes)
+    pieChart.axes.get_yaxis().set_visible(False)
+    pieChart.set_title(fontsize=10, label=title)
+    labels = []
+    for i, row in byMemType.iterrows():
+        label = i + " - " + str(round(row[PERCENTAGE], 2)) + "%"
+        labels.append(label)
+    pieChart.legend(labels, loc="lower left", bbox_to_anchor=(-0.4, -0.2), ncol=2, fontsize=8)
+    return figure
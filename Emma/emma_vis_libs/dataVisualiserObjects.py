@@ -23,12 +23,12 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 import os
 
 import pandas
-import matplotlib.pyplot
 from pypiscout.SCout_Logger import Logger as sc
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
 import Emma.emma_vis_libs.dataVisualiser
+import Emma.emma_vis_libs.figureRenderer
 
 
 class ModuleConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
@@ -37,18 +37,26 @@ class ModuleConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
     does not have categories or the like they need to be added here.
     """
 
-    def __init__(self, projectPath, fileToUse, resultsPath):
-        super().__init__(fileToUse, resultsPath, projectPath)
+    def __init__(self, projectPath, fileToUse, resultsPath, memStatsData=None):
+        super().__init__(fileToUse, resultsPath, projectPath, memStatsData)
         self.projectPath = projectPath
         self.project = os.path.split(projectPath)[-1]
         self.consumptionByCategorisedModules = self.calcConsumptionByCategorisedModules()
 
-    def plotByCategorisedModules(self, plotShow=True):
-        figure = self.displayConsumptionByCategorisedModules(self.consumptionByCategorisedModules)
+    def getRenderJobByCategorisedModules(self):
+        """
+        Function to get the render job of the figure created by drawConsumptionByCategorisedModules() (see figureRenderer)
+        :return: the render job
+        """
+        title = "Partition of allocated Memory - " + self.project + "    (Created " + self.statsTimestamp + ")"
         filename = self.project + MEMORY_ESTIMATION_PARTITION_OF_ALLOCATED_MEMORY_PICTURE_NAME_FIX_PART + self.statsTimestamp.replace(" ", "") + "." + MEMORY_ESTIMATION_PICTURE_FILE_EXTENSION
-        Emma.shared_libs.emma_helper.saveMatplotlibPicture(figure, os.path.join(self.resultsPath, filename), MEMORY_ESTIMATION_PICTURE_FILE_EXTENSION, MEMORY_ESTIMATION_PICTURE_DPI, False)
-        if plotShow:
-            matplotlib.pyplot.show()
+        return (drawConsumptionByCategorisedModules,
+                {"consumptionPerMemory": self.consumptionByCategorisedModules, "title": title},
+                os.path.join(self.resultsPath, filename),
+                {"format": MEMORY_ESTIMATION_PICTURE_FILE_EXTENSION, "dpi": MEMORY_ESTIMATION_PICTURE_DPI, "transparent": False})
+
+    def plotByCategorisedModules(self, plotShow=True):
+        Emma.emma_vis_libs.figureRenderer.renderFigure(*self.getRenderJobByCategorisedModules(), show=plotShow)
 
     def calcConsumptionByCategorisedModules(self):
         """
@@ -56,11 +64,11 @@ class ModuleConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         :return: dataframe of grouped memStats
         """
         # Resolve the containment/overlap/duplicate flags
-        usedByModules = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(self.data).reset_index()
+        usedByModules = self.getResolvedData().reset_index()
 
         # Calculate memory used by modules
         usedByModules = usedByModules[[SIZE_DEC, CONFIG_ID, MEM_TYPE]]                  # Extract sizeDec, memType and configID
-        usedByModules = usedByModules.groupby([CONFIG_ID, MEM_TYPE]).sum()              # Group by memType and configID, sum sizeDec
+        usedByModules = usedByModules.groupby([CONFIG_ID, MEM_TYPE], observed=True).sum(numeric_only=True)              # Group by memType and configID, sum sizeDec
         usedByModules = usedByModules.rename(columns={SIZE_DEC: "used by modules"})     # Rename sizeDec, as it is now the sum of memory used ba modules
         usedByModules = usedByModules.reset_index()                                     # Reset index for later merge
 
@@ -74,81 +82,51 @@ class ModuleConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
 
         # Normalize data
         categorized["percentage share"] = 100.0 * categorized[SIZE_DEC] / categorized["used by modules"].astype(float)  # Calculate percent value
-        categorized = categorized.groupby([CONFIG_ID, MEM_TYPE, CATEGORY]).sum()        # Group by configID, memType and category, sum module percentages
+        categorized = categorized.groupby([CONFIG_ID, MEM_TYPE, CATEGORY], observed=True).sum(numeric_only=True)        # Group by configID, memType and category, sum module percentages
         categorized = categorized.drop([SIZE_DEC, "used by modules"], 1)                # Remove sizeDec and budget and used by modules as it's only needed for percentage calc
-        categorized = categorized.groupby([CONFIG_ID, MEM_TYPE, CATEGORY]).sum()
-
-        pandas.options.display.float_format = '{:,.2f}'.format
+        categorized = categorized.groupby([CONFIG_ID, MEM_TYPE, CATEGORY], observed=True).sum(numeric_only=True)
 
         return categorized
 
     def displayConsumptionCategorisedPie(self, consumptionPerMemory):
         title = "Categorised Memory Estimation of Modules - " + self.project + "    (Created " + self.statsTimestamp + ")"
-        consumptionPerMemory = consumptionPerMemory.reset_index()
-        consumptionPerMemory = consumptionPerMemory.groupby(["configID", MEM_TYPE, "category"]).sum()
-        consumptionPerMemory = consumptionPerMemory.unstack().fillna(0)
-
-        pieGraph = consumptionPerMemory.plot.pie(subplots=True,
-                                                 figsize=(28, 4),
-                                                 colormap='tab20c',
-                                                 # List of colormaps: https://matplotlib.org/examples/color/colormaps_reference.html
-                                                 autopct='%.2f',
-                                                 fontsize=8,
-                                                 legend=False,
-                                                 title=title)
-
-        return pieGraph[0].get_figure()
+        return drawConsumptionCategorisedPie(consumptionPerMemory, title)
 
     def displayConsumptionByCategorisedModules(self, consumptionPerMemory):
-        # Plot bar graph
         title = "Partition of allocated Memory - " + self.project + "    (Created " + self.statsTimestamp + ")"
-        consumptionPerMemory = consumptionPerMemory.unstack()  # Unstack so dataframe can be plotted
-        consumptionPerMemory = consumptionPerMemory.reset_index()  # Reset index so wen can set it again
-        consumptionPerMemory = consumptionPerMemory.set_index(["configID", MEM_TYPE])  # Set index to plot by "configID", "memType"
-
-        barGraph = consumptionPerMemory.plot(kind='bar',  # Enable stacked bars
-                                             stacked='reverse',
-                                             # FIXME: This doesn't reverse(FM) Possible workaround: barh, reverse x-Axis
-                                             figsize=(18, 10),  # Adjust figure size
-                                             rot=45,  # Rotate x-Axis labels
-                                             colormap='tab20',
-                                             # List of colormaps: https://matplotlib.org/examples/color/colormaps_reference.html
-                                             title=title,  # Set title
-                                             legend='reverse',  # Enable legend FIXME: This reverses neither(FM)
-                                             ylim=(0, 105))  # Set limit for y-axis
-
-        indices = consumptionPerMemory.keys().get_level_values("category")
-        barGraph.legend(title=None,  # Disable title
-                        labels=indices)  # Only show "category" in the legend
-
-        matplotlib.pyplot.ylabel("Partition of allocated Memory in %")
+        return drawConsumptionByCategorisedModules(consumptionPerMemory, title)
 
-        matplotlib.pyplot.subplots_adjust(top=0.9, bottom=0.26, left=0.06, right=0.92)  # Adjust space around our plot
-        matplotlib.pyplot.gcf().canvas.set_window_title("Emma -- Visualiser - " + title)  # Set window name
-
-        return barGraph.get_figure()
+    def getRenderJobByCategorisedModulesPie(self):
+        """
+        Function to get the render job of the figure created by drawConsumptionCategorisedPie() (see figureRenderer)
+        :return: the render job
+        """
+        title = "Categorised Memory Estimation of Modules - " + self.project + "    (Created " + self.statsTimestamp + ")"
+        filename = self.project + "-Memory_Estimation_by_Category_Pie_Chart_generated_" + self.statsTimestamp.replace(" ", "")
+        return (drawConsumptionCategorisedPie,
+                {"consumptionPerMemory": self.consumptionByCategorisedModules, "title": title},
+                self.resultsPath + filename + ".png",
+                {"dpi": MEMORY_ESTIMATION_PICTURE_DPI, "transparent": False})
 
     def plotByCategorisedModulesPie(self, plotShow=True):
-        myfigure = self.displayConsumptionCategorisedPie(self.consumptionByCategorisedModules)
-        filename = self.project + "-Memory_Estimation_by_Category_Pie_Chart_generated_" + self.statsTimestamp.replace(" ", "")
-        myfigure.savefig(self.resultsPath + filename + ".png", dpi=MEMORY_ESTIMATION_PICTURE_DPI, transparent=False)
-        if plotShow:
-            matplotlib.pyplot.show()  # Show plots after results in console output are shown
+        Emma.emma_vis_libs.figureRenderer.renderFigure(*self.getRenderJobByCategorisedModulesPie(), show=plotShow)  # Show plots after results in console output are shown
 
-    def appendModuleConsumptionToMarkdownOverview(self, markdownFilePath):
+    def appendModuleConsumptionToMarkdownOverview(self, markdownFilePath, plotFigure=True):
         """
         Appends consumptionByCategorisedModules and the corresponding plot to the Markdown file
         :param markdownFilePath: The path of the Markdown file to which the data will be appended to.
+        :param plotFigure: True if the figure shall be (re-)written, False if it was already rendered (e.g. by the rendering stage of emma_vis)
         :return: nothing
         """
 
         sc().info("Appending object summary to overview...")
 
-        self.plotByCategorisedModules(plotShow=False)  # Re-write .png to ensure up-to-date overview
+        if plotFigure:
+            self.plotByCategorisedModules(plotShow=False)  # Re-write .png to ensure up-to-date overview
 
         with open(markdownFilePath, "a") as markdown:
             markdown.write("\n# Percentage share of modules\n")
-            markdown.write("    \n    " + self.consumptionByCategorisedModules.to_string().replace("\n", "\n    ") + "\n")
+            markdown.write("    \n    " + Emma.emma_vis_libs.dataVisualiser.consumptionToString(self.consumptionByCategorisedModules).replace("\n", "\n    ") + "\n")
             markdown.write("\n\n*percentage share: share of the used memory*\n\n")
 
             # FIXME: Deactivated; colours of legend in figure not correct - possibly this figure is not even needed/useful (MSc)
@@ -157,3 +135,63 @@ class ModuleConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
 
             markdown.write("<div align=\"center\"> <img src=\"" + os.path.join(self.project + MEMORY_ESTIMATION_PARTITION_OF_ALLOCATED_MEMORY_PICTURE_NAME_FIX_PART + self.statsTimestamp + "." + MEMORY_ESTIMATION_PICTURE_FILE_EXTENSION) + "\" width=\"1000\"> </div>")
             markdown.write("\n")
+
+
+def drawConsumptionCategorisedPie(consumptionPerMemory, title):
+    """
+    Draws the pie charts of the categories per configID and memType
+    :param consumptionPerMemory: pandas DataFrame created by ModuleConsumptionList.calcConsumptionByCategorisedModules()
+    :param title: Title of the figure
+    :return: the figure (=figure object)
+    """
+    consumptionPerMemory = consumptionPerMemory.reset_index()
+    consumptionPerMemory = consumptionPerMemory.groupby(["configID", MEM_TYPE, "category"], observed=True).sum(numeric_only=True)
+    consumptionPerMemory = consumptionPerMemory.unstack().fillna(0)
+
+    pieGraph = consumptionPerMemory.plot.pie(subplots=True,
+                                             figsize=(28, 4),
+                                             colormap='tab20c',
+                                             # List of colormaps: https://matplotlib.org/examples/color/colormaps_reference.html
+                                             autopct='%.2f',
+                                             fontsize=8,
+                                             legend=False,
+                                             title=title)
+
+    return pieGraph[0].get_figure()
+
+
+def drawConsumptionByCategorisedModules(consumptionPerMemory, title):
+    """
+    Draws the stacked bar graph of the partition of the allocated memory per configID and memType
+    :param consumptionPerMemory: pandas DataFrame created by ModuleConsumptionList.calcConsumptionByCategorisedModules()
+    :param title: Title of the figure
+    :return: the figure (=figure object)
+    """
+    # Plot bar graph
+    consumptionPerMemory = consumptionPerMemory.unstack()  # Unstack so dataframe can be plotted
+    consumptionPerMemory = consumptionPerMemory.reset_index()  # Reset index so wen can set it again
+    consumptionPerMemory = consumptionPerMemory.set_index(["configID", MEM_TYPE])  # Set index to plot by "configID", "memType"
+
+    barGraph = consumptionPerMemory.plot(kind='bar',  # Enable stacked bars
+                                         stacked='reverse',
+                                         # FIXME: This doesn't reverse(FM) Possible workaround: barh, reverse x-Axis
+                                         figsize=(18, 10),  # Adjust figure size
+                                         rot=45,  # Rotate x-Axis labels
+                                         colormap='tab20',
+                                         # List of colormaps: https://matplotlib.org/examples/color/colormaps_reference.html
+                                         title=title,  # Set title
+                                         legend='reverse',  # Enable legend FIXME: This reverses neither(FM)
+                                         ylim=(0, 105))  # Set limit for y-axis
+
+    indices = consumptionPerMemory.keys().get_level_values("category")
+    barGraph.legend(title=None,  # Disable title
+                    labels=indices)  # Only show "category" in the legend
+
+    barGraph.set_ylabel("Partition of allocated Memory in %")
+
+    figure = barGraph.get_figure()
+    figure.subplots_adjust(top=0.9, bottom=0.26, left=0.06, right=0.92)  # Adjust space around our plot
+    if figure.canvas.manager is not None:
+        figure.canvas.manager.set_window_title("Emma -- Visualiser - " + title)  # Set window name
+
+    return figure
@@ -22,12 +22,12 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 import os
 
 import pandas
-import matplotlib.pyplot
 from pypiscout.SCout_Logger import Logger as sc
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
 import Emma.emma_vis_libs.dataVisualiser
+import Emma.emma_vis_libs.figureRenderer
 
 
 class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
@@ -35,8 +35,8 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
     Class holding the image data from .csv Memstats, plus methods for printing/plotting,
     file writing and .md/.html creation
     """
-    def __init__(self, projectPath, fileToUse, resultsPath):
-        super().__init__(fileToUse, resultsPath, projectPath)
+    def __init__(self, projectPath, fileToUse, resultsPath, memStatsData=None):
+        super().__init__(fileToUse, resultsPath, projectPath, memStatsData)
         self.projectPath = projectPath
         self.project = os.path.split(projectPath)[-1]
         self.consumptionByMemType = self.calcConsumptionByMemType()
@@ -65,109 +65,119 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
     def groupDataByMemType(self, indices):
         """
         Group and aggregate (sum) data per **configID > memType**
+        The result is calculated only once per indices (see Visualiser.getAggregation()), it must not be modified in place.
         :param indices: list of int's defining on what data to group (see headers)
         :return: pandas DataFrame (sizeDec grouped by: configID > memType)
         """
+        def aggregate():
+            # Resolve the containment/overlap/duplicate flags
+            groupedByMemType = self.getResolvedData()
 
-        # Resolve the containment/overlap/duplicate flags
-        groupedByMemType = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(self.data)
+            # "Select" data that we really use
+            groupedByMemType = groupedByMemType[[SIZE_DEC] + [self.header[i] for i in indices]]          # Get only columns we need
 
-        # "Select" data that we really use
-        groupedByMemType = groupedByMemType[[SIZE_DEC] + [self.header[i] for i in indices]]          # Get only columns we need
+            # Grouping
+            groupedByMemType = groupedByMemType.groupby([self.header[i] for i in indices], observed=True).sum(numeric_only=True)     # magic numbers: see in header (Visualiser)
+            groupedByMemTypeAcc = groupedByMemType.groupby([CONFIG_ID, MEM_TYPE], observed=True).sum(numeric_only=True)
 
-        # Grouping
-        groupedByMemType = groupedByMemType.groupby([self.header[i] for i in indices]).sum()     # magic numbers: see in header (Visualiser)
-        groupedByMemTypeAcc = groupedByMemType.groupby([CONFIG_ID, MEM_TYPE]).sum()
+            # Cast type
+            groupedByMemTypeAcc[SIZE_DEC] = groupedByMemTypeAcc[SIZE_DEC].astype(float)
 
-        # Set formats and cast type
-        pandas.options.display.float_format = '{:14,.0f}'.format
-        groupedByMemTypeAcc[SIZE_DEC] = groupedByMemTypeAcc[SIZE_DEC].astype(float)
+            return groupedByMemTypeAcc
 
-        return groupedByMemTypeAcc
+        return self.getAggregation(("groupDataByMemType", tuple(indices)), aggregate)
 
     def groupDataByMemTypeDetailed(self, indices):
         """
         Group and aggregate (sum) data per **configID > tag**
+        The result is calculated only once per indices (see Visualiser.getAggregation()), it must not be modified in place.
         :param indices: list of int's defining on what data to group (see headers)
         :return: pandas DataFrame (sizeDec grouped by: configID > tag)
         """
+        def aggregate():
+            # Resolve the containment/overlap/duplicate flags
+            groupedByMemType = self.getResolvedData()
 
-        # Resolve the containment/overlap/duplicate flags
-        groupedByMemType = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(self.data)
+            # "Select" data that we really use
+            groupedByMemType = groupedByMemType[[SIZE_DEC] + [self.header[i] for i in indices]]          # Get only columns we need
 
-        # "Select" data that we really use
-        groupedByMemType = groupedByMemType[[SIZE_DEC] + [self.header[i] for i in indices]]          # Get only columns we need
+            # Grouping
+            groupedByMemTypeAcc = groupedByMemType.groupby([CONFIG_ID, MEM_TYPE_TAG], observed=True).sum(numeric_only=True)
 
-        # Grouping
-        groupedByMemTypeAcc = groupedByMemType.groupby([CONFIG_ID, MEM_TYPE_TAG]).sum()
+            # Cast type
+            groupedByMemTypeAcc[SIZE_DEC] = groupedByMemTypeAcc[SIZE_DEC].astype(float)
+            return groupedByMemTypeAcc
 
-        # Set formats and cast type
-        pandas.options.display.float_format = '{:14,.0f}'.format
-        groupedByMemTypeAcc[SIZE_DEC] = groupedByMemTypeAcc[SIZE_DEC].astype(float)
-        return groupedByMemTypeAcc
+        return self.getAggregation(("groupDataByMemTypeDetailed", tuple(indices)), aggregate)
 
     def groupDataByMemTypePerMap(self, indices):
         """
         Group and aggregate (sum) data per **configID > mapfile > memType**
+        The result is calculated only once per indices (see Visualiser.getAggregation()), it must not be modified in place.
         :param indices: list of int's defining on what data to group (see headers)
         :return: pandas DataFrame (sizeDec grouped by: configID > mapfile > memType)
         """
-        # "Select" data that we really use
-        groupedByMemType = self.data[[self.header[i] for i in indices]]          # Get only columns we need
+        def aggregate():
+            # "Select" data that we really use
+            groupedByMemType = self.data[[self.header[i] for i in indices]]          # Get only columns we need
 
-        # Grouping
-        groupedByMemTypeAcc = groupedByMemType.groupby([self.header[7], self.header[13], self.header[9]]).sum().astype(float)     # Order matters!!
+            # Grouping
+            return groupedByMemType.groupby([self.header[7], self.header[13], self.header[9]], observed=True).sum(numeric_only=True).astype(float)     # Order matters!!
 
-        # Set formats and cast type
-        pandas.options.display.float_format = '{:14,.0f}'.format
-        return groupedByMemTypeAcc
+        return self.getAggregation(("groupDataByMemTypePerMap", tuple(indices)), aggregate)
 
     def calcConsumptionByMemType(self):
         """
         Calculate and aggregate grouped data from `groupDataByMemType()`
+        The result is calculated only once (see Visualiser.getAggregation()), it must not be modified in place.
         :return:
         """
-        # Get condensed report from csv
-        groupedByMemTypeAcc = self.groupDataByMemType([7, 9, 10, 13])
+        def aggregate():
+            # Get condensed report from csv
+            groupedByMemTypeAcc = self.groupDataByMemType([7, 9, 10, 13])
 
-        # Prepare budgets
-        budgetsData = pandas.DataFrame(self.budgets, columns=[self.header[7], self.header[9], BUDGET])                      # magic numbers: see in header (Visualiser)
-        budgetsData[BUDGET] = budgetsData[BUDGET].astype(float)
+            # Prepare budgets
+            budgetsData = pandas.DataFrame(self.budgets, columns=[self.header[7], self.header[9], BUDGET])                      # magic numbers: see in header (Visualiser)
+            budgetsData[BUDGET] = budgetsData[BUDGET].astype(float)
 
-        # Merge and group by configID & memType
-        groupedByMemTypeAcc = groupedByMemTypeAcc.reset_index()                                                             # We need to reset the index first for merging
-        groupedByMemTypeAcc = pandas.merge(groupedByMemTypeAcc, budgetsData, on=[self.header[7], self.header[9]])           # Some bars might not be shown in the graph if you forget to adapt the `configID`s in `budgets.json`
-        groupedByMemTypeAcc = groupedByMemTypeAcc.groupby([self.header[7], self.header[9]]).sum()
+            # Merge and group by configID & memType
+            groupedByMemTypeAcc = groupedByMemTypeAcc.reset_index()                                                             # We need to reset the index first for merging
+            groupedByMemTypeAcc = pandas.merge(groupedByMemTypeAcc, budgetsData, on=[self.header[7], self.header[9]])           # Some bars might not be shown in the graph if you forget to adapt the `configID`s in `budgets.json`
+            groupedByMemTypeAcc = groupedByMemTypeAcc.groupby([self.header[7], self.header[9]], observed=True).sum(numeric_only=True)
 
-        # Normalise and calculate percent (used/available)
-        groupedByMemTypeAcc[USED_PERCENT] = groupedByMemTypeAcc[self.header[5]] / groupedByMemTypeAcc[BUDGET] * 100
-        groupedByMemTypeAcc[AVAILABLE_PERCENT] = (100 - groupedByMemTypeAcc[USED_PERCENT])                                  # Check for negative value in next line
+            # Normalise and calculate percent (used/available)
+            groupedByMemTypeAcc[USED_PERCENT] = groupedByMemTypeAcc[self.header[5]] / groupedByMemTypeAcc[BUDGET] * 100
+            groupedByMemTypeAcc[AVAILABLE_PERCENT] = (100 - groupedByMemTypeAcc[USED_PERCENT])                                  # Check for negative value in next line
 
-        # Cap percentage -> if negative it has to be set to 0%
-        groupedByMemTypeAcc.loc[groupedByMemTypeAcc[AVAILABLE_PERCENT] < 0, AVAILABLE_PERCENT] = 0
+            # Cap percentage -> if negative it has to be set to 0%
+            groupedByMemTypeAcc.loc[groupedByMemTypeAcc[AVAILABLE_PERCENT] < 0, AVAILABLE_PERCENT] = 0
 
-        return groupedByMemTypeAcc
+            return groupedByMemTypeAcc
+
+        return self.getAggregation(("calcConsumptionByMemType",), aggregate)
 
     def calcConsumptionByMemTypeDetailed(self):
         """
         Calculates grouped data from `groupDataByMemTypeDetailed()`
-        :return: nothing
+        The result is calculated only once (see Visualiser.getAggregation()), it must not be modified in place.
+        :return: the dataframe
         """
-        # Get condensed report from csv
-        groupedByMemTypeAcc = self.groupDataByMemTypeDetailed([7, 10, 13])
+        def aggregate():
+            # Get condensed report from csv
+            groupedByMemTypeAcc = self.groupDataByMemTypeDetailed([7, 10, 13])
 
-        # Merge and group with budgets
-        groupedByMemTypeAcc = groupedByMemTypeAcc.reset_index()         # We need to reset the index first for merging
-        groupedByMemTypeAcc = groupedByMemTypeAcc.groupby([self.header[7], self.header[10]]).sum()
+            # Merge and group with budgets
+            groupedByMemTypeAcc = groupedByMemTypeAcc.reset_index()         # We need to reset the index first for merging
+            return groupedByMemTypeAcc.groupby([self.header[7], self.header[10]], observed=True).sum(numeric_only=True)
 
-        return groupedByMemTypeAcc
+        return self.getAggregation(("calcConsumptionByMemTypeDetailed",), aggregate)
 
     def calcConsumptionByMemTypePerMap(self):
         """
         Calculates grouped data from `groupDataByMemTypePerMap()`
         :return: the dataframe
         """
-        # Get condensed report from csv
+        # Get condensed report from csv, the result is cached by groupDataByMemTypePerMap()
         groupedByMemTypeAcc = self.groupDataByMemTypePerMap([5, 9, 7, 10, 13])
 
         return groupedByMemTypeAcc
@@ -178,50 +188,8 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         You might want to call `.savefig("filename", <options>...)` from the returning object to save the figure as a file
         :return: the figure (=figure object)
         """
-
-        # Plot bar graph
-        title = "Memory Estimation - " + self.project + "    (Created " + self.statsTimestamp + ")"
-
-        barGraph = self.consumptionByMemType[[USED_PERCENT, AVAILABLE_PERCENT]].plot.bar(stacked=True,
-                                                                                               figsize=(18, 10),
-                                                                                               rot=45,
-                                                                                               title=title,
-                                                                                               color=["#2D9CDB", "#bbbbbb"])
-        matplotlib.pyplot.subplots_adjust(top=0.9, bottom=0.26, left=0.06, right=0.92)    # Adjust space around our plot
-        matplotlib.pyplot.gcf().canvas.set_window_title("Emma -- Visualiser - " + title)
-        matplotlib.pyplot.ylabel("Allocated Memory in %")
-
-        # Show Values over bars in graph
-        for i, bar in enumerate(barGraph.patches):
-            if i >= len(barGraph.patches) / 2:
-                # Show budgets annotations in kiB
-                barGraph.annotate(
-                    s=Emma.shared_libs.emma_helper.toHumanReadable(int(self.consumptionByMemType[BUDGET].iloc[int(i % (len(barGraph.patches) / 2))])),  # Format of budget text
-                    xy=(bar.get_x(), 100),                                                                         # Location of budget annotation, set to 100 so the annotation appears at the 100% line
-                    color="#505359")
-            else:
-                # Show percentage and absolute value
-                annotationUsagePercentage = "{:.1f} %".format(bar.get_height())
-                annotationUsageAbsoluteValue = Emma.shared_libs.emma_helper.toHumanReadable(int(self.consumptionByMemType[self.header[5]][i]))
-                barGraph.annotate(
-                    s=annotationUsagePercentage + "\n" + annotationUsageAbsoluteValue,
-                    xy=(bar.get_x(), bar.get_height() + 0.01),
-                    color="#505359")
-
-        # Make a project threshold line
-        barGraph.axhline(y=self.projectThreshold,
-                         linewidth=1,
-                         color="#df1f1f",
-                         linestyle="dotted"
-                         )
-
-        barGraph.annotate("Project Threshold",
-                          xy=(0, 0),                                                # Annotation does not work without this argument
-                          xytext=(barGraph.get_xlim()[1] - 0.065, self.projectThreshold + 0.75),
-                          color="#505359",
-                          fontsize=8)
-
-        return barGraph.get_figure()
+        drawFunction, drawArguments, _, _ = self.getRenderJobByMemType()
+        return drawFunction(**drawArguments)
 
     def writeReportToFile(self):
         """
@@ -230,25 +198,34 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         title = self.project + "-Memory_Report_by_configID-memType"
         self.__appendStatsConsumption(self.consumptionByMemType, title)
 
+    def getRenderJobByMemType(self):
+        """
+        Function to get the render job of the figure created by drawConsumptionByMemType() (see figureRenderer)
+        :return: the render job
+        """
+        title = "Memory Estimation - " + self.project + "    (Created " + self.statsTimestamp + ")"
+        filename = self.project + MEMORY_ESTIMATION_BY_PERCENTAGES_PICTURE_NAME_FIX_PART + self.statsTimestamp.replace(" ", "") + "." + MEMORY_ESTIMATION_PICTURE_FILE_EXTENSION
+        return (drawConsumptionByMemType,
+                {"consumptionByMemType": self.consumptionByMemType, "title": title, "projectThreshold": self.projectThreshold},
+                os.path.join(self.resultsPath, filename),
+                {"format": MEMORY_ESTIMATION_PICTURE_FILE_EXTENSION, "dpi": MEMORY_ESTIMATION_PICTURE_DPI, "transparent": False})
+
     def plotByMemType(self, plotShow=True):
         """
-        function to display and save to file the figure created in self.displayConsumptionByMemType()
+        function to display and save to file the figure created by drawConsumptionByMemType()
         :param plotShow: Show plot or write to file only
         :return: nothing
         """
+        Emma.emma_vis_libs.figureRenderer.renderFigure(*self.getRenderJobByMemType(), show=plotShow)
 
-        myfigure = self.displayConsumptionByMemType()
-        filename = self.project + MEMORY_ESTIMATION_BY_PERCENTAGES_PICTURE_NAME_FIX_PART + self.statsTimestamp.replace(" ", "") + "." + MEMORY_ESTIMATION_PICTURE_FILE_EXTENSION
-        Emma.shared_libs.emma_helper.saveMatplotlibPicture(myfigure, os.path.join(self.resultsPath, filename), MEMORY_ESTIMATION_PICTURE_FILE_EXTENSION, MEMORY_ESTIMATION_PICTURE_DPI, False)
-        if plotShow:
-            matplotlib.pyplot.show()              # Show plots after results in console output are shown
-
-    def createMarkdownOverview(self):
+    def createMarkdownOverview(self, plotFigure=True):
         """
         Creates the [PROJECT] overview md
+        :param plotFigure: True if the figure of the overview shall be (re-)written, False if it was already rendered (e.g. by the rendering stage of emma_vis)
         """
 
-        self.plotByMemType(plotShow=False)  # Re-write .png to ensure up-to-date overview
+        if plotFigure:
+            self.plotByMemType(plotShow=False)  # Re-write .png to ensure up-to-date overview
         markdownFilePath = Emma.shared_libs.emma_helper.joinPath(self.resultsPath, self.project + "-Memory_Overview_" + self.statsTimestamp.replace(" ", "") + ".md")
 
         try:
@@ -260,11 +237,11 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
                 markdown.write("\n")
 
                 markdown.write("\n# Usage by Memory Type\n")
-                markdown.write("    \n    " + self.consumptionByMemType.to_string().replace("\n", "\n    ") + "\n")
+                markdown.write("    \n    " + Emma.emma_vis_libs.dataVisualiser.consumptionToString(self.consumptionByMemType).replace("\n", "\n    ") + "\n")
                 markdown.write("\n\n*" + SIZE_DEC + ": Used Memory in Byte* | *" + BUDGET + ": Total Memory Size* | *" + USED_PERCENT + ": Used Memory in %* | *" + AVAILABLE_PERCENT + ": Available Memory in %*\n\n")
 
                 markdown.write("\n# Usage by Mapfile\n")
-                markdown.write("    \n    " + self.consumptionByMemTypePerMap.to_string().replace("\n", "\n    ") + "\n")
+                markdown.write("    \n    " + Emma.emma_vis_libs.dataVisualiser.consumptionToString(self.consumptionByMemTypePerMap).replace("\n", "\n    ") + "\n")
                 markdown.write("\n\n*" + SIZE_DEC + ": Used Memory in Byte*\n\n")
         except FileNotFoundError:
             sc().error(f"The file `{os.path.abspath(markdownFilePath)}` was not found!")
@@ -293,3 +270,56 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
                         sc().error(f"The file `{os.path.abspath(supplementFile)}` was not found!")
         else:
             sc().wwarning(f"A supplement folder does not exist in {self.projectPath}. No supplement files will be attached to the report")
+
+
+def drawConsumptionByMemType(consumptionByMemType, title, projectThreshold):
+    """
+    Draws the bar graph of the used and available memory per configID and memType
+    :param consumptionByMemType: pandas DataFrame created by ImageConsumptionList.calcConsumptionByMemType()
+    :param title: Title of the figure
+    :param projectThreshold: The project threshold in %, it is shown as a line
+    :return: the figure (=figure object)
+    """
+    # Plot bar graph
+    barGraph = consumptionByMemType[[USED_PERCENT, AVAILABLE_PERCENT]].plot.bar(stacked=True,
+                                                                                figsize=(18, 10),
+                                                                                rot=45,
+                                                                                title=title,
+                                                                                color=["#2D9CDB", "#bbbbbb"])
+    figure = barGraph.get_figure()
+    figure.subplots_adjust(top=0.9, bottom=0.26, left=0.06, right=0.92)    # Adjust space around our plot
+    if figure.canvas.manager is not None:
+        figure.canvas.manager.set_window_title("Emma -- Visualiser - " + title)
+    barGraph.set_ylabel("Allocated Memory in %")
+
+    # Show Values over bars in graph
+    for i, bar in enumerate(barGraph.patches):
+        if i >= len(barGraph.patches) / 2:
+            # Show budgets annotations in kiB
+            barGraph.annotate(
+                Emma.shared_libs.emma_helper.toHumanReadable(int(consumptionByMemType[BUDGET].iloc[int(i % (len(barGraph.patches) / 2))])),  # Format of budget text
+                xy=(bar.get_x(), 100),                                                                         # Location of budget annotation, set to 100 so the annotation appears at the 100% line
+                color="#505359")
+        else:
+            # Show percentage and absolute value
+            annotationUsagePercentage = "{:.1f} %".format(bar.get_height())
+            annotationUsageAbsoluteValue = Emma.shared_libs.emma_helper.toHumanReadable(int(consumptionByMemType[SIZE_DEC].iloc[i]))
+            barGraph.annotate(
+                annotationUsagePercentage + "\n" + annotationUsageAbsoluteValue,
+                xy=(bar.get_x(), bar.get_height() + 0.01),
+                color="#505359")
+
+    # Make a project threshold line
+    barGraph.axhline(y=projectThreshold,
+                     linewidth=1,
+                     color="#df1f1f",
+                     linestyle="dotted"
+                     )
+
+    barGraph.annotate("Project Threshold",
+                      xy=(0, 0),                                                # Annotation does not work without this argument
+                      xytext=(barGraph.get_xlim()[1] - 0.065, projectThreshold + 0.75),
+                      color="#505359",
+                      fontsize=8)
+
+    return figure
@@ -0,0 +1,85 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Figure Renderer:
+#     This file contains the rendering stage of the visualiser.
+#     The figures are described by render jobs, that are drawn and saved with the (headless) Agg backend, if needed in worker processes.
+#     A render job is a tuple of: (drawFunction, drawArguments, figurePath, savefigArguments)
+#         - drawFunction: module level function that draws the figure and returns it; it needs to be picklable so the job can be sent to a worker process
+#         - drawArguments: dictionary of the keyword arguments of the drawFunction (e.g. the aggregated DataFrames and the title)
+#         - figurePath: path where the figure will be saved
+#         - savefigArguments: dictionary of the keyword arguments of Figure.savefig() (e.g. dpi)
+
+
+import concurrent.futures
+
+import matplotlib
+import matplotlib.style
+import matplotlib.pyplot
+
+
+# The backend that is used to render the figures, it does not need a display
+RENDERING_BACKEND = "Agg"
+
+
+def initRendering():
+    """
+    Function to prepare the current process for the rendering of figures: the Agg backend is forced and the style of the visualiser is set.
+    It is called in the main process before the figures are drawn and in every worker process of the rendering stage.
+    :return: None
+    """
+    matplotlib.use(RENDERING_BACKEND)
+    matplotlib.style.use("ggplot")
+
+
+def renderFigure(drawFunction, drawArguments, figurePath, savefigArguments, show=False):
+    """
+    Function to draw a figure, save it and close it, so the memory of the figure is released immediately.
+    :param drawFunction: Function that draws the figure and returns it.
+    :param drawArguments: Dictionary of the keyword arguments of the drawFunction.
+    :param figurePath: The path where the figure will be saved to.
+    :param savefigArguments: Dictionary of the keyword arguments of Figure.savefig().
+    :param show: True if the figure shall be shown (matplotlib.pyplot.show()) after it was saved, False otherwise.
+    :return: The path of the saved figure.
+    """
+    figure = drawFunction(**drawArguments)
+    try:
+        with open(figurePath, "wb") as fileObject:
+            figure.savefig(fileObject, **savefigArguments)
+            fileObject.flush()
+        if show:
+            matplotlib.pyplot.show()
+    finally:
+        matplotlib.pyplot.close(figure)
+    return figurePath
+
+
+def renderFigures(renderJobs, jobs=1):
+    """
+    Function to render the figures of the render jobs. With more than one job the figures are rendered in worker processes, every figure is closed after it was saved.
+    :param renderJobs: [list((function, dict, str, dict))] The render jobs (see the description of this file).
+    :param jobs: Number of worker processes that may be used to render the figures.
+    :return: [list(str)] The paths of the saved figures, in the order of the renderJobs.
+    """
+    if jobs > 1 and len(renderJobs) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(renderJobs)), initializer=initRendering) as executor:
+            futures = [executor.submit(renderFigure, *renderJob) for renderJob in renderJobs]
+            figurePaths = [future.result() for future in futures]
+    else:
+        figurePaths = [renderFigure(*renderJob) for renderJob in renderJobs]
+    return figurePaths
@@ -39,7 +39,7 @@ def getLastModFileOrPrompt(subStringIdentifier: str, inOutPath: str, quiet: bool
     :return: file name to use
     """
     path = Emma.shared_libs.emma_helper.joinPath(inOutPath, Emma.shared_libs.stringConstants.OUTPUT_DIR)
-    lastModifiedFiles = Emma.shared_libs.emma_helper.lastModifiedFilesInDir(path, ".csv", subStringIdentifier)            # Newest file is last element
+    lastModifiedFiles = Emma.shared_libs.emma_helper.lastModifiedFilesInDir(path, Emma.shared_libs.stringConstants.REPORT_FILE_EXTENSIONS, subStringIdentifier)            # Newest file is last element
     fileToUse = None
     # Check if no files were found
     if len(lastModifiedFiles) < 1:
@@ -64,7 +64,7 @@ def getLastModFileOrPrompt(subStringIdentifier: str, inOutPath: str, quiet: bool
             text = input("> ")
             if text == "y":
                 break
-            if text is not None and text != "" and os.path.isfile(text) and text.endswith(".csv"):
+            if text is not None and text != "" and os.path.isfile(text) and text.endswith(Emma.shared_libs.stringConstants.REPORT_FILE_EXTENSIONS):
                 fileToUse = text
                 break
             else:
@@ -26,12 +26,6 @@ import base64
 
 from pypiscout.SCout_Logger import Logger as sc
 
-import markdown
-import markdown.extensions.codehilite
-import markdown.extensions.fenced_code
-import markdown.extensions.toc
-import markdown.extensions.tables
-
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 
 
@@ -88,6 +82,88 @@ def writeJson(jsonOutFilePath, dictToWrite):
         json.dump(dictToWrite, fp, indent='\t')
 
 
+def readLines(filePath, fileDescription="file"):
+    """
+    Generator to read a text file line by line
+    In contrast to readlines() the file is never loaded completely into memory, so the memory consumption is independent of the file size
+    :param filePath: Path of the file to read
+    :param fileDescription: Description of the file that will be used in the error message if the file does not exist (e.g. "map file")
+    :return: Generator yielding the lines of the file (including the line endings)
+    """
+    try:
+        with open(filePath, "r") as fileObject:
+            yield from fileObject
+    except FileNotFoundError:
+        sc().error(f"The {fileDescription} `{os.path.abspath(filePath)}` was not found!")
+
+
+class _RecordedError(Exception):
+    """
+    Exception to stop the function called by callWithRecordedLogging() after an error was logged.
+    """
+
+
+def callWithRecordedLogging(function, *args, forwardMessages=False):
+    """
+    Calls a function while the messages of the SCout logger are recorded instead of printed.
+    This is meant to be used in worker processes: the main process can print the recorded messages with replayLogging()
+    in a deterministic order and with its own logger settings (verbosity, actions for warnings and errors).
+    Logging an error stops the function, since the error action of the main process would stop the processing at this point as well.
+    The logger methods are restored afterwards, so the messages can be recorded in the main process as well.
+    :param function: The function to call. It has to be picklable if it is executed in a worker process.
+    :param args: The arguments the function will be called with.
+    :param forwardMessages: True if the messages shall be printed by the logger as well (only useful in the main process), False otherwise.
+                            In this case the error action of the logger is executed as well, instead of stopping the function.
+    :return: A tuple of the recorded messages as list((level, text, kwargs)) and the return value of the function (None if it was stopped by an error).
+    """
+    loggedMessages = []
+
+    def createRecorder(level):
+        """
+        Creates a function that records the log messages of a level instead of printing them.
+        :param level: Name of the logger method that will be replaced.
+        :return: The recorder function.
+        """
+        def recorder(*text, **kwargs):
+            loggedMessages.append((level, text, kwargs))
+            if forwardMessages:
+                originalMethods[level](*text, **kwargs)
+            elif level == "error":
+                raise _RecordedError()
+        return recorder
+
+    # The logger methods are replaced for the time of the call
+    logger = sc()
+    levels = ["debug", "info", "wwarning", "warning", "error"]
+    originalMethods = {level: getattr(logger, level) for level in levels}
+    replacedMethods = {level: logger.__dict__[level] for level in levels if level in logger.__dict__}
+    for level in levels:
+        setattr(logger, level, createRecorder(level))
+
+    try:
+        result = function(*args)
+    except _RecordedError:
+        result = None
+    finally:
+        for level in levels:
+            if level in replacedMethods:
+                setattr(logger, level, replacedMethods[level])
+            else:
+                delattr(logger, level)
+
+    return loggedMessages, result
+
+
+def replayLogging(loggedMessages):
+    """
+    Prints the log messages that were recorded by callWithRecordedLogging().
+    :param loggedMessages: The recorded messages as list((level, text, kwargs)).
+    :return: None
+    """
+    for level, text, kwargs in loggedMessages:
+        getattr(sc(), level)(*text, **kwargs)
+
+
 def unifyAddress(address):
     """
     Convert hex or dec address and returns both (in this order)
@@ -137,7 +213,7 @@ def getColourValFromString(inputString):
 def lastModifiedFilesInDir(path, extension, subStringIdentifier=""):
     """
     :param path: Directory the files are in
-    :param extension: Only files with a specified extension are included
+    :param extension: Only files with a specified extension (or with one of the extensions, if a tuple is given) are included
     :param subStringIdentifier: [str] Substring in file names to filter files; If an empty string is provided (= default) all files will be considered
     :return: Sorted list of modified files
     """
@@ -155,6 +231,49 @@ def lastModifiedFilesInDir(path, extension, subStringIdentifier=""):
     return result
 
 
+def readReport(reportPath, columns=None):
+    """
+    Reads a standard report (Section_Summary, Object_Summary, Objects_in_Sections) that was created by Emma.
+    The file format is selected based on the file extension: typed .parquet and .feather reports are read with pyarrow, everything else as ;-separated CSV.
+    The columns are read with the types of the report schema: REPORT_CATEGORY_COLUMNS as (sorted) categories and REPORT_INTEGER_COLUMNS as nullable int64 values,
+    the types of the other columns are inferred. CSV reports are read with the C engine, since the pyarrow engine would convert the hex addresses to numbers.
+    :param reportPath: Path of the report.
+    :param columns: List of the names of the columns that shall be read, None if every column is needed. Columns that the report does not have are ignored.
+    :return: [pandas.DataFrame] The content of the report, indexed by its addrStartDec column.
+    """
+    def selectColumns(reportColumns):
+        """
+        Function to select the columns that need to be read.
+        :param reportColumns: The names of the columns of the report, in the order of the report.
+        :return: The list of the selected column names, the addrStartDec column is always selected, since it is the index.
+        """
+        return [column for column in reportColumns if columns is None or column in columns or column == ADDR_START_DEC]
+
+    import pandas       # pylint: disable=import-outside-toplevel
+                        # Rationale: pandas takes long to import, so it is only imported if a report is read.
+    extension = os.path.splitext(reportPath)[1]
+    if extension in ("." + REPORT_FORMAT_PARQUET, "." + REPORT_FORMAT_FEATHER):
+        if extension == "." + REPORT_FORMAT_PARQUET:
+            result = pandas.read_parquet(reportPath)
+        else:
+            result = pandas.read_feather(reportPath)
+        result = result[selectColumns(result.columns)]
+        # The integer columns are already typed in these formats, only the categories need to be created
+        result = result.astype({column: "category" for column in REPORT_CATEGORY_COLUMNS if column in result.columns})
+    else:
+        # Reading only the header first, so the types can be given for the selected columns
+        usedColumns = selectColumns(pandas.read_csv(reportPath, sep=";", nrows=0).columns)
+        columnTypes = {column: "category" for column in REPORT_CATEGORY_COLUMNS if column in usedColumns}
+        columnTypes.update({column: "Int64" for column in REPORT_INTEGER_COLUMNS if column in usedColumns})
+        result = pandas.read_csv(reportPath, sep=";", usecols=usedColumns, dtype=columnTypes, engine="c")
+    # Depending on the format and on the pandas version the categories can be in the order of their appearance,
+    # they are sorted, so the groups of the aggregations are in alphabetical order, as they are for string columns
+    for column in REPORT_CATEGORY_COLUMNS:
+        if column in result.columns:
+            result[column] = result[column].cat.reorder_categories(sorted(result[column].cat.categories))
+    return result.set_index(ADDR_START_DEC)
+
+
 def evalSummary(filename):
     """
     Function to check whether current report file is section or object summary.
@@ -232,6 +351,14 @@ def convertMarkdownDataToHtmlData(markdownData):
     :param markdownData: The markdown formatted data that will be converted.
     :return: The created html formatted data.
     """
+    # pylint: disable=import-outside-toplevel
+    # Rationale: markdown and its extensions are only needed for the overview of the visualiser, so they are not imported during the analysis.
+    import markdown
+    import markdown.extensions.codehilite
+    import markdown.extensions.fenced_code
+    import markdown.extensions.toc
+    import markdown.extensions.tables
+
     # For available extensions see here: https://github.com/Python-Markdown/markdown/blob/master/docs/extensions/index.md
     htmlData = markdown.markdown(markdownData, extensions=[markdown.extensions.codehilite.CodeHiliteExtension(),
                                                            markdown.extensions.toc.TocExtension(),
@@ -60,6 +60,7 @@ LISTING_INDENT = "\t\t\t\t "                    # This is used if you want to li
 MAPFILE = "mapfile"
 MAPFILES = "mapfiles"
 OUTPUT_DIR = "memStats"
+MAPFILE_CACHE_DIR = ".emma_cache"
 OUTPUT_DIR_VISUALISER = "results"
 MEM_TYPE = "memType"
 MEM_REGION_TO_EXCLUDE = "memRegionExcludes"
@@ -70,6 +71,11 @@ OVERLAP_FLAG = "Overlapped by [configID::mapfile::section::object]"     # Is is
 PATTERNS_PATH = "patternsPath"
 PERCENTAGE = "percentage"
 REGEX = "regex"
+REPORT_FORMAT_CSV = "csv"
+REPORT_FORMAT_PARQUET = "parquet"
+REPORT_FORMAT_FEATHER = "feather"
+REPORT_FORMATS = [REPORT_FORMAT_CSV, REPORT_FORMAT_PARQUET, REPORT_FORMAT_FEATHER]
+REPORT_FILE_EXTENSIONS = tuple("." + reportFormat for reportFormat in REPORT_FORMATS)      # The standard reports can be read in any of these formats
 SECTION_NAME = "section"
 SECTION_SIZE_BYTE = "Section Size [Byte]"
 SECTIONS_TO_EXCLUDE_TAG = "sectionsToExclude"
@@ -107,6 +113,13 @@ UNKNOWN_MEM_TYPE = "<Emma_UnknownMemType>"
 UNKNOWN_CATEGORY = "<Emma_UnknownCategory>"
 UNKNOWN_ENTRY_NAME = "<Emma_UnknownName>"
 
+# Schema of the standard reports, based on which they are read with explicit types
+REPORT_CATEGORY_COLUMNS = [CONFIG_ID, MEM_TYPE, MEM_TYPE_TAG, CATEGORY, MAPFILE]            # Columns with few distinct values, these are read as pandas categories
+REPORT_INTEGER_COLUMNS = [ADDR_START_DEC, ADDR_END_DEC, SIZE_DEC, SIZE_DEC_ORIGINAL]        # Decimal addresses and sizes, these are read as (nullable) int64 values
+# Columns of the standard reports that are used by the visualiser
+VISUALISER_COLUMNS = [ADDR_START_HEX, ADDR_END_HEX, SIZE_HEX, ADDR_START_DEC, ADDR_END_DEC, SIZE_DEC, SECTION_NAME, OBJECT_NAME, CONFIG_ID, VAS_NAME, MEM_TYPE, MEM_TYPE_TAG, CATEGORY, DMA, MAPFILE,
+                      OVERLAP_FLAG, CONTAINMENT_FLAG, DUPLICATE_FLAG]
+
 # The HTML Template that will be used during the conversion of .md files to .html
 # The CSS in the header has two parts:
 #       /* Emma CSS part */
@@ -62,6 +62,7 @@ setuptools.setup(
                       "Markdown",
                       "matplotlib",
                       "pandas",
+                      "numpy",
                       "pypiscout>=2.0",
                       "graphviz",
                       "svgwrite"
@@ -72,6 +73,8 @@ setuptools.setup(
                          "mkdocs>=1.1.2",                       # There was a break in the config files: https://squidfunk.github.io/mkdocs-material/releases/5/
                          "mkdocs-material>=5.2.1"               # There was a break in the config files: https://squidfunk.github.io/mkdocs-material/releases/5/
                          ],
+                    "typedReports":                             # Parquet and Feather reports (`--format`) via `pip3 install pypiemma[typedReports]`
+                        ["pyarrow"],
                     },
     entry_points={                                              # Make Emma available as independent scripts
         "console_scripts": [
@@ -23,6 +23,7 @@ import unittest
 import sys
 import os
 import shutil
+import importlib.util
 
 from pypiscout.SCout_Logger import Logger as sc
 from matplotlib import pyplot as plt
@@ -129,6 +130,67 @@ class CmdEmma(TestHelper):
                                 # Rationale: The purpose here is to catch any exception.
             self.fail("Unexpected exception: " + str(e))
 
+    def test_parallelRun(self):
+        """
+        Check that a run processing the configIds in worker processes is successful
+        """
+        try:
+            args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder, "--jobs", "2"])
+            Emma.emma.main(args)
+        except Exception as e:  # pylint: disable=broad-except
+                                # Rationale: The purpose here is to catch any exception.
+            self.fail("Unexpected exception: " + str(e))
+
+    def test_columnarRun(self):
+        """
+        Check that a run with the columnar backend is successful
+        """
+        try:
+            args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder, "--columnar"])
+            Emma.emma.main(args)
+        except Exception as e:  # pylint: disable=broad-except
+                                # Rationale: The purpose here is to catch any exception.
+            self.fail("Unexpected exception: " + str(e))
+
+    def test_noCache(self):
+        """
+        Check that the parsed mapfiles are cached next to the output folder, unless `--noCache` is given
+        """
+        args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder, "--noCache"])
+        Emma.emma.main(args)
+        self.assertFalse(os.path.exists(os.path.join(self.cmdLineTestOutputFolder, MAPFILE_CACHE_DIR)))
+        args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder])
+        Emma.emma.main(args)
+        self.assertTrue(os.listdir(os.path.join(self.cmdLineTestOutputFolder, MAPFILE_CACHE_DIR)))
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "The typed report formats need pyarrow")
+    def test_typedReportFormats(self):
+        """
+        Check that the standard reports can be stored in the typed report formats
+        """
+        for reportFormat in [REPORT_FORMAT_PARQUET, REPORT_FORMAT_FEATHER]:
+            args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder, "--format", reportFormat])
+            Emma.emma.main(args)
+            reports = [report for report in os.listdir(os.path.join(self.cmdLineTestOutputFolder, OUTPUT_DIR)) if report.endswith("." + reportFormat)]
+            self.assertEqual(len(reports), 3)
+
+    def test_invalidReportFormat(self):
+        """
+        Check that an unknown report format is rejected by the parser
+        """
+        with self.assertRaises(SystemExit) as context:
+            Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--format", "xlsx"])
+        self.assertEqual(context.exception.code, 2)
+
+    def test_invalidJobs(self):
+        """
+        Check that a run with an invalid number of jobs exits with an error
+        """
+        with self.assertRaises(SystemExit) as context:
+            args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder, "--jobs", "0"])
+            Emma.emma.main(args)
+        self.assertEqual(context.exception.code, -10)
+
     def test_help(self):
         """
         Check that `--help` does not raise an exception but exits with SystemExit(0)
@@ -215,6 +277,15 @@ class CmdEmmaVis(TestHelper):
                                 # Rationale: The purpose here is to catch any exception.
             self.fail("Unexpected exception: " + str(e))
 
+    def test_invalidJobs(self):
+        """
+        Check that a run with an invalid number of jobs exits with an error
+        """
+        with self.assertRaises(SystemExit) as context:
+            args = Emma.emma_vis.parseArgs(["--project", self.cmdLineTestProjectFolder, "--overview", "--inOutDir", self.cmdLineTestOutputFolder, "--noprompt", "--quiet", "--jobs", "0"])
+            Emma.emma_vis.main(args)
+        self.assertEqual(context.exception.code, -10)
+
     def test_help(self):
         """
         Check that `--help` does not raise an exception but exits with SystemExit(0)
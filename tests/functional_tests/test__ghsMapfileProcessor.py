@@ -0,0 +1,63 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Emma Memory and Mapfile Analyser - tests of the GHS mapfile processing with the test_project
+
+
+import os
+import sys
+import unittest
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from tests.functional_tests.test__memoryMap_regression import importTestProject, memEntryState
+
+
+class GhsMapfileProcessorTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def assertSameImport(self, sequentialImport, parallelImport):
+        self.assertEqual(len(sequentialImport), len(parallelImport))
+        for (configId, sectionCollection, objectCollection), (parallelConfigId, parallelSectionCollection, parallelObjectCollection) in zip(sequentialImport, parallelImport):
+            self.assertEqual(configId, parallelConfigId)
+            self.assertTrue(sectionCollection)
+            self.assertTrue(objectCollection)
+            self.assertEqual([memEntryState(memEntry) + (memEntry.memType, memEntry.memTypeTag, memEntry.compilerSpecificData) for memEntry in sectionCollection],
+                             [memEntryState(memEntry) + (memEntry.memType, memEntry.memTypeTag, memEntry.compilerSpecificData) for memEntry in parallelSectionCollection])
+            self.assertEqual([memEntryState(memEntry) + (memEntry.memType, memEntry.memTypeTag, memEntry.compilerSpecificData) for memEntry in objectCollection],
+                             [memEntryState(memEntry) + (memEntry.memType, memEntry.memTypeTag, memEntry.compilerSpecificData) for memEntry in parallelObjectCollection])
+
+    def test_parallelImport(self):
+        self.assertSameImport(importTestProject(), importTestProject(jobs=2))
+
+    def test_cachedImport(self):
+        sequentialImport = importTestProject()
+        with tempfile.TemporaryDirectory() as cachePath:
+            # The first import fills the cache, the second one loads every mapfile from it
+            self.assertSameImport(sequentialImport, importTestProject(cachePath=cachePath))
+            self.assertTrue(os.listdir(cachePath))
+            self.assertSameImport(sequentialImport, importTestProject(cachePath=cachePath))
+            self.assertSameImport(sequentialImport, importTestProject(jobs=2, cachePath=cachePath))
+
+
+if __name__ == "__main__":
+    unittest.main()
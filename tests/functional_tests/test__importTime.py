@@ -0,0 +1,87 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Emma Memory and Mapfile Analyser - import time benchmark of the command line tools
+
+
+import os
+import sys
+import unittest
+import subprocess
+
+
+# Root folder of the repository, the commands are run from here
+REPOSITORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+# Dependencies that take long to import, these must only be imported by the code paths that need them
+HEAVY_MODULES = ["pandas", "numpy", "matplotlib", "svgwrite", "markdown"]
+# The commands are measured several times and the fastest run is used, so the benchmark is not disturbed by the load of the machine
+BENCHMARK_RUNS = 3
+
+
+def measureImports(arguments):
+    """
+    Runs a python command in a new interpreter and measures its imports with `-X importtime`.
+    :param arguments: The arguments of the python interpreter (e.g. ["-c", "import Emma.emma"]).
+    :return: [dict] The cumulative import time in microseconds per imported module name.
+    """
+    completedProcess = subprocess.run([sys.executable, "-X", "importtime"] + arguments, cwd=REPOSITORY_PATH, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    result = {}
+    for line in completedProcess.stderr.splitlines():
+        # Format of the lines: "import time: <self [us]> | <cumulative [us]> | <indented module name>"
+        if line.startswith("import time:") and "|" in line:
+            _, cumulativeTime, moduleName = line.split("|")
+            if cumulativeTime.strip().isdigit():
+                result[moduleName.strip()] = int(cumulativeTime)
+    return result
+
+
+def measureImportTime(statement, moduleName):
+    """
+    Measures the fastest cumulative import time of a module.
+    :param statement: The python statement that imports the module.
+    :param moduleName: Name of the module whose import time is measured.
+    :return: [int] The import time in microseconds.
+    """
+    return min(measureImports(["-c", statement])[moduleName] for _ in range(BENCHMARK_RUNS))
+
+
+class ImportTimeTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def assertNoHeavyModules(self, arguments):
+        importedModules = measureImports(arguments)
+        self.assertEqual([moduleName for moduleName in importedModules if moduleName.split(".")[0] in HEAVY_MODULES], [], "Heavy modules were imported by: " + " ".join(arguments))
+
+    def test_commandLineTools(self):
+        for moduleName in ["Emma.emma", "Emma.emma_vis", "Emma.emma_deltas"]:
+            self.assertNoHeavyModules(["-c", "import " + moduleName])
+
+    def test_topLevelScript(self):
+        self.assertNoHeavyModules(["Emma.py", "--version"])
+        self.assertNoHeavyModules(["Emma.py", "a", "--help"])
+
+    def test_importTimeBenchmark(self):
+        # The analyser shall start faster than pandas alone is imported, this would not be the case anymore if it imported pandas again
+        emmaImportTime = measureImportTime("import Emma.emma", "Emma.emma")
+        pandasImportTime = measureImportTime("import pandas", "pandas")
+        self.assertLess(emmaImportTime, pandasImportTime, f"Import of Emma.emma: {emmaImportTime} us, import of pandas: {pandasImportTime} us")
+
+
+if __name__ == "__main__":
+    unittest.main()
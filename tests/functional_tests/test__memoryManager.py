@@ -0,0 +1,152 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Emma Memory and Mapfile Analyser - tests of the processing of the test_project with the MemoryManager
+
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+from pypiscout.SCout_Logger import Logger as sc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.emma_libs.memoryManager
+import Emma.emma_libs.incrementalProcessing
+from tests.functional_tests.test__memoryMap_regression import memEntryState
+
+
+TEST_PROJECT_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "doc", "test_project")
+
+
+def processTestProject(cachePath, jobs=1, outputPath=None, testProjectFolder=TEST_PROJECT_FOLDER, incremental=True):
+    """
+    Processes the mapfiles of the test_project with a MemoryManager.
+    :param cachePath: Path of the directory where the results are cached, None if the cache shall not be used.
+    :param jobs: Number of worker processes that may be used.
+    :param outputPath: Path of the directory where the reports can be stored.
+    :param testProjectFolder: Path of the test_project (or of a copy of it).
+    :param incremental: True if the configIds shall be processed incrementally (needs the cache), False otherwise.
+    :return: The MemoryManager.
+    """
+    memoryManager = Emma.emma_libs.memoryManager.MemoryManager("test_project", testProjectFolder, os.path.join(testProjectFolder, "mapfiles"), outputPath,
+                                                               False, False, False, True, False, False, True, False, False, jobs, False, cachePath, incremental, REPORT_FORMAT_CSV)
+    memoryManager.readConfiguration()
+    memoryManager.processMapfiles()
+    return memoryManager
+
+
+class MemoryManagerCacheTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        sc()(invVerbosity=4, actionWarning=None, actionError=lambda: sys.exit("error"))
+
+    def assertSameMemoryContent(self, memoryContent, otherMemoryContent):
+        self.assertEqual(list(memoryContent), list(otherMemoryContent))
+        for configId in memoryContent:
+            self.assertEqual(list(memoryContent[configId]), list(otherMemoryContent[configId]))
+            for collectionType in memoryContent[configId]:
+                self.assertEqual([memEntryState(memEntry) + (memEntry.category, memEntry.memTypeTag) for memEntry in memoryContent[configId][collectionType]],
+                                 [memEntryState(memEntry) + (memEntry.category, memEntry.memTypeTag) for memEntry in otherMemoryContent[configId][collectionType]])
+
+    def test_cachedResults(self):
+        memoryContent = processTestProject(None).memoryContent
+        with tempfile.TemporaryDirectory() as cachePath:
+            # The first run fills the cache with the parsed mapfiles and with the processing states of the configIds
+            self.assertSameMemoryContent(memoryContent, processTestProject(cachePath).memoryContent)
+            processingStatesPath = os.path.join(cachePath, Emma.emma_libs.incrementalProcessing.PROCESSING_STATE_CACHE_FOLDER)
+            self.assertEqual(len(os.listdir(processingStatesPath)), len(memoryContent))
+            numberOfCacheEntries = len(os.listdir(cachePath))
+            # The following runs load everything from the cache
+            self.assertSameMemoryContent(memoryContent, processTestProject(cachePath).memoryContent)
+            self.assertSameMemoryContent(memoryContent, processTestProject(cachePath, jobs=2).memoryContent)
+            self.assertEqual(len(os.listdir(cachePath)), numberOfCacheEntries)
+            self.assertEqual(len(os.listdir(processingStatesPath)), len(memoryContent))
+
+    def test_cachedResultsWithoutIncrementalProcessing(self):
+        memoryContent = processTestProject(None).memoryContent
+        with tempfile.TemporaryDirectory() as cachePath:
+            # Only the parsed mapfiles are cached, the processing states are not stored
+            self.assertSameMemoryContent(memoryContent, processTestProject(cachePath, incremental=False).memoryContent)
+            self.assertSameMemoryContent(memoryContent, processTestProject(cachePath, incremental=False).memoryContent)
+            self.assertFalse(os.path.exists(os.path.join(cachePath, Emma.emma_libs.incrementalProcessing.PROCESSING_STATE_CACHE_FOLDER)))
+
+    def test_incrementalProcessing(self):
+        with tempfile.TemporaryDirectory() as temporaryPath:
+            testProjectFolder = shutil.copytree(TEST_PROJECT_FOLDER, os.path.join(temporaryPath, "test_project"))
+            cachePath = os.path.join(temporaryPath, ".emma_cache")
+            processTestProject(cachePath, testProjectFolder=testProjectFolder)
+            # Rebuilding one of the applications: one of its objects grows and overlaps the following one
+            mapfilePath = os.path.join(testProjectFolder, "mapfiles", "SOC_Application.map")
+            with open(mapfilePath, "r") as fileObject:
+                mapfileContent = fileObject.read()
+            with open(mapfilePath, "w") as fileObject:
+                fileObject.write(mapfileContent.replace("000ddee0+009c40  .text            logging.o", "000ddee0+00a000  .text            logging.o"))
+            self.assertSameMemoryContent(processTestProject(None, testProjectFolder=testProjectFolder).memoryContent,
+                                         processTestProject(cachePath, testProjectFolder=testProjectFolder).memoryContent)
+
+
+class MemoryManagerReportsTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        sc()(invVerbosity=4, actionWarning=None, actionError=lambda: sys.exit("error"))
+
+    def test_createReports(self):
+        with tempfile.TemporaryDirectory() as outputPath:
+            memoryManager = processTestProject(None, outputPath=outputPath)
+            numberOfEntries = {collectionType: sum(len(memoryManager.memoryContent[configId][collectionType]) for configId in memoryManager.memoryContent) for collectionType in [FILE_IDENTIFIER_SECTION_SUMMARY, FILE_IDENTIFIER_OBJECT_SUMMARY, FILE_IDENTIFIER_OBJECTS_IN_SECTIONS]}
+            memoryManager.createReports(teamscale=True)
+            reports = os.listdir(outputPath)
+            self.assertEqual(len(reports), 4)
+            # Every report contains the entries of all the configIds
+            for collectionType in numberOfEntries:
+                reportName = [report for report in reports if collectionType in report][0]
+                with open(os.path.join(outputPath, reportName), "r") as fp:
+                    self.assertEqual(len(fp.readlines()), numberOfEntries[collectionType] + 1)
+            teamScaleReportName = [report for report in reports if TEAMSCALE_PREFIX in report][0]
+            with open(os.path.join(outputPath, teamScaleReportName), "r") as fp:
+                self.assertEqual(len(json.load(fp)), numberOfEntries[FILE_IDENTIFIER_SECTION_SUMMARY] + numberOfEntries[FILE_IDENTIFIER_OBJECT_SUMMARY])
+
+    def test_createReportsConcurrently(self):
+        reports = {}
+        for jobs in [1, 3]:
+            with tempfile.TemporaryDirectory() as temporaryPath:
+                # The output folder does not exist yet, it is created by createReports()
+                outputPath = os.path.join(temporaryPath, OUTPUT_DIR)
+                memoryManager = processTestProject(None, jobs=jobs, outputPath=outputPath)
+                memoryManager.createReports(teamscale=True)
+                reports[jobs] = {}
+                for reportName in os.listdir(outputPath):
+                    with open(os.path.join(outputPath, reportName), "r") as fp:
+                        reports[jobs][reportName] = fp.read()
+        self.assertEqual(reports[3], reports[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,267 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Emma Memory and Mapfile Analyser - regression tests of the memoryMap algorithms against their reference implementations
+
+
+import os
+import sys
+import copy
+import random
+import tempfile
+import unittest
+import collections
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.emma_libs.memoryEntry
+import Emma.emma_libs.memoryMap
+import Emma.emma_libs.configuration
+import Emma.emma_libs.mapfileProcessorFactory
+import Emma.emma_libs.incrementalProcessing
+
+
+def referenceResolveDuplicateContainmentOverlap(consumerCollection):
+    # pylint: disable=too-many-nested-blocks, too-many-branches
+    # Rationale: This is the original implementation that compares every element with every other element, it is kept as reference.
+    """
+    The original O(n^2) implementation of memoryMap.resolveDuplicateContainmentOverlap(), the results of the current implementation are compared to it.
+    :param consumerCollection: A list of MemEntry objects sorted by their addressStart, the elements will be changed during the processing.
+    :return: None
+    """
+    for actualElementIndex, actualElement in enumerate(consumerCollection):
+        for otherElementIndex, otherElement in enumerate(consumerCollection):
+            if actualElementIndex != otherElementIndex:
+                if (actualElement.addressStart + actualElement.addressLength) <= otherElement.addressStart:
+                    break
+                if actualElement.addressStart >= (otherElement.addressStart + otherElement.addressLength):
+                    pass
+                else:
+                    if actualElement.addressStart == otherElement.addressStart and actualElement.addressLength == otherElement.addressLength:
+                        if actualElement.duplicateFlag is None:
+                            actualElement.duplicateFlag = otherElement.getFQN()
+                        if otherElement.duplicateFlag is not None:
+                            actualElement.addressLength = 0
+                    else:
+                        if actualElement.addressStart <= otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) >= (otherElement.addressStart + otherElement.addressLength):
+                            actualElement.containingOthersFlag = True
+                        else:
+                            if actualElement.addressStart >= otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) <= (otherElement.addressStart + otherElement.addressLength):
+                                if actualElement.containmentFlag is None:
+                                    actualElement.containmentFlag = otherElement.getFQN()
+                                    actualElement.addressLength = 0
+                            else:
+                                if actualElement.addressStart < otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) < (otherElement.addressStart + otherElement.addressLength):
+                                    actualElement.overlappingOthersFlag = True
+                                elif actualElement.addressStart > otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) > (otherElement.addressStart + otherElement.addressLength):
+                                    actualElement.overlapFlag = otherElement.getFQN()
+                                    newAddressStart = otherElement.addressStart + otherElement.addressLength
+                                    sizeOfOverlappingPart = newAddressStart - actualElement.addressStart
+                                    actualElement.addressStart = newAddressStart
+                                    actualElement.addressLength -= sizeOfOverlappingPart
+
+
+def memEntryState(memEntry):
+    """
+    Collects every attribute of a MemEntry object that can be changed by the memoryMap algorithms.
+    :param memEntry: The MemEntry object.
+    :return: A tuple of the attribute values.
+    """
+    return (memEntry.configID, memEntry.mapfile, memEntry.sectionName, memEntry.objectName,
+            memEntry.addressStart, memEntry.addressLength, memEntry.addressStartOriginal, memEntry.addressLengthOriginal,
+            memEntry.overlapFlag, memEntry.containmentFlag, memEntry.duplicateFlag, memEntry.containingOthersFlag, memEntry.overlappingOthersFlag)
+
+
+def importTestProject(jobs=1, cachePath=None):
+    """
+    Imports the sections and objects of every configId of the test_project.
+    :param jobs: Number of worker processes the mapfile processor may use.
+    :param cachePath: Path of the directory where the parsed mapfiles are cached, None if the cache shall not be used.
+    :return: A list of (configId, sectionCollection, objectCollection) tuples.
+    """
+    testProjectFolder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "doc", "test_project")
+    configuration = Emma.emma_libs.configuration.Configuration()
+    configuration.readConfiguration(testProjectFolder, os.path.join(testProjectFolder, "mapfiles"), True, False)
+
+    collections_ = []
+    for configId in configuration.globalConfig:
+        mapfileProcessor = Emma.emma_libs.mapfileProcessorFactory.createSpecificMapfileProcesor(configuration.globalConfig[configId]["compiler"])
+        sectionCollection, objectCollection = mapfileProcessor.processMapfiles(configId, configuration.globalConfig[configId], False, jobs, cachePath=cachePath)
+        collections_.append((configId, sectionCollection, objectCollection))
+    return collections_
+
+
+def createRandomCollection(numberOfElements, addressRange, maxLength, zeroLengthRatio):
+    """
+    Creates a sorted list of MemEntry objects with random addresses and lengths, having lots of duplicates, containments and overlaps.
+    :param numberOfElements: Number of MemEntry objects to create.
+    :param addressRange: The addressStart values will be chosen from [0, addressRange].
+    :param maxLength: The maximal addressLength.
+    :param zeroLengthRatio: Ratio of the elements with zero length.
+    :return: The list of MemEntry objects.
+    """
+    consumerCollection = []
+    for index in range(numberOfElements):
+        compilerSpecificData = collections.OrderedDict()
+        compilerSpecificData["DMA"] = True
+        consumerCollection.append(Emma.emma_libs.memoryEntry.MemEntry(configID="MCU",
+                                                                      mapfileName="mapfile.map",
+                                                                      addressStart=random.randint(0, addressRange),
+                                                                      addressLength=0 if random.random() < zeroLengthRatio else random.randint(1, maxLength),
+                                                                      sectionName=".section" + str(index),
+                                                                      objectName=random.choice(["", "object" + str(index)]),
+                                                                      compilerSpecificData=compilerSpecificData))
+    consumerCollection.sort(key=lambda memEntry: memEntry.addressStart)
+    return consumerCollection
+
+
+class ResolveDuplicateContainmentOverlapRegressionTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def assertSameResolution(self, consumerCollection):
+        expectedCollection = copy.deepcopy(consumerCollection)
+        referenceResolveDuplicateContainmentOverlap(expectedCollection)
+        columnarCollection = copy.deepcopy(consumerCollection)
+        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(columnarCollection, Emma.emma_libs.memoryEntry.SectionEntry, columnar=True)
+        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(consumerCollection, Emma.emma_libs.memoryEntry.SectionEntry)
+        self.assertEqual([memEntryState(memEntry) for memEntry in consumerCollection], [memEntryState(memEntry) for memEntry in expectedCollection])
+        self.assertEqual([memEntryState(memEntry) for memEntry in columnarCollection], [memEntryState(memEntry) for memEntry in expectedCollection])
+
+    def test_testProject(self):
+        for _, sectionCollection, objectCollection in importTestProject():
+            self.assertSameResolution(sectionCollection)
+            self.assertSameResolution(objectCollection)
+
+    def test_randomCollections(self):
+        random.seed(0)
+        for _ in range(500):
+            self.assertSameResolution(createRandomCollection(random.randint(1, 40), random.choice([5, 20, 100, 1000]), random.choice([1, 3, 10, 50, 500]), random.choice([0, 0.2, 0.5])))
+
+
+class IncrementalProcessingRegressionTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    MAPFILE_NAMES = ["Application.map", "OperatingSystem.map", "Bootloader.map"]
+
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.cachePath = os.path.join(self.temporaryDirectory.name, ".emma_cache")
+        self.configuration = {"patterns": {"mapfiles": collections.OrderedDict()}}
+        for mapfileName in self.MAPFILE_NAMES:
+            self.configuration["patterns"]["mapfiles"][mapfileName] = {"associatedFilename": os.path.join(self.temporaryDirectory.name, mapfileName)}
+
+    def tearDown(self):
+        self.temporaryDirectory.cleanup()
+
+    def writeMapfile(self, mapfileName, entries):
+        """
+        Stores the (sectionEntries, objectEntries) of a mapfile, so its content changes together with them.
+        """
+        with open(self.configuration["patterns"]["mapfiles"][mapfileName]["associatedFilename"], "w") as fileObject:
+            fileObject.write(repr(entries))
+
+    @staticmethod
+    def createRandomEntries(numberOfEntries, addressRange, maxLength):
+        return [(random.randint(0, addressRange), random.choice([0, random.randint(1, maxLength)]), ".section" + str(random.randint(0, 20)), "object" + str(random.randint(0, 50))) for _ in range(numberOfEntries)]
+
+    @staticmethod
+    def createCollections(entriesOfMapfiles):
+        """
+        Creates the sorted section and object collections from the entries of the mapfiles the same way as the mapfile processors do.
+        """
+        sectionCollection = []
+        objectCollection = []
+        for mapfileName, (sectionEntries, objectEntries) in entriesOfMapfiles.items():
+            for collection, entries, isObject in ((sectionCollection, sectionEntries, False), (objectCollection, objectEntries, True)):
+                for addressStart, addressLength, sectionName, objectName in entries:
+                    collection.append(Emma.emma_libs.memoryEntry.MemEntry(configID="MCU", mapfileName=mapfileName, addressStart=addressStart, addressLength=addressLength,
+                                                                          sectionName=sectionName, objectName=objectName if isObject else "", compilerSpecificData=collections.OrderedDict()))
+        for collection in (sectionCollection, objectCollection):
+            collection.sort(key=lambda memEntry: memEntry.addressStart)
+        return sectionCollection, objectCollection
+
+    def processCompletely(self, entriesOfMapfiles):
+        sectionCollection, objectCollection = self.createCollections(entriesOfMapfiles)
+        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(sectionCollection, Emma.emma_libs.memoryEntry.SectionEntry)
+        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(objectCollection, Emma.emma_libs.memoryEntry.ObjectEntry)
+        return sectionCollection, objectCollection, Emma.emma_libs.memoryMap.calculateObjectsInSections(sectionCollection, objectCollection)
+
+    def processIncrementally(self, entriesOfMapfiles):
+        incrementalProcessing = Emma.emma_libs.incrementalProcessing.IncrementalProcessing(self.cachePath, "MCU", self.configuration, ())
+        sectionCollection, objectCollection = self.createCollections(entriesOfMapfiles)
+        incrementalProcessing.resolveDuplicateContainmentOverlap(FILE_IDENTIFIER_SECTION_SUMMARY, sectionCollection, Emma.emma_libs.memoryEntry.SectionEntry)
+        incrementalProcessing.resolveDuplicateContainmentOverlap(FILE_IDENTIFIER_OBJECT_SUMMARY, objectCollection, Emma.emma_libs.memoryEntry.ObjectEntry)
+        objectsInSections = incrementalProcessing.calculateObjectsInSections(sectionCollection, objectCollection)
+        incrementalProcessing.storeState()
+        return (sectionCollection, objectCollection, objectsInSections), incrementalProcessing
+
+    def assertSameProcessing(self, entriesOfMapfiles):
+        (sectionCollection, objectCollection, objectsInSections), incrementalProcessing = self.processIncrementally(entriesOfMapfiles)
+        expectedSectionCollection, expectedObjectCollection, expectedObjectsInSections = self.processCompletely(entriesOfMapfiles)
+        self.assertEqual([memEntryState(memEntry) for memEntry in sectionCollection], [memEntryState(memEntry) for memEntry in expectedSectionCollection])
+        self.assertEqual([memEntryState(memEntry) for memEntry in objectCollection], [memEntryState(memEntry) for memEntry in expectedObjectCollection])
+        self.assertEqual([memEntryState(memEntry) for memEntry in objectsInSections], [memEntryState(memEntry) for memEntry in expectedObjectsInSections])
+        return incrementalProcessing
+
+    def test_randomChanges(self):
+        random.seed(0)
+        numberOfReusedElements = 0
+        for _ in range(100):
+            entriesOfMapfiles = collections.OrderedDict()
+            for mapfileName in self.MAPFILE_NAMES:
+                entriesOfMapfiles[mapfileName] = (self.createRandomEntries(random.randint(0, 15), 2000, 300), self.createRandomEntries(random.randint(0, 40), 2400, 60))
+                self.writeMapfile(mapfileName, entriesOfMapfiles[mapfileName])
+            # All the mapfiles changed since the previous iteration
+            self.assertSameProcessing(entriesOfMapfiles)
+            for _ in range(3):
+                # Changing some of the entries of one of the mapfiles, the others are processed with the state of the previous processing
+                changedMapfileName = random.choice(self.MAPFILE_NAMES)
+                sectionEntries, objectEntries = entriesOfMapfiles[changedMapfileName]
+                for entries, addressRange, maxLength in ((sectionEntries, 2000, 300), (objectEntries, 2400, 60)):
+                    for _ in range(random.randint(0, 3)):
+                        if entries and random.random() < 0.5:
+                            entries.pop(random.randrange(len(entries)))
+                        else:
+                            entries.extend(self.createRandomEntries(1, addressRange, maxLength))
+                self.writeMapfile(changedMapfileName, entriesOfMapfiles[changedMapfileName])
+                incrementalProcessing = self.assertSameProcessing(entriesOfMapfiles)
+                self.assertTrue(incrementalProcessing.changedMapfiles.issubset({changedMapfileName}))
+                numberOfReusedElements += sum(reprocessedElements.count(False) for reprocessedElements in incrementalProcessing.reprocessedElements.values())
+        # The state of the previous processing was used for a part of the elements
+        self.assertGreater(numberOfReusedElements, 0)
+
+    def test_unchangedMapfiles(self):
+        random.seed(1)
+        entriesOfMapfiles = collections.OrderedDict()
+        for mapfileName in self.MAPFILE_NAMES:
+            entriesOfMapfiles[mapfileName] = (self.createRandomEntries(15, 2000, 300), self.createRandomEntries(40, 2400, 60))
+            self.writeMapfile(mapfileName, entriesOfMapfiles[mapfileName])
+        self.assertSameProcessing(entriesOfMapfiles)
+        incrementalProcessing = self.assertSameProcessing(entriesOfMapfiles)
+        # Nothing was processed again
+        self.assertEqual(incrementalProcessing.changedMapfiles, set())
+        self.assertFalse(any(any(reprocessedElements) for reprocessedElements in incrementalProcessing.reprocessedElements.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import unittest
+import collections
+
+from pypiscout.SCout_Logger import Logger as sc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.shared_libs.emma_helper
+import Emma.emma_libs.memoryEntry
+import Emma.emma_libs.categorisation
+
+
+def createMemEntry(sectionName, objectName):
+    """
+    Creates a MemEntry object with the given names.
+    :return: The MemEntry object.
+    """
+    compilerSpecificData = collections.OrderedDict()
+    compilerSpecificData["DMA"] = True
+    return Emma.emma_libs.memoryEntry.MemEntry(configID="MCU", mapfileName="mapfile.map", addressStart=0x00, addressLength=0x10,
+                                               sectionName=sectionName, objectName=objectName, compilerSpecificData=compilerSpecificData)
+
+
+class CategorisationTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        sc()(invVerbosity=4, actionWarning=None, actionError=lambda: sys.exit("error"))
+        self.otherFilesFolder = os.path.join(os.path.dirname(__file__), "..", "other_files")
+        self.categoriesObjectsPath = os.path.join(self.otherFilesFolder, "testCategoriesObjects.json")
+        self.categoriesSectionsPath = os.path.join(self.otherFilesFolder, "testCategoriesSections.json")
+        self.categoriesObjectsKeywordsPath = os.path.join(self.otherFilesFolder, "testCategoriesObjectsKeywords.json")
+        self.assertFalse(os.path.exists(self.categoriesObjectsPath))
+        self.assertFalse(os.path.exists(self.categoriesSectionsPath))
+        self.assertFalse(os.path.exists(self.categoriesObjectsKeywordsPath))
+        Emma.shared_libs.emma_helper.writeJson(self.categoriesObjectsPath, {"Stack": ["can.o", "shared.o"], "Driver": ["shared.o", "shared.o"]})
+        Emma.shared_libs.emma_helper.writeJson(self.categoriesSectionsPath, {"Code": [".text"]})
+        Emma.shared_libs.emma_helper.writeJson(self.categoriesObjectsKeywordsPath, {"Os": ["os_", "sched"], "Scheduler": ["sched.*r"], "Can": ["can"]})
+
+    def tearDown(self):
+        os.remove(self.categoriesObjectsPath)
+        os.remove(self.categoriesSectionsPath)
+        os.remove(self.categoriesObjectsKeywordsPath)
+
+    def createCategorisation(self, createCategories=False):
+        return Emma.emma_libs.categorisation.Categorisation(self.categoriesObjectsPath, self.categoriesObjectsKeywordsPath,
+                                                            self.categoriesSectionsPath, os.path.join(self.otherFilesFolder, "DefinitelyNonExisting.json"),
+                                                            True, createCategories)
+
+    def test_fillOutCategories(self):
+        sectionCollection = [createMemEntry(".text", ""), createMemEntry(".data", "")]
+        objectCollection = [createMemEntry(".text", "can.o"), createMemEntry(".text", "shared.o"), createMemEntry(".text", "other.o")]
+        self.createCategorisation().fillOutCategories(sectionCollection, objectCollection)
+        self.assertEqual([memEntry.category for memEntry in sectionCollection], ["Code", UNKNOWN_CATEGORY])
+        self.assertEqual([memEntry.category for memEntry in objectCollection], ["Stack", "Driver, Driver, Stack", UNKNOWN_CATEGORY])
+
+    def test_removeUnmatchedUpdatesTheLookup(self):
+        categorisation = self.createCategorisation()
+        sectionCollection = [createMemEntry(".text", "")]
+        objectCollection = [createMemEntry(".text", "can.o"), createMemEntry(".text", "shared.o")]
+        categorisation.fillOutCategories(sectionCollection, objectCollection)
+        categorisation.manageCategoriesFiles(False, True, sectionCollection, objectCollection)
+        self.assertEqual(Emma.shared_libs.emma_helper.readJson(self.categoriesObjectsPath), {"Stack": [".text::can.o"]})
+        categorisation.fillOutCategories(sectionCollection, objectCollection)
+        self.assertEqual([memEntry.category for memEntry in objectCollection], [UNKNOWN_CATEGORY, UNKNOWN_CATEGORY])
+
+    def test_KeywordMatcher(self):
+        keywordMatcher = Emma.emma_libs.categorisation.KeywordMatcher(Emma.shared_libs.emma_helper.readJson(self.categoriesObjectsKeywordsPath))
+        self.assertEqual(keywordMatcher.findCategories("os_scheduler.o"), ("Os", "Os", "Scheduler"))
+        self.assertEqual(keywordMatcher.findCategories("os_tick.o"), ("Os",))
+        self.assertEqual(keywordMatcher.findCategories("scheduled.o"), ("Os",))
+        self.assertEqual(keywordMatcher.findCategories("globals.o"), ())
+        self.assertEqual(Emma.emma_libs.categorisation.KeywordMatcher({}).findCategories("globals.o"), ())
+
+    def test_categoriseByKeyword(self):
+        categorisation = self.createCategorisation(createCategories=True)
+        sectionCollection = []
+        objectCollection = [createMemEntry(".text", "can.o"), createMemEntry(".text", "os_scheduler.o"), createMemEntry(".text", "globals.o"), createMemEntry(".data", "os_scheduler.o")]
+        categorisation.fillOutCategories(sectionCollection, objectCollection)
+        # The category of the last matching keyword is used, but every match is recorded
+        self.assertEqual([memEntry.category for memEntry in objectCollection], ["Stack", "Scheduler", UNKNOWN_CATEGORY, "Scheduler"])
+        self.assertEqual(categorisation.keywordCategorisedObjects, [("os_scheduler.o", "Os"), ("os_scheduler.o", "Os"), ("os_scheduler.o", "Scheduler")] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
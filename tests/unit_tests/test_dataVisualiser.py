@@ -0,0 +1,181 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import importlib.util
+
+import pandas.testing
+from pypiscout.SCout_Logger import Logger as sc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.shared_libs.emma_helper
+import Emma.emma_libs.memoryMap
+import Emma.emma_vis_libs.dataVisualiser
+import Emma.emma_vis_libs.dataVisualiserSections
+import Emma.emma_vis_libs.dataVisualiserMemoryMap
+import Emma.emma_vis_libs.figureRenderer
+from tests.unit_tests.test_memoryMap import MemEntryData, createMemEntryObjects
+
+
+class MemStatsDataTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        sc()(invVerbosity=4, actionWarning=None, actionError=lambda: sys.exit("error"))
+        self.projectPath = tempfile.mkdtemp()
+        shutil.copy(os.path.join(os.path.dirname(__file__), "..", "..", "doc", "test_project", "budgets.json"), self.projectPath)
+        sectionContainer, _ = createMemEntryObjects([MemEntryData(0x1000, 0x1FFF, section=".text"),
+                                                     MemEntryData(0x1000, 0x1FFF, section=".text"),
+                                                     MemEntryData(0x1100, 0x11FF, section=".data")])
+        # The second section is a duplicate of the first one
+        sectionContainer[1].duplicateFlag = sectionContainer[0].getFQN()
+        for section in sectionContainer:
+            section.memTypeTag = "IntFlash"
+        self.reportPath = Emma.emma_libs.memoryMap.createReportPath(self.projectPath, "test", FILE_IDENTIFIER_SECTION_SUMMARY, REPORT_FORMAT_CSV)
+        Emma.emma_libs.memoryMap.writeReportToDisk(self.reportPath, sectionContainer)
+
+    def tearDown(self):
+        shutil.rmtree(self.projectPath)
+
+    def test_getReport(self):
+        memStatsData = Emma.emma_vis_libs.dataVisualiser.MemStatsData(self.projectPath)
+        self.assertIn("MCU", memStatsData.budgets[0])
+        report = memStatsData.getReport(self.reportPath)
+        pandas.testing.assert_frame_equal(report, Emma.shared_libs.emma_helper.readReport(self.reportPath, VISUALISER_COLUMNS))
+        # The report is read only once
+        self.assertIs(memStatsData.getReport(self.reportPath), report)
+
+    def test_getResolvedReport(self):
+        memStatsData = Emma.emma_vis_libs.dataVisualiser.MemStatsData(self.projectPath)
+        resolvedReport = memStatsData.getResolvedReport(self.reportPath)
+        pandas.testing.assert_frame_equal(resolvedReport, Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(Emma.shared_libs.emma_helper.readReport(self.reportPath, VISUALISER_COLUMNS)))
+        # The duplicate was removed
+        self.assertEqual(resolvedReport[SECTION_NAME].tolist(), [".text", ".data"])
+        self.assertIs(memStatsData.getResolvedReport(self.reportPath), resolvedReport)
+
+    def test_sharedByVisualisers(self):
+        memStatsData = Emma.emma_vis_libs.dataVisualiser.MemStatsData(self.projectPath)
+        firstVisualiser = Emma.emma_vis_libs.dataVisualiser.Visualiser(self.reportPath, self.projectPath, self.projectPath, memStatsData)
+        secondVisualiser = Emma.emma_vis_libs.dataVisualiser.Visualiser(self.reportPath, self.projectPath, self.projectPath, memStatsData)
+        self.assertIs(firstVisualiser.data, secondVisualiser.data)
+        self.assertIs(firstVisualiser.getResolvedData(), secondVisualiser.getResolvedData())
+        self.assertEqual(firstVisualiser.budgets, memStatsData.budgets)
+        # Without shared data the visualiser reads the report on its own
+        pandas.testing.assert_frame_equal(Emma.emma_vis_libs.dataVisualiser.Visualiser(self.reportPath, self.projectPath, self.projectPath).data, firstVisualiser.data)
+
+    def test_getAggregation(self):
+        visualiser = Emma.emma_vis_libs.dataVisualiser.Visualiser(self.reportPath, self.projectPath, self.projectPath)
+        calculatedKeys = []
+
+        def aggregate(key):
+            calculatedKeys.append(key)
+            return visualiser.data[SIZE_DEC].sum()
+
+        # Every aggregation is calculated only once
+        self.assertEqual(visualiser.getAggregation("first", lambda: aggregate("first")), 0x1000 + 0x1000 + 0x100)
+        visualiser.getAggregation("first", lambda: aggregate("first"))
+        visualiser.getAggregation(("second", (7, 9)), lambda: aggregate("second"))
+        self.assertEqual(calculatedKeys, ["first", "second"])
+        # The aggregations are calculated again after the data or the budgets were replaced
+        visualiser.data = visualiser.data.iloc[:1]
+        self.assertEqual(visualiser.getAggregation("first", lambda: aggregate("first")), 0x1000)
+        visualiser.budgets = []
+        visualiser.getAggregation("first", lambda: aggregate("first"))
+        self.assertEqual(calculatedKeys, ["first", "second", "first", "first"])
+
+    def test_imageConsumptionListAggregations(self):
+        imageConsumption = Emma.emma_vis_libs.dataVisualiserSections.ImageConsumptionList(self.projectPath, self.reportPath, self.projectPath)
+        # The aggregations calculated during the initialisation are reused
+        self.assertIs(imageConsumption.calcConsumptionByMemType(), imageConsumption.consumptionByMemType)
+        self.assertIs(imageConsumption.calcConsumptionByMemTypeDetailed(), imageConsumption.consumptionByMemTypeDetailed)
+        self.assertIs(imageConsumption.calcConsumptionByMemTypePerMap(), imageConsumption.consumptionByMemTypePerMap)
+        self.assertIs(imageConsumption.groupDataByMemType([7, 9, 10, 13]), imageConsumption.groupDataByMemType([7, 9, 10, 13]))
+        self.assertIsNot(imageConsumption.groupDataByMemType([7, 9, 10, 13]), imageConsumption.groupDataByMemType([7, 9, 13]))
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "The typed report formats need pyarrow")
+    def test_imageConsumptionListGroupOrder(self):
+        sectionContainer, _ = createMemEntryObjects([MemEntryData(0x1000, 0x1FFF, section=".data"),
+                                                     MemEntryData(0x2000, 0x2FFF, section=".text")])
+        sectionContainer[0].memType = "INT_RAM"
+        # A typed report written by other tools can store the categories in the order of their appearance
+        reportData = Emma.emma_libs.memoryMap.createReportDataFrame(sectionContainer)
+        reportData[MEM_TYPE] = pandas.Categorical(reportData[MEM_TYPE], categories=["INT_RAM", "INT_FLASH"])
+        typedReportPath = Emma.emma_libs.memoryMap.createReportPath(self.projectPath, "typed", FILE_IDENTIFIER_SECTION_SUMMARY, REPORT_FORMAT_PARQUET)
+        reportData.to_parquet(typedReportPath, index=False)
+        imageConsumption = Emma.emma_vis_libs.dataVisualiserSections.ImageConsumptionList(self.projectPath, typedReportPath, self.projectPath)
+        # The groups of the overview are in alphabetical order, as they are for a CSV report
+        self.assertEqual(list(imageConsumption.consumptionByMemType.index), [("MCU", "INT_FLASH"), ("MCU", "INT_RAM")])
+        self.assertEqual(list(imageConsumption.consumptionByMemTypePerMap.index), [("MCU", "mapfile.map", "INT_FLASH"), ("MCU", "mapfile.map", "INT_RAM")])
+
+    def test_consumptionToString(self):
+        imageConsumption = Emma.emma_vis_libs.dataVisualiserSections.ImageConsumptionList(self.projectPath, self.reportPath, self.projectPath)
+        # The tables are converted in the same format, regardless of the display options that were set globally
+        with pandas.option_context("display.float_format", "{:,.2f}".format):
+            consumption = Emma.emma_vis_libs.dataVisualiser.consumptionToString(imageConsumption.consumptionByMemType)
+        self.assertEqual(consumption, "\n".join(["                    sizeDec [Byte]  budget [Byte]       used [%]  available [%]",
+                                                 "configID memType                                                               ",
+                                                 "MCU      INT_FLASH           4,352        524,288              1             99"]))
+        # The global display options are not changed by the visualisers
+        self.assertIsNone(pandas.get_option("display.float_format"))
+
+    def test_createMarkdownOverview(self):
+        imageConsumption = Emma.emma_vis_libs.dataVisualiserSections.ImageConsumptionList(self.projectPath, self.reportPath, self.projectPath)
+        # The tables are written in the same format, regardless of the display options that were set globally
+        with pandas.option_context("display.float_format", "{:,.2f}".format):
+            markdownFilePath = imageConsumption.createMarkdownOverview(plotFigure=False)
+        with open(markdownFilePath, "r") as markdown:
+            overview = markdown.read()
+        self.assertIn("\n".join(["# Usage by Memory Type",
+                                 "    ",
+                                 "                        sizeDec [Byte]  budget [Byte]       used [%]  available [%]",
+                                 "    configID memType                                                               ",
+                                 "    MCU      INT_FLASH           4,352        524,288              1             99",
+                                 ""]), overview)
+        self.assertIn("\n".join(["# Usage by Mapfile",
+                                 "    ",
+                                 "                                    sizeDec [Byte]",
+                                 "    configID mapfile     memType                  ",
+                                 "    MCU      mapfile.map INT_FLASH           8,448",
+                                 ""]), overview)
+        # The global display options are not changed by the visualisers
+        self.assertIsNone(pandas.get_option("display.float_format"))
+
+    def test_renderJobs(self):
+        Emma.emma_vis_libs.figureRenderer.initRendering()
+        memStatsData = Emma.emma_vis_libs.dataVisualiser.MemStatsData(self.projectPath)
+        imageConsumption = Emma.emma_vis_libs.dataVisualiserSections.ImageConsumptionList(self.projectPath, self.reportPath, self.projectPath, memStatsData)
+        memoryMap = Emma.emma_vis_libs.dataVisualiserMemoryMap.MemoryMap(self.projectPath, self.reportPath, self.projectPath, memStatsData)
+        renderJobs = memoryMap.getPieChartRenderJobs() + [imageConsumption.getRenderJobByMemType()]
+        figurePaths = Emma.emma_vis_libs.figureRenderer.renderFigures(renderJobs, jobs=2)
+        self.assertEqual(len(figurePaths), len(renderJobs))
+        for figurePath in figurePaths:
+            self.assertTrue(os.path.isfile(figurePath))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,10 @@ import os
 import sys
 import unittest
 import platform
+import importlib.util
+import tempfile
+
+import pandas
 
 from pypiscout.SCout_Logger import Logger as sc
 
@@ -92,6 +96,41 @@ class EmmaHelperTestCase(unittest.TestCase):
         os.remove(jsonTestFilePath)
         self.assertFalse(os.path.exists(jsonTestFilePath))
 
+    def test_readLines(self):
+        textTestFilePath = os.path.join(os.path.dirname(__file__), "..", "other_files", "testText.txt")
+        self.assertFalse(os.path.exists(textTestFilePath))
+
+        with open(textTestFilePath, "w") as fileObject:
+            fileObject.write("first line\nsecond line\nlast line without line ending")
+        lines = Emma.shared_libs.emma_helper.readLines(textTestFilePath)
+        self.assertEqual(next(lines), "first line\n")
+        self.assertEqual(list(lines), ["second line\n", "last line without line ending"])
+
+        os.remove(textTestFilePath)
+        self.assertFalse(os.path.exists(textTestFilePath))
+
+        with self.assertRaises(SystemExit) as contextManager:
+            list(Emma.shared_libs.emma_helper.readLines("DefinitelyNonExisting.file"))
+        self.assertEqual(contextManager.exception.code, "error")
+
+    def test_callWithRecordedLogging(self):
+        def functionWithLogging(value):
+            sc().info("Info message", value)
+            if value < 0:
+                sc().error("Negative value")
+            return value * 2
+
+        loggedMessages, result = Emma.shared_libs.emma_helper.callWithRecordedLogging(functionWithLogging, 21)
+        self.assertEqual(result, 42)
+        self.assertEqual(loggedMessages, [("info", ("Info message", 21), {})])
+        loggedMessages, result = Emma.shared_libs.emma_helper.callWithRecordedLogging(functionWithLogging, -1)
+        self.assertIsNone(result)
+        self.assertEqual([level for level, _, _ in loggedMessages], ["info", "error"])
+        # The logger works as before the calls
+        with self.assertRaises(SystemExit) as contextManager:
+            Emma.shared_libs.emma_helper.replayLogging(loggedMessages)
+        self.assertEqual(contextManager.exception.code, "error")
+
     def test_unifyAddress(self):
         hexResult, decResult = Emma.shared_libs.emma_helper.unifyAddress("0x16")
         self.assertEqual(hexResult, "0x16")
@@ -121,6 +160,44 @@ class EmmaHelperTestCase(unittest.TestCase):
         self.assertEqual(" 1.10 KiB", Emma.shared_libs.emma_helper.toHumanReadable(1126))
         self.assertEqual(" 157.36 GiB", Emma.shared_libs.emma_helper.toHumanReadable(168963795964))
 
+    def test_readReport(self):
+        with tempfile.TemporaryDirectory() as reportDirectory:
+            reportPath = os.path.join(reportDirectory, "report.csv")
+            with open(reportPath, "w") as fileObject:
+                fileObject.write(";".join([ADDR_START_HEX, ADDR_START_DEC, SIZE_DEC, CONFIG_ID, MEM_TYPE, SECTION_NAME, FQN]) + "\n")
+                fileObject.write(";".join(["0x1000", "4096", "256", "MCU", "INT_RAM", ".data", "MCU::.data"]) + "\n")
+                fileObject.write(";".join(["0x1100", "4352", "", "MCU", "INT_FLASH", ".text", "MCU::.text"]) + "\n")
+            # Every column is read without the columns argument
+            reportData = Emma.shared_libs.emma_helper.readReport(reportPath)
+            self.assertEqual(list(reportData.columns), [ADDR_START_HEX, SIZE_DEC, CONFIG_ID, MEM_TYPE, SECTION_NAME, FQN])
+            # The hex addresses are kept as text
+            self.assertEqual(reportData[ADDR_START_HEX].tolist(), ["0x1000", "0x1100"])
+            self.assertEqual(list(reportData.index), [0x1000, 0x1100])
+            # The columns are read with the types of the report schema
+            self.assertEqual(str(reportData[SIZE_DEC].dtype), "Int64")
+            self.assertEqual(reportData[SIZE_DEC].tolist(), [256, pandas.NA])
+            self.assertEqual(str(reportData[CONFIG_ID].dtype), "category")
+            # The categories are sorted, regardless of the order of their appearance
+            self.assertEqual(list(reportData[MEM_TYPE].cat.categories), ["INT_FLASH", "INT_RAM"])
+            # Only the selected columns and the index are read, the columns that the report does not have are ignored
+            reportData = Emma.shared_libs.emma_helper.readReport(reportPath, [SIZE_DEC, MEM_TYPE, CATEGORY])
+            self.assertEqual(list(reportData.columns), [SIZE_DEC, MEM_TYPE])
+            self.assertEqual(list(reportData.index), [0x1000, 0x1100])
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "The typed report formats need pyarrow")
+    def test_readTypedReportCategories(self):
+        # The typed formats keep the order of the categories they were written with
+        mapfiles = ["SOC_OperatingSystem.map", "SOC_Application.map", "SOC_OperatingSystem.map"]
+        reportData = pandas.DataFrame({ADDR_START_DEC: [0x1000, 0x2000, 0x3000], MAPFILE: pandas.Categorical(mapfiles, categories=["SOC_OperatingSystem.map", "SOC_Application.map"])})
+        with tempfile.TemporaryDirectory() as reportDirectory:
+            for reportFormat in [REPORT_FORMAT_PARQUET, REPORT_FORMAT_FEATHER]:
+                reportPath = os.path.join(reportDirectory, "report." + reportFormat)
+                getattr(reportData, "to_" + reportFormat)(reportPath)
+                readReportData = Emma.shared_libs.emma_helper.readReport(reportPath)
+                self.assertEqual(list(readReportData[MAPFILE].cat.categories), ["SOC_Application.map", "SOC_OperatingSystem.map"])
+                self.assertEqual(readReportData[MAPFILE].tolist(), mapfiles)
+                self.assertEqual(list(readReportData.groupby(MAPFILE, observed=True).size().index), ["SOC_Application.map", "SOC_OperatingSystem.map"])
+
     def test_evalSummary(self):
         self.assertEqual(Emma.shared_libs.emma_helper.evalSummary("Projectname_" + FILE_IDENTIFIER_SECTION_SUMMARY + "_2017-11-06-14h56s52.csv"), FILE_IDENTIFIER_SECTION_SUMMARY)
         self.assertEqual(Emma.shared_libs.emma_helper.evalSummary("Projectname_" + FILE_IDENTIFIER_OBJECT_SUMMARY + "_2017-11-06-14h56s52.csv"), FILE_IDENTIFIER_OBJECT_SUMMARY)
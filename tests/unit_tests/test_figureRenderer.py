@@ -0,0 +1,91 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import matplotlib.pyplot
+from pypiscout.SCout_Logger import Logger as sc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_vis_libs.figureRenderer
+
+
+def drawLine(values, title):
+    """
+    Draws a line graph, the render jobs need a module level function so they can be sent to the worker processes.
+    """
+    figure, axes = matplotlib.pyplot.subplots()
+    axes.plot(values)
+    axes.set_title(title)
+    return figure
+
+
+class FigureRendererTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        sc()(invVerbosity=4, actionWarning=None, actionError=lambda: sys.exit("error"))
+        Emma.emma_vis_libs.figureRenderer.initRendering()
+        # The figures left open by other tests would be counted as not closed
+        matplotlib.pyplot.close("all")
+        self.resultsPath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.resultsPath)
+
+    def createRenderJobs(self, numberOfFigures):
+        return [(drawLine, {"values": [0, index, 2 * index], "title": "Figure " + str(index)}, os.path.join(self.resultsPath, "figure" + str(index) + ".png"), {"dpi": 50})
+                for index in range(numberOfFigures)]
+
+    def test_initRendering(self):
+        self.assertEqual(matplotlib.get_backend().lower(), Emma.emma_vis_libs.figureRenderer.RENDERING_BACKEND.lower())
+
+    def test_renderFigure(self):
+        renderJob = self.createRenderJobs(1)[0]
+        self.assertEqual(Emma.emma_vis_libs.figureRenderer.renderFigure(*renderJob), renderJob[2])
+        with open(renderJob[2], "rb") as fileObject:
+            self.assertEqual(fileObject.read(8), b"\x89PNG\r\n\x1a\n")
+        # The figure was closed after it was saved
+        self.assertEqual(matplotlib.pyplot.get_fignums(), [])
+
+    def test_renderFigures(self):
+        renderJobs = self.createRenderJobs(4)
+        figurePaths = Emma.emma_vis_libs.figureRenderer.renderFigures(renderJobs)
+        sequentialFigures = []
+        for figurePath in figurePaths:
+            with open(figurePath, "rb") as fileObject:
+                sequentialFigures.append(fileObject.read())
+        # The worker processes render the same figures, the paths are returned in the order of the render jobs
+        self.assertEqual(Emma.emma_vis_libs.figureRenderer.renderFigures(renderJobs, jobs=3), [renderJob[2] for renderJob in renderJobs])
+        for figurePath, sequentialFigure in zip(figurePaths, sequentialFigures):
+            with open(figurePath, "rb") as fileObject:
+                self.assertEqual(fileObject.read(), sequentialFigure)
+        self.assertEqual(matplotlib.pyplot.get_fignums(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import random
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_libs.ghsMapfileProcessor
+
+
+def referenceTranslateAddress(elementVirtualStartAddress, elementSize, virtualSectionsOfThisMapfile, monolithFileContent):
+    """
+    The original linear address translation, the results of the indexed translation are compared to it.
+    :return: Physical start address of the element and the name of the virtual section the translation was done with (None, None if the translation failed).
+    """
+    elementVirtualStartAddress = int(elementVirtualStartAddress, 16)
+    elementSize = int(elementSize, 16)
+    for virtualStartAddress, _, offset, size, sectionName in monolithFileContent:
+        if sectionName in virtualSectionsOfThisMapfile:
+            virtualSectionEndAddress = virtualStartAddress + (size - 1) if size > 0 else virtualStartAddress
+            elementVirtualEndAddress = elementVirtualStartAddress + (elementSize - 1) if elementSize > 0 else elementVirtualStartAddress
+            if virtualStartAddress <= elementVirtualStartAddress <= elementVirtualEndAddress <= virtualSectionEndAddress:
+                return elementVirtualStartAddress + offset, sectionName
+    return None, None
+
+
+class TranslateAddressTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring, protected-access
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+    #            The address translation is a private functionality of the GhsMapfileProcessor, it can only be accessed via name mangling.
+
+    def setUp(self):
+        self.createVirtualSectionIndex = Emma.emma_libs.ghsMapfileProcessor.GhsMapfileProcessor._GhsMapfileProcessor__createVirtualSectionIndex
+        self.translateAddress = Emma.emma_libs.ghsMapfileProcessor.GhsMapfileProcessor._GhsMapfileProcessor__translateAddress
+        # Table of the monolith file: virtual, physical, offset, size, section
+        self.monolithFileContent = [[0x1000, 0x81000, 0x80000, 0x1000, ".app_text"],
+                                    [0x2000, 0x90000, 0x8E000, 0x0800, ".app_data"],
+                                    [0x1000, 0xA1000, 0xA0000, 0x1000, ".os_text"]]
+
+    def test_translation(self):
+        virtualSectionIndex = self.createVirtualSectionIndex([".app_text", ".app_data"], self.monolithFileContent)
+        self.assertEqual(self.translateAddress("1000", "10", virtualSectionIndex), (0x81000, ".app_text"))
+        self.assertEqual(self.translateAddress("1ff0", "10", virtualSectionIndex), (0x81ff0, ".app_text"))
+        self.assertEqual(self.translateAddress("2100", "0", virtualSectionIndex), (0x90100, ".app_data"))
+        virtualSectionIndex = self.createVirtualSectionIndex([".os_text"], self.monolithFileContent)
+        self.assertEqual(self.translateAddress("1000", "10", virtualSectionIndex), (0xA1000, ".os_text"))
+
+    def test_failedTranslation(self):
+        virtualSectionIndex = self.createVirtualSectionIndex([".app_text", ".app_data"], self.monolithFileContent)
+        self.assertEqual(self.translateAddress("0ff0", "10", virtualSectionIndex), (None, None))
+        self.assertEqual(self.translateAddress("1ff0", "20", virtualSectionIndex), (None, None))
+        self.assertEqual(self.translateAddress("3000", "10", virtualSectionIndex), (None, None))
+        virtualSectionIndex = self.createVirtualSectionIndex([".unknown"], self.monolithFileContent)
+        self.assertEqual(self.translateAddress("1000", "10", virtualSectionIndex), (None, None))
+
+    def test_randomMonolithFiles(self):
+        random.seed(0)
+        for _ in range(500):
+            monolithFileContent = []
+            for _ in range(random.randint(0, 8)):
+                virtualAddress = random.randint(0, 200)
+                physicalAddress = random.randint(0, 1000)
+                monolithFileContent.append([virtualAddress, physicalAddress, physicalAddress - virtualAddress, random.randint(0, 60), ".section" + str(random.randint(0, 5))])
+            virtualSectionsOfThisMapfile = [".section" + str(index) for index in range(6) if random.random() < 0.6]
+            virtualSectionIndex = self.createVirtualSectionIndex(virtualSectionsOfThisMapfile, monolithFileContent)
+            for _ in range(20):
+                elementVirtualStartAddress = hex(random.randint(0, 260))
+                elementSize = hex(random.choice([0, random.randint(1, 40)]))
+                self.assertEqual(self.translateAddress(elementVirtualStartAddress, elementSize, virtualSectionIndex),
+                                 referenceTranslateAddress(elementVirtualStartAddress, elementSize, virtualSectionsOfThisMapfile, monolithFileContent))
+
+
+if __name__ == "__main__":
+    unittest.main()
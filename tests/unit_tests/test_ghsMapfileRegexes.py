@@ -0,0 +1,76 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import re
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_libs.ghsMapfileRegexes
+
+
+class IsCandidateLineTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    """
+    Unit tests for the line shape checks of the mapfile regex patterns.
+    """
+    def setUp(self):
+        self.sectionLine = "  .text                00034900  0000cd00     00052480   0000000\n"
+        self.objectLine = "00034900+001000  .text            can_driver.o\n"
+        self.symbolLine = " .rodata          00041600+00000080 sFirmwareId\n"
+
+    def test_imageSummaryPattern(self):
+        pattern = Emma.emma_libs.ghsMapfileRegexes.ImageSummaryPattern()
+        self.assertTrue(pattern.isCandidateLine(self.sectionLine))
+        self.assertTrue(pattern.isCandidateLine(self.symbolLine))
+        self.assertFalse(pattern.isCandidateLine(self.objectLine))
+        self.assertFalse(pattern.isCandidateLine(""))
+
+    def test_moduleSummaryPattern(self):
+        pattern = Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern()
+        self.assertTrue(pattern.isCandidateLine(self.objectLine))
+        self.assertFalse(pattern.isCandidateLine(self.sectionLine))
+        self.assertFalse(pattern.isCandidateLine(self.symbolLine))
+        self.assertFalse(pattern.isCandidateLine(""))
+
+    def test_uniquePattern(self):
+        pattern = Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern()
+        pattern.pattern = r"^\s+(?P<origin>[0-9a-f]+)"
+        pattern.uniquePattern = True
+        self.assertTrue(pattern.isCandidateLine(self.sectionLine))
+
+    def test_noMatchForNonCandidateLines(self):
+        mapfilesFolder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "doc", "test_project", "mapfiles")
+        patterns = [Emma.emma_libs.ghsMapfileRegexes.ImageSummaryPattern(), Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern()]
+        for mapfile in os.listdir(mapfilesFolder):
+            with open(os.path.join(mapfilesFolder, mapfile), "r") as fileObject:
+                for line in fileObject:
+                    for pattern in patterns:
+                        if not pattern.isCandidateLine(line):
+                            self.assertIsNone(re.search(pattern.pattern, line))
+
+
+if __name__ == "__main__":
+    unittest.main()
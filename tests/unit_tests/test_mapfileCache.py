@@ -0,0 +1,115 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import time
+import tempfile
+import unittest
+
+from pypiscout.SCout_Logger import Logger as sc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_libs.mapfileCache
+
+
+class InterruptedPickling:
+    # pylint: disable=too-few-public-methods
+    # Rationale: This class only simulates that the storing of a cache entry is interrupted.
+    """
+    A value whose pickling is interrupted as if the user pressed Ctrl+C.
+    """
+    def __reduce__(self):
+        raise KeyboardInterrupt()
+
+
+class MapfileCacheTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        sc()(invVerbosity=4, actionWarning=None, actionError=lambda: sys.exit("error"))
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.cachePath = os.path.join(self.temporaryDirectory.name, ".emma_cache")
+        self.mapfilePath = os.path.join(self.temporaryDirectory.name, "test.map")
+        with open(self.mapfilePath, "w") as fileObject:
+            fileObject.write("mapfile content\n")
+
+    def tearDown(self):
+        self.temporaryDirectory.cleanup()
+
+    def test_createKey(self):
+        key = Emma.emma_libs.mapfileCache.MapfileCache.createKey(("MCU", 0), [self.mapfilePath])
+        self.assertEqual(key, Emma.emma_libs.mapfileCache.MapfileCache.createKey(("MCU", 0), [self.mapfilePath]))
+        self.assertNotEqual(key, Emma.emma_libs.mapfileCache.MapfileCache.createKey(("MCU", 1), [self.mapfilePath]))
+        with open(self.mapfilePath, "a") as fileObject:
+            fileObject.write("changed content\n")
+        self.assertNotEqual(key, Emma.emma_libs.mapfileCache.MapfileCache.createKey(("MCU", 0), [self.mapfilePath]))
+        self.assertIsNone(Emma.emma_libs.mapfileCache.MapfileCache.createKey(("MCU", 0), [self.mapfilePath, self.mapfilePath + ".missing"]))
+        self.assertIsNone(Emma.emma_libs.mapfileCache.MapfileCache.hashFile(self.mapfilePath + ".missing"))
+
+    def test_createKeyFromFileHashes(self):
+        fileHashes = {self.mapfilePath: Emma.emma_libs.mapfileCache.MapfileCache.hashFile(self.mapfilePath)}
+        key = Emma.emma_libs.mapfileCache.MapfileCache.createKey(("MCU", 0), [self.mapfilePath])
+        self.assertEqual(key, Emma.emma_libs.mapfileCache.MapfileCache.createKey(("MCU", 0), [self.mapfilePath], fileHashes))
+        # The files whose hashes are given are not read again
+        os.remove(self.mapfilePath)
+        self.assertEqual(key, Emma.emma_libs.mapfileCache.MapfileCache.createKey(("MCU", 0), [self.mapfilePath], fileHashes))
+        self.assertIsNone(Emma.emma_libs.mapfileCache.MapfileCache.createKey(("MCU", 0), [self.mapfilePath]))
+
+    def test_storeAndLoad(self):
+        mapfileCache = Emma.emma_libs.mapfileCache.MapfileCache(self.cachePath)
+        self.assertIsNone(mapfileCache.load("key"))
+        mapfileCache.store("key", ([], ([(0x100, 0x10, ".text", "", None)], [])))
+        self.assertEqual(mapfileCache.load("key"), ([], ([(0x100, 0x10, ".text", "", None)], [])))
+        # A damaged entry is ignored
+        with open(os.path.join(self.cachePath, "key" + Emma.emma_libs.mapfileCache.CACHE_ENTRY_EXTENSION), "wb") as fileObject:
+            fileObject.write(b"damaged")
+        self.assertIsNone(mapfileCache.load("key"))
+
+    def test_leastRecentlyUsedEviction(self):
+        value = b"x" * 1000
+        mapfileCache = Emma.emma_libs.mapfileCache.MapfileCache(self.cachePath, sizeLimit=2500)
+        mapfileCache.store("first", value)
+        mapfileCache.store("second", value)
+        # Marking the first entry as used more recently than the second one
+        os.utime(os.path.join(self.cachePath, "second" + Emma.emma_libs.mapfileCache.CACHE_ENTRY_EXTENSION), (time.time() - 10, time.time() - 10))
+        self.assertEqual(mapfileCache.load("first"), value)
+        mapfileCache.store("third", value)
+        self.assertEqual(mapfileCache.load("first"), value)
+        self.assertIsNone(mapfileCache.load("second"))
+        self.assertEqual(mapfileCache.load("third"), value)
+
+    def test_failedStoreLeavesNoTemporaryFiles(self):
+        mapfileCache = Emma.emma_libs.mapfileCache.MapfileCache(self.cachePath)
+        # Values that can not be pickled are not stored
+        mapfileCache.store("unpicklable", lambda: None)
+        self.assertIsNone(mapfileCache.load("unpicklable"))
+        self.assertEqual(os.listdir(self.cachePath), [])
+        # The interruption is passed on, but the temporary file is removed
+        with self.assertRaises(KeyboardInterrupt):
+            mapfileCache.store("interrupted", InterruptedPickling())
+        self.assertEqual(os.listdir(self.cachePath), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import random
+import unittest
+import collections
+
+from pypiscout.SCout_Logger import Logger as sc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.emma_libs.memoryEntry
+import Emma.emma_libs.mapfileProcessor
+
+
+def createMemEntry(addressStart, addressLength, mapfileName="mapfile.map"):
+    """
+    Creates a MemEntry object with the given addresses.
+    :return: The MemEntry object.
+    """
+    compilerSpecificData = collections.OrderedDict()
+    compilerSpecificData["DMA"] = True
+    return Emma.emma_libs.memoryEntry.MemEntry(configID="MCU", mapfileName=mapfileName, addressStart=addressStart, addressLength=addressLength,
+                                               sectionName=".text", objectName="", compilerSpecificData=compilerSpecificData)
+
+
+def referenceMemoryRegion(memEntry, memoryCandidates):
+    """
+    The original linear search for the memory region of an element, the results of fillOutMemoryRegionsAndMemoryTypes() are compared to it.
+    :return: The name of the first memory region that contains the element, None if there is no such region.
+    """
+    for memoryRegion in memoryCandidates:
+        if int(memoryCandidates[memoryRegion][START], 16) <= memEntry.addressStart:
+            if memEntry.addressEnd() is None or (memEntry.addressEnd() <= int(memoryCandidates[memoryRegion][END], 16)):
+                return memoryRegion
+    return None
+
+
+def referenceAddressRangeIndex(addressRanges):
+    """
+    The original construction of the address range index that rescans all the ranges for every start address, the results of createAddressRangeIndex() are compared to it.
+    :return: The index in the format of createAddressRangeIndex().
+    """
+    startAddresses = sorted({rangeStart for rangeStart, _, _ in addressRanges})
+    candidatesPerStartAddress = [[(rangeEnd, payload) for rangeStart, rangeEnd, payload in addressRanges if rangeStart <= startAddress <= rangeEnd] for startAddress in startAddresses]
+    firstPayloadPerStartAddress = [[payload for rangeStart, _, payload in addressRanges if rangeStart <= startAddress][0] for startAddress in startAddresses]
+    return startAddresses, candidatesPerStartAddress, firstPayloadPerStartAddress
+
+
+class CreateAddressRangeIndexTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def test_emptyIndex(self):
+        self.assertEqual(Emma.emma_libs.mapfileProcessor.MapfileProcessor.createAddressRangeIndex([]), ([], [], []))
+
+    def test_overlappingRanges(self):
+        addressRanges = [(0x20, 0x2F, "Inner"), (0x00, 0xFF, "Outer"), (0x20, 0x1F, "Empty"), (0x80, 0x8F, "Late")]
+        self.assertEqual(Emma.emma_libs.mapfileProcessor.MapfileProcessor.createAddressRangeIndex(addressRanges),
+                         ([0x00, 0x20, 0x80], [[(0xFF, "Outer")], [(0x2F, "Inner"), (0xFF, "Outer")], [(0xFF, "Outer"), (0x8F, "Late")]], ["Outer", "Inner", "Inner"]))
+
+    def test_randomRanges(self):
+        random.seed(0)
+        for _ in range(500):
+            addressRanges = []
+            for rangeIndex in range(random.randint(1, 10)):
+                rangeStart = random.randint(0, 100)
+                addressRanges.append((rangeStart, rangeStart + random.randint(-1, 50), "Range" + str(rangeIndex)))
+            self.assertEqual(Emma.emma_libs.mapfileProcessor.MapfileProcessor.createAddressRangeIndex(addressRanges), referenceAddressRangeIndex(addressRanges))
+
+
+class FillOutMemoryRegionsAndMemoryTypesTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        sc()(invVerbosity=4, actionWarning=None, actionError=lambda: sys.exit("error"))
+        self.configuration = {"addressSpaces": {"memory": collections.OrderedDict()}}
+        self.configuration["addressSpaces"]["memory"]["Code"] = {START: "0x0000", END: "0x0FFF", TYPE: "INT_FLASH"}
+        self.configuration["addressSpaces"]["memory"]["Data"] = {START: "0x2000", END: "0x2FFF", TYPE: "INT_RAM"}
+
+    def test_regionsAreFilledOut(self):
+        memEntries = [createMemEntry(0x0000, 0x10), createMemEntry(0x0FF0, 0x10), createMemEntry(0x2000, 0x1000), createMemEntry(0x0800, 0)]
+        Emma.emma_libs.mapfileProcessor.MapfileProcessor.fillOutMemoryRegionsAndMemoryTypes(memEntries, self.configuration, False)
+        self.assertEqual([(memEntry.memTypeTag, memEntry.memType) for memEntry in memEntries],
+                         [("Code", "INT_FLASH"), ("Code", "INT_FLASH"), ("Data", "INT_RAM"), ("Code", "INT_FLASH")])
+
+    def test_elementsWithoutRegion(self):
+        memEntries = [createMemEntry(0x0FF0, 0x20), createMemEntry(0x1000, 0x10), createMemEntry(0x2000, 0x10)]
+        Emma.emma_libs.mapfileProcessor.MapfileProcessor.fillOutMemoryRegionsAndMemoryTypes(memEntries, self.configuration, False)
+        self.assertEqual([memEntry.memTypeTag for memEntry in memEntries], [UNKNOWN_MEM_REGION, UNKNOWN_MEM_REGION, "Data"])
+        Emma.emma_libs.mapfileProcessor.MapfileProcessor.fillOutMemoryRegionsAndMemoryTypes(memEntries, self.configuration, True)
+        self.assertEqual([memEntry.memTypeTag for memEntry in memEntries], ["Data"])
+
+    def test_excludedRegions(self):
+        memEntries = [createMemEntry(0x0000, 0x10, "boot.map"), createMemEntry(0x2000, 0x10, "boot.map"), createMemEntry(0x0000, 0x10, "app.map")]
+        Emma.emma_libs.mapfileProcessor.MapfileProcessor.fillOutMemoryRegionsAndMemoryTypes(memEntries, self.configuration, True, {"boot.map": ["Code"]})
+        self.assertEqual([(memEntry.mapfile, memEntry.memTypeTag) for memEntry in memEntries], [("boot.map", "Data"), ("app.map", "Code")])
+
+    def test_columnarBackend(self):
+        memEntries = [createMemEntry(0x0000, 0x10), createMemEntry(0x0FF0, 0x20), createMemEntry(0x2000, 0x1000), createMemEntry(0x0800, 0), createMemEntry(0x1000, 0)]
+        Emma.emma_libs.mapfileProcessor.MapfileProcessor.fillOutMemoryRegionsAndMemoryTypes(memEntries, self.configuration, False, columnar=True)
+        self.assertEqual([(memEntry.memTypeTag, memEntry.memType) for memEntry in memEntries],
+                         [("Code", "INT_FLASH"), (UNKNOWN_MEM_REGION, UNKNOWN_MEM_TYPE), ("Data", "INT_RAM"), ("Code", "INT_FLASH"), ("Code", "INT_FLASH")])
+
+    def test_overlappingRegions(self):
+        random.seed(0)
+        for _ in range(200):
+            memoryCandidates = collections.OrderedDict()
+            for regionIndex in range(random.randint(1, 6)):
+                regionStart = random.randint(0, 100)
+                memoryCandidates["Region" + str(regionIndex)] = {START: hex(regionStart), END: hex(regionStart + random.randint(0, 50)), TYPE: "INT_RAM"}
+            configuration = {"addressSpaces": {"memory": memoryCandidates}}
+            memEntries = [createMemEntry(random.randint(0, 160), random.choice([0, random.randint(1, 30)])) for _ in range(50)]
+            expectedRegions = [UNKNOWN_MEM_REGION if region is None else region for region in (referenceMemoryRegion(memEntry, memoryCandidates) for memEntry in memEntries)]
+            Emma.emma_libs.mapfileProcessor.MapfileProcessor.fillOutMemoryRegionsAndMemoryTypes(memEntries, configuration, False)
+            self.assertEqual([memEntry.memTypeTag for memEntry in memEntries], expectedRegions)
+            Emma.emma_libs.mapfileProcessor.MapfileProcessor.fillOutMemoryRegionsAndMemoryTypes(memEntries, configuration, False, columnar=True)
+            self.assertEqual([memEntry.memTypeTag for memEntry in memEntries], expectedRegions)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import unittest
+import collections
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.emma_libs.memoryEntry
+import Emma.emma_libs.memoryColumns
+
+
+def createMemEntry(addressStart, addressLength):
+    """
+    Creates a MemEntry object with the given addresses.
+    :return: The MemEntry object.
+    """
+    compilerSpecificData = collections.OrderedDict()
+    compilerSpecificData["DMA"] = True
+    return Emma.emma_libs.memoryEntry.MemEntry(configID="MCU", mapfileName="mapfile.map", addressStart=addressStart, addressLength=addressLength,
+                                               sectionName=".text", objectName="", compilerSpecificData=compilerSpecificData)
+
+
+class MemoryColumnsTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def test_AddressColumns(self):
+        columns = Emma.emma_libs.memoryColumns.AddressColumns([createMemEntry(0x10, 0x20), createMemEntry(0x100, 0)])
+        self.assertEqual(columns.addressStart.tolist(), [0x10, 0x100])
+        self.assertEqual(columns.addressLength.tolist(), [0x20, 0])
+        self.assertEqual(columns.addressEndExclusive().tolist(), [0x30, 0x100])
+        with self.assertRaises(OverflowError):
+            Emma.emma_libs.memoryColumns.AddressColumns([createMemEntry(2 ** 64, 0x10)])
+
+    def test_findMemoryRegions(self):
+        memoryCandidates = collections.OrderedDict()
+        memoryCandidates["Code"] = {START: "0x0000", END: "0x0FFF", TYPE: "INT_FLASH"}
+        memoryCandidates["Data"] = {START: "0x0800", END: "0x2FFF", TYPE: "INT_RAM"}
+        consumerCollection = [createMemEntry(0x0000, 0x10), createMemEntry(0x0FF0, 0x20), createMemEntry(0x0900, 0), createMemEntry(0x2FF0, 0x20)]
+        self.assertEqual(Emma.emma_libs.memoryColumns.findMemoryRegions(consumerCollection, memoryCandidates), ["Code", "Data", "Code", None])
+        self.assertEqual(Emma.emma_libs.memoryColumns.findMemoryRegions([], memoryCandidates), [])
+
+    def test_findInteractingGroups(self):
+        consumerCollection = [createMemEntry(0x00, 0x10), createMemEntry(0x10, 0x10), createMemEntry(0x18, 0x10), createMemEntry(0x20, 0),
+                              createMemEntry(0x30, 0), createMemEntry(0x30, 0x10), createMemEntry(0x50, 0x20), createMemEntry(0x50, 0x20)]
+        self.assertEqual(Emma.emma_libs.memoryColumns.findInteractingGroups(consumerCollection), [(1, 4), (6, 8)])
+        self.assertEqual(Emma.emma_libs.memoryColumns.findInteractingGroups(consumerCollection[:1]), [])
+        self.assertEqual(Emma.emma_libs.memoryColumns.findInteractingGroups([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
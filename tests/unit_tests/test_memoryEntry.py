@@ -18,6 +18,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 
 import os
 import sys
+import copy
 import unittest
 import collections
 
@@ -27,6 +28,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 # pylint: disable=wrong-import-position
 # Rationale: This module needs to access modules that are above them in the folder structure.
 
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.emma_libs.memoryEntry
 
 
@@ -192,6 +194,29 @@ class MemEntryTestCase(unittest.TestCase, TestData):
         self.assertTrue(self.actionErrorWasCalled)
         self.assertIsNone(otherMemEntry.compilerSpecificData)
 
+    def test_compactRepresentation(self):
+        # The attributes are stored in slots, so no new attributes can be added
+        self.assertFalse(hasattr(self.basicMemEntry, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.basicMemEntry.notExistingAttribute = None
+        # The names are interned, so equal names share the same string object
+        otherMemEntry = Emma.emma_libs.memoryEntry.MemEntry(configID="".join(["M", "CU"]), mapfileName=self.mapfileName, addressStart=self.addressStart, addressLength=self.addressLength,
+                                                            sectionName="".join(["Section", "Name"]), objectName="".join(["Object", "Name"]), compilerSpecificData=self.compilerSpecificData)
+        self.assertIs(otherMemEntry.configID, self.basicMemEntry.configID)
+        self.assertIs(otherMemEntry.sectionName, self.basicMemEntry.sectionName)
+        self.assertIs(otherMemEntry.objectName, self.basicMemEntry.objectName)
+
+    def test___copy__(self):
+        memEntryCopy = copy.copy(self.basicMemEntry)
+        self.assertIsNot(memEntryCopy, self.basicMemEntry)
+        for attribute in Emma.emma_libs.memoryEntry.MemEntry.__slots__:
+            self.assertIs(getattr(memEntryCopy, attribute), getattr(self.basicMemEntry, attribute))
+        # Changing the copy does not change the original object
+        memEntryCopy.objectName = OBJECTS_IN_SECTIONS_SECTION_RESERVE
+        memEntryCopy.setAddressesGivenLength(0x10)
+        self.assertEqual(self.basicMemEntry.objectName, self.objectName)
+        self.assertEqual(self.basicMemEntry.addressLength, self.addressLength)
+
     def test_equalConfigID(self):
         otherMemEntry = Emma.emma_libs.memoryEntry.MemEntry(configID=self.configID, mapfileName=self.mapfileName,
                                                        addressStart=self.addressStart, addressLength=None, addressEnd=self.addressEnd,
@@ -19,14 +19,20 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 
 import os
 import sys
+import tempfile
 import collections
 import unittest
+import importlib.util
+
+import pandas
+import pandas.testing
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 # pylint: disable=wrong-import-position
 # Rationale: This module needs to access modules that are above them in the folder structure.
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.shared_libs.emma_helper
 import Emma.emma_libs.memoryEntry
 import Emma.emma_libs.memoryMap
 
@@ -940,5 +946,121 @@ class CalculateObjectsInSectionsTestCase(unittest.TestCase):
         self.checkSectionReserve(objectsInSections[13], sectionContainer[3], FOURTH_SECTION_ADDRESS_START, FOURTH_SECTION_ADDRESS_END)
 
 
+    def test_multipleSectionsWithContainedSectionAndMultipleObjects(self):
+        """
+        S  |----------|
+        S      |--|
+        O  |-|   |-|
+        """
+        # Creating the sections and objects for the test
+        FIRST_SECTION_ADDRESS_START = 0x0100
+        FIRST_SECTION_ADDRESS_END = 0x04FF
+        SECOND_SECTION_ADDRESS_START = 0x0200
+        SECOND_SECTION_ADDRESS_END = 0x02FF
+        FIRST_OBJECT_ADDRESS_START = 0x0100
+        FIRST_OBJECT_ADDRESS_END = 0x017F
+        SECOND_OBJECT_ADDRESS_START = 0x0300
+        SECOND_OBJECT_ADDRESS_END = 0x037F
+        sectionContainer, objectContainer = createMemEntryObjects([MemEntryData(FIRST_SECTION_ADDRESS_START, FIRST_SECTION_ADDRESS_END),
+                                                                   MemEntryData(SECOND_SECTION_ADDRESS_START, SECOND_SECTION_ADDRESS_END)],
+                                                                  [MemEntryData(FIRST_OBJECT_ADDRESS_START, FIRST_OBJECT_ADDRESS_END),
+                                                                   MemEntryData(SECOND_OBJECT_ADDRESS_START, SECOND_OBJECT_ADDRESS_END)])
+        # Editing the sections: switching the containmentFlag of the second section on
+        sectionContainer[1].containmentFlag = True
+        # Calculating the objectsInSections list
+        objectsInSections = Emma.emma_libs.memoryMap.calculateObjectsInSections(sectionContainer, objectContainer)
+
+        # Check the number of created elements: firstSectionEntry + firstObject + firstSectionReserve +
+        #                                       secondObject + firstSectionReserve +
+        #                                       secondSectionEntry
+        # The objects are placed in address order, even though the entry of the contained section follows the reserves of the first section
+        self.assertEqual(len(objectsInSections), 6)
+        # Check whether the firstSectionEntry was created properly
+        self.checkSectionEntry(objectsInSections[0], sectionContainer[0])
+        # Check whether the firstObject was created properly
+        self.assertEqualObjects(objectsInSections[1], objectContainer[0])
+        # Check whether the firstSectionReserve was created properly
+        self.checkSectionReserve(objectsInSections[2], sectionContainer[0], (FIRST_OBJECT_ADDRESS_END + 1), (SECOND_OBJECT_ADDRESS_START - 1))
+        # Check whether the secondObject was created properly
+        self.assertEqualObjects(objectsInSections[3], objectContainer[1])
+        # Check whether the firstSectionReserve was created properly
+        self.checkSectionReserve(objectsInSections[4], sectionContainer[0], (SECOND_OBJECT_ADDRESS_END + 1), FIRST_SECTION_ADDRESS_END)
+        # Check whether the secondSectionEntry was created properly
+        self.checkSectionEntry(objectsInSections[5], sectionContainer[1])
+
+
+class WriteReportToDiskTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        sectionContainer, objectContainer = createMemEntryObjects([MemEntryData(0x1000, 0x1FFF, section=".text"),
+                                                                   MemEntryData(0x2000, None, section=".bss;zero")],
+                                                                  [MemEntryData(0x1000, 0x10FF, section=".text", moduleName="main.o")])
+        # A duplicate with zero length does not have addresses in the report
+        sectionContainer[1].duplicateFlag = "MCU::mapfile.map::.text"
+        # An object with an additional compiler specific data column
+        objectContainer[0].compilerSpecificData["extra"] = "value"
+        self.consumerCollection = sectionContainer + objectContainer + Emma.emma_libs.memoryMap.calculateObjectsInSections(sectionContainer[:1], [])[:1]
+
+    def test_collectCompilerSpecificHeaders(self):
+        self.assertEqual(Emma.emma_libs.memoryMap.collectCompilerSpecificHeaders(self.consumerCollection), ["DMA", "vasName", "vasSectionName", "extra"])
+
+    @staticmethod
+    def writeReport(consumerCollection):
+        with tempfile.TemporaryDirectory() as outputPath:
+            reportPath = os.path.join(outputPath, "report.csv")
+            Emma.emma_libs.memoryMap.writeReportToDisk(reportPath, consumerCollection)
+            with open(reportPath, "r") as fp:
+                lines = fp.read().splitlines()
+        return lines
+
+    def test_writeReportToDisk(self):
+        lines = self.writeReport(self.consumerCollection)
+        self.assertEqual(lines, [
+            ";".join([ADDR_START_HEX, ADDR_END_HEX, SIZE_HEX, ADDR_START_DEC, ADDR_END_DEC, SIZE_DEC, SIZE_HUMAN_READABLE, SECTION_NAME, OBJECT_NAME, CONFIG_ID, "DMA", "vasName", "vasSectionName", "extra",
+                      MEM_TYPE, MEM_TYPE_TAG, CATEGORY, MAPFILE, OVERLAP_FLAG, CONTAINMENT_FLAG, DUPLICATE_FLAG, CONTAINING_OTHERS_FLAG, ADDR_START_HEX_ORIGINAL, ADDR_END_HEX_ORIGINAL, SIZE_HEX_ORIGINAL, SIZE_DEC_ORIGINAL, FQN]),
+            "0x1000;0x1fff;0x1000;4096;8191;4096; 4.00 KiB;.text;;MCU;True;;;;INT_FLASH;;<Unspecified>;mapfile.map;;;;;;;;;MCU::mapfile.map::.text",
+            ";;0x0;;;0; 0.00 B;\".bss;zero\";;MCU;True;;;;INT_FLASH;;<Unspecified>;mapfile.map;;;MCU::mapfile.map::.text;;0x2000;;0x0;0;\"MCU::mapfile.map::.bss;zero\"",
+            "0x1000;0x10ff;0x100;4096;4351;256; 256.00 B;.text;main.o;MCU;True;;;value;INT_FLASH;;<Unspecified>;mapfile.map;;;;;;;;;MCU::mapfile.map::.text::main.o",
+            ";;;;;;;.text;<Emma_SectionEntry>;MCU;True;;;;INT_FLASH;;<Unspecified>;mapfile.map;;;;;0x1000;0x1fff;0x1000;4096;MCU::mapfile.map::.text"
+        ])
+
+    @staticmethod
+    def columnValues(reportData, column):
+        return [None if pandas.isna(value) else value for value in reportData[column]]
+
+    def test_createReportDataFrame(self):
+        reportData = Emma.emma_libs.memoryMap.createReportDataFrame(self.consumerCollection)
+        # The columns are the same as in the CSV reports
+        self.assertEqual(";".join(reportData.columns), self.writeReport(self.consumerCollection)[0])
+        # The decimal values are integers, the empty cells of the CSV reports are missing values
+        self.assertEqual(str(reportData[ADDR_START_DEC].dtype), "Int64")
+        self.assertEqual(self.columnValues(reportData, ADDR_START_DEC), [0x1000, None, 0x1000, None])
+        self.assertEqual(self.columnValues(reportData, SIZE_DEC), [0x1000, 0, 0x100, None])
+        self.assertEqual(self.columnValues(reportData, ADDR_START_HEX), ["0x1000", None, "0x1000", None])
+        self.assertEqual(self.columnValues(reportData, "extra"), [None, None, "value", None])
+        self.assertEqual(self.columnValues(reportData, DUPLICATE_FLAG), [None, "MCU::mapfile.map::.text", None, None])
+        self.assertEqual(self.columnValues(reportData, FQN), ["MCU::mapfile.map::.text", "MCU::mapfile.map::.bss;zero", "MCU::mapfile.map::.text::main.o", "MCU::mapfile.map::.text"])
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "The typed report formats need pyarrow")
+    def test_writeTypedReportToDisk(self):
+        # The reports are read with categorical columns for the repeated values (see emma_helper.readReport())
+        expectedReportData = Emma.emma_libs.memoryMap.createReportDataFrame(self.consumerCollection)
+        expectedReportData = expectedReportData.astype({column: "category" for column in REPORT_CATEGORY_COLUMNS}).set_index(ADDR_START_DEC)
+        with tempfile.TemporaryDirectory() as outputPath:
+            for reportFormat in [REPORT_FORMAT_PARQUET, REPORT_FORMAT_FEATHER]:
+                reportPath = os.path.join(outputPath, "report." + reportFormat)
+                Emma.emma_libs.memoryMap.writeTypedReportToDisk(reportPath, self.consumerCollection, reportFormat)
+                pandas.testing.assert_frame_equal(Emma.shared_libs.emma_helper.readReport(reportPath), expectedReportData)
+
+    def test_writeReportToDiskWithoutQuoting(self):
+        # Without the values that need quoting the rows are not written by the csv module, but the result shall be the same
+        lines = self.writeReport(self.consumerCollection)
+        del lines[2]
+        del self.consumerCollection[1]
+        self.assertEqual(self.writeReport(self.consumerCollection), lines)
+
+
 if __name__ == "__main__":
     unittest.main()